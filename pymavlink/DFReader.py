@@ -8,9 +8,16 @@ Released under GNU GPL version 3 or later
 Partly based on SDLog2Parser by Anton Babushkin
 '''
 
-import struct, time, os
+import struct, time, os, sys, mmap, array, bisect, json, keyword, re
 from . import mavutil
 
+if sys.version_info[0] >= 3:
+    long = int
+    # array type code for the 64 bit offsets in a log index
+    INDEX_OFFSET_TYPECODE = 'Q'
+else:
+    INDEX_OFFSET_TYPECODE = 'L'
+
 FORMAT_TO_STRUCT = {
     "b": ("b", None, int),
     "B": ("B", None, int),
@@ -33,6 +40,26 @@ FORMAT_TO_STRUCT = {
     "Q": ("Q", None, long),
     }
 
+# numpy types for the struct formats above, for DFReader_binary.columns()
+STRUCT_TO_NUMPY = {
+    "b": "i1",
+    "B": "u1",
+    "h": "<i2",
+    "H": "<u2",
+    "i": "<i4",
+    "I": "<u4",
+    "f": "<f4",
+    "d": "<f8",
+    "q": "<i8",
+    "Q": "<u8",
+    "4s": "S4",
+    "16s": "S16",
+    "64s": "S64",
+    }
+
+# column names that can be used as attribute names in generated code
+re_identifier = re.compile('^[A-Za-z_][A-Za-z0-9_]*$')
+
 class DFFormat(object):
     def __init__(self, type, name, flen, format, columns):
         self.type = type
@@ -59,23 +86,81 @@ class DFFormat(object):
                 raise Exception("Unsupported format char: '%s' in message %s" % (c, name))
 
         self.msg_struct = msg_struct
+        self.unpacker = struct.Struct(msg_struct)
         self.msg_types = msg_types
         self.msg_mults = msg_mults
         self.colhash = {}
         for i in range(len(self.columns)):
             self.colhash[self.columns[i]] = i
+        self.message_class = self._message_class()
 
     def __str__(self):
         return "DFFormat(%s,%s,%s,%s)" % (self.type, self.name, self.format, self.columns)
 
+    def _field_expression(self, i, apply_multiplier):
+        '''python expression giving the value of column i from the
+        elements e, as DFMessage.__getattr__ would calculate it'''
+        v = "e[%u]" % i
+        type = self.msg_types[i]
+        mul = self.msg_mults[i]
+        if type == str:
+            return "null_term(%s)" % v
+        if apply_multiplier:
+            if mul is not None:
+                # struct gives us a number already, so no need to convert
+                return "%s*%r" % (v, mul)
+            if type in (int, float):
+                return v
+        elif self.format[i] == 'M':
+            return v
+        return "%s(%s)" % (type.__name__, v)
+
+    def _message_class(self):
+        '''create a DFMessage subclass for this format, with a slot for
+        each column. The generated __init__ converts and scales all the
+        elements when a message is created, so reading a field is a
+        plain attribute lookup. Columns that can't be slots are kept
+        in a per-instance __dict__ instead, and columns that clash with
+        DFMessage attributes are left to DFMessage.__getattr__'''
+        slots = []
+        lines = { True : [], False : [] }
+        for name in self.columns:
+            i = self.colhash[name]
+            if i >= len(self.msg_types) or hasattr(DFMessage, name) or name in slots:
+                continue
+            if re_identifier.match(name) and not keyword.iskeyword(name):
+                slots.append(name)
+                target = "self.%s" % name
+            else:
+                if not '__dict__' in slots:
+                    slots.append('__dict__')
+                target = "self.__dict__[%r]" % name
+            for apply_multiplier in lines:
+                lines[apply_multiplier].append("        %s = %s\n" % (target, self._field_expression(i, apply_multiplier)))
+        src = ("def __init__(self, fmt, e, apply_multiplier):\n"
+               "    DFMessage.__init__(self, fmt, e, apply_multiplier)\n"
+               "    if apply_multiplier:\n" + "".join(lines[True]) + "        pass\n"
+               "    else:\n" + "".join(lines[False]) + "        pass\n")
+        namespace = { 'DFMessage' : DFMessage, 'null_term' : null_term, 'long' : long }
+        exec(compile(src, "<DFMessage %s>" % self.name, "exec"), namespace)
+        return type(str("DFMessage_%s" % self.name), (DFMessage,),
+                    { '__slots__' : tuple(slots), '__init__' : namespace['__init__'] })
+
 def null_term(str):
     '''null terminate a string'''
+    if sys.version_info[0] >= 3 and isinstance(str, bytes):
+        str = str.decode('ascii', 'replace')
     idx = str.find("\0")
     if idx != -1:
         str = str[:idx]
     return str
 
 class DFMessage(object):
+    '''a message from a DataFlash log. Each DFFormat makes a subclass of
+    this with the fields filled in when the message is created; fields
+    not handled there are calculated by __getattr__'''
+    __slots__ = ('fmt', '_elements', '_apply_multiplier', '_fieldnames', '_timestamp')
+
     def __init__(self, fmt, elements, apply_multiplier):
         self.fmt = fmt
         self._elements = elements
@@ -86,7 +171,7 @@ class DFMessage(object):
         d = {'mavpackettype': self.fmt.name}
 
         for field in self._fieldnames:
-            d[field] = self.__getattr__(field)
+            d[field] = getattr(self, field)
 
         return d
 
@@ -97,10 +182,10 @@ class DFMessage(object):
         except Exception:
             raise AttributeError(field)
         v = self._elements[i]
-        if self.fmt.format[i] != 'M' or self._apply_multiplier:
-            v = self.fmt.msg_types[i](v)
         if self.fmt.msg_types[i] == str:
             v = null_term(v)
+        elif self.fmt.format[i] != 'M' or self._apply_multiplier:
+            v = self.fmt.msg_types[i](v)
         if self.fmt.msg_mults[i] is not None and self._apply_multiplier:
             v *= self.fmt.msg_mults[i]
         return v
@@ -112,7 +197,7 @@ class DFMessage(object):
         ret = "%s {" % self.fmt.name
         col_count = 0
         for c in self.fmt.columns:
-            ret += "%s : %s, " % (c, self.__getattr__(c))
+            ret += "%s : %s, " % (c, getattr(self, c))
             col_count += 1
         if col_count != 0:
             ret = ret[:-2]
@@ -128,7 +213,7 @@ class DFMessage(object):
             name = self.fmt.columns[i]
             if name == 'Mode' and 'ModeNum' in self.fmt.columns:
                 name = 'ModeNum'
-            v = self.__getattr__(name)
+            v = getattr(self, name)
             if mul is not None:
                 v /= mul
             values.append(v)
@@ -155,6 +240,16 @@ class DFReaderClock():
     def message_arrived(self, m):
         pass
 
+    def message_type_arrived(self, type):
+        '''a message of the given type was skipped without being decoded'''
+        pass
+
+    def timestamped_format(self, fmt):
+        '''return True if messages of this format get their timestamp
+        from their own fields, so they can be read without the messages
+        before them'''
+        return False
+
     def rewind_event(self):
         pass
 
@@ -199,6 +294,11 @@ class DFReaderClock_usec(DFReaderClock):
             m._timestamp = self.timestamp
         self.timestamp = m._timestamp
 
+    def timestamped_format(self, fmt):
+        # TimeMS stamps are only used if they don't go backwards, so
+        # they depend on the messages before them
+        return len(fmt.columns) > 0 and fmt.columns[0] == 'TimeUS'
+
 class DFReaderClock_msec(DFReaderClock):
     '''DFReaderClock_msec - a format where many messages have TimeMS in their formats, and GPS messages have a "T" field giving msecs '''
     def find_time_base(self, gps, first_ms_stamp):
@@ -216,6 +316,11 @@ class DFReaderClock_msec(DFReaderClock):
             m._timestamp = self.timestamp
         self.timestamp = m._timestamp
 
+    def timestamped_format(self, fmt):
+        if fmt.name in ['GPS','GPS2']:
+            return True
+        return len(fmt.columns) > 0 and fmt.columns[0] == 'TimeMS'
+
 class DFReaderClock_px4(DFReaderClock):
     '''DFReaderClock_px4 - a format where a starting time is explicitly given in a message'''
     def __init__(self):
@@ -233,6 +338,10 @@ class DFReaderClock_px4(DFReaderClock):
     def set_message_timestamp(self, m):
         m._timestamp = self.timebase + self.px4_timebase
 
+    def timestamped_format(self, fmt):
+        # the TIME messages setting the timebase are always read
+        return True
+
     def message_arrived(self, m):
         type = m.get_type()
         if type == 'TIME' and 'StartTime' in m._fieldnames:
@@ -253,6 +362,12 @@ class DFReaderClock_gps_interpolated(DFReaderClock):
 
     def message_arrived(self, m):
         type = m.get_type()
+        self.message_type_arrived(type)
+        if type == 'GPS' or type == 'GPS2':
+            self.gps_message_arrived(m)
+
+    def message_type_arrived(self, type):
+        '''count a message of the given type'''
         if not type in self.counts:
             self.counts[type] = 1
         else:
@@ -264,9 +379,6 @@ class DFReaderClock_gps_interpolated(DFReaderClock):
         else:
             self.counts_since_gps[type] += 1
 
-        if type == 'GPS' or type == 'GPS2':
-            self.gps_message_arrived(m)
-
     def gps_message_arrived(self, m):
         '''adjust time base from GPS message'''
         # msec-style GPS message?
@@ -358,11 +470,7 @@ class DFReader(object):
         first_ms_stamp = None
 
         have_good_clock = False
-        while True:
-            m = self.recv_msg()
-            if m is None:
-                break;
-
+        for m in self._clock_messages():
             type = m.get_type()
 
             if first_us_stamp is None:
@@ -430,6 +538,28 @@ class DFReader(object):
 
         return
 
+    def _clock_messages(self):
+        '''the messages init_clock() looks at to work out the time basis'''
+        while True:
+            m = self.recv_msg()
+            if m is None:
+                return
+            yield m
+
+    def _clock_state(self):
+        '''the clock as a dictionary that can be saved as JSON'''
+        return { 'class' : self.clock.__class__.__name__,
+                 'vars' : dict(self.clock.__dict__) }
+
+    def _restore_clock(self, state):
+        '''recreate a clock saved with _clock_state()'''
+        clocks = {}
+        for c in [DFReaderClock_usec, DFReaderClock_msec, DFReaderClock_px4, DFReaderClock_gps_interpolated]:
+            clocks[c.__name__] = c
+        clock = clocks[state['class']]()
+        clock.__dict__.update(state['vars'])
+        self.clock = clock
+
     def _set_time(self, m):
         '''set time for a message'''
         # really just left here for profiling
@@ -498,24 +628,101 @@ class DFReader(object):
             return default
         return self.params[name]
 
+# messages that recv_match() reads from an index whatever type it is asked for
+INDEX_STATE_TYPES = ['FMT', 'PARM', 'MSG', 'MODE', 'STAT', 'TIME']
+
 class DFReader_binary(DFReader):
     '''parse a binary dataflash file'''
-    def __init__(self, filename, zero_time_base=False):
+    def __init__(self, filename, zero_time_base=False, use_cache=False):
         DFReader.__init__(self)
-        # read the whole file into memory for simplicity
-        f = open(filename, mode='rb')
-        self.data = f.read()
-        self.data_len = len(self.data)
-        f.close()
+        self.filename = filename
+        self.clock_state = None
+        self.cached_clock_state = None
+        self.index_offsets = None
+        self.index_types = None
+        self.index_selections = {}
+        # map the file rather than reading it, so memory use doesn't
+        # grow with the size of the log
+        self.filehandle = open(filename, mode='rb')
+        self.data_len = os.fstat(self.filehandle.fileno()).st_size
+        if self.data_len > 0:
+            self.data_map = mmap.mmap(self.filehandle.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self.data_map = b''
+        if sys.version_info[0] >= 3:
+            self.data = memoryview(self.data_map)
+        else:
+            self.data = self.data_map
         self.HEAD1 = 0xA3
         self.HEAD2 = 0x95
+        self.head = struct.pack('BB', self.HEAD1, self.HEAD2)
         self.formats = {
             0x80 : DFFormat(0x80, 'FMT', 89, 'BBnNZ', "Type,Length,Name,Format,Columns")
         }
         self._zero_time_base = zero_time_base
-        self.init_clock()
+        # with use_cache the index and clock are kept in a .index file
+        # next to the log, see build_index()
+        if use_cache:
+            self._load_index()
+        if self.cached_clock_state is not None:
+            self._restore_clock(self.cached_clock_state)
+            self.clock_state = self.cached_clock_state
+        else:
+            self.init_clock()
+            if use_cache:
+                if self.index_offsets is None:
+                    self.build_index()
+                self._save_index()
         self._rewind()
 
+    def init_clock(self):
+        '''work out time basis for the log, keeping the result so it can
+        be saved with the index'''
+        DFReader.init_clock(self)
+        self.clock_state = self._clock_state()
+
+    def _clock_messages(self):
+        '''the messages init_clock() looks at. Only the headers of most
+        messages are read, the GPS and TIME messages and the first with
+        TimeUS and TimeMS fields are decoded'''
+        header = struct.Struct('BBB')
+        data = self.data
+        formats = self.formats
+        have_us = False
+        have_ms = False
+        ofs = 0
+        while ofs + 3 <= self.data_len:
+            (h1, h2, msg_type) = header.unpack_from(data, ofs)
+            fmt = None
+            if h1 == self.HEAD1 and h2 == self.HEAD2:
+                fmt = formats.get(msg_type)
+            if fmt is None or fmt.unpacker.size != fmt.len-3:
+                ofs = self.data_map.find(self.head, ofs+1)
+                if ofs == -1:
+                    return
+                continue
+            if ofs + fmt.len > self.data_len:
+                return
+            name = fmt.name
+            want = (name in ['GPS', 'GPS2', 'TIME'] or
+                    (not have_us and 'TimeUS' in fmt.colhash) or
+                    (not have_ms and 'TimeMS' in fmt.colhash))
+            if msg_type == 0x80 or want:
+                elements = list(fmt.unpacker.unpack_from(data, ofs+3))
+                if msg_type == 0x80:
+                    self._add_format(elements)
+            ofs += fmt.len
+            if not want:
+                self.clock.message_type_arrived(name)
+                continue
+            if 'TimeUS' in fmt.colhash:
+                have_us = True
+            if 'TimeMS' in fmt.colhash and not name in ['GPS', 'GPS2']:
+                have_ms = True
+            m = fmt.message_class(fmt, elements, True)
+            self._add_msg(m)
+            yield m
+
     def _rewind(self):
         '''rewind to start of log'''
         DFReader._rewind(self)
@@ -526,20 +733,23 @@ class DFReader_binary(DFReader):
         '''read one message, returning it as an object'''
         if self.data_len - self.offset < 3:
             return None
-            
-        hdr = self.data[self.offset:self.offset+3]
+
+        hdr = struct.unpack_from('BBB', self.data, self.offset)
         skip_bytes = 0
         skip_type = None
-        # skip over bad messages
-        while (ord(hdr[0]) != self.HEAD1 or ord(hdr[1]) != self.HEAD2 or ord(hdr[2]) not in self.formats):
+        # skip over bad messages, jumping to each possible header
+        while (hdr[0] != self.HEAD1 or hdr[1] != self.HEAD2 or hdr[2] not in self.formats):
             if skip_type is None:
-                skip_type = (ord(hdr[0]), ord(hdr[1]), ord(hdr[2]))
-            skip_bytes += 1
-            self.offset += 1
+                skip_type = hdr
+            ofs = self.data_map.find(self.head, self.offset+1)
+            if ofs == -1:
+                ofs = self.data_len
+            skip_bytes += ofs - self.offset
+            self.offset = ofs
             if self.data_len - self.offset < 3:
                 return None
-            hdr = self.data[self.offset:self.offset+3]
-        msg_type = ord(hdr[2])
+            hdr = struct.unpack_from('BBB', self.data, self.offset)
+        msg_type = hdr[2]
         if skip_bytes != 0:
             if self.remaining < 528:
                 return None
@@ -549,20 +759,17 @@ class DFReader_binary(DFReader):
         self.offset += 3
         self.remaining -= 3
 
-        if not msg_type in self.formats:
-            if self.verbose:
-                print("unknown message type %02x" % msg_type)
-            raise Exception("Unknown message type %02x" % msg_type)
         fmt = self.formats[msg_type]
         if self.remaining < fmt.len-3:
             # out of data - can often happen half way through a message
             if self.verbose:
                 print("out of data")
             return None
-        body = self.data[self.offset:self.offset+(fmt.len-3)]
         elements = None
         try:
-            elements = list(struct.unpack(fmt.msg_struct, body))
+            if fmt.unpacker.size != fmt.len-3:
+                raise struct.error("length mismatch")
+            elements = list(fmt.unpacker.unpack_from(self.data, self.offset))
         except Exception:
             if self.remaining < 528:
                 # we can have garbage at the end of an APM2 log
@@ -570,26 +777,257 @@ class DFReader_binary(DFReader):
             # we should also cope with other corruption; logs
             # transfered via DataFlash_MAVLink may have blocks of 0s
             # in them, for example
-            print("Failed to parse %s/%s with len %u (remaining %u)" % (fmt.name, fmt.msg_struct, len(body), self.remaining))
+            print("Failed to parse %s/%s with len %u (remaining %u)" % (fmt.name, fmt.msg_struct, fmt.len-3, self.remaining))
         if elements is None:
             return self._parse_next()
         name = null_term(fmt.name)
         if name == 'FMT':
-            # add to formats
-            # name, len, format, headings
-            self.formats[elements[0]] = DFFormat(elements[0],
-                                                 null_term(elements[2]), elements[1],
-                                                 null_term(elements[3]), null_term(elements[4]))
+            self._add_format(elements)
 
         self.offset += fmt.len-3
         self.remaining -= fmt.len-3
-        m = DFMessage(fmt, elements, True)
+        m = fmt.message_class(fmt, elements, True)
         self._add_msg(m)
 
         self.percent = 100.0 * (self.offset / float(self.data_len))
-        
+
         return m
 
+    def _add_format(self, elements):
+        '''add a format from the elements of a FMT message'''
+        # name, len, format, headings
+        self.formats[elements[0]] = DFFormat(elements[0],
+                                             null_term(elements[2]), elements[1],
+                                             null_term(elements[3]), null_term(elements[4]))
+
+    def build_index(self, use_cache=False):
+        '''find the offset and type of every message in the log, reading
+        only the headers and FMT messages. Once built, recv_match() with
+        a type goes straight to the messages of that type. With use_cache
+        the index is kept in a .index file next to the log, along with
+        the clock found by init_clock(), and is loaded from there while
+        the log is unchanged'''
+        if use_cache and self._load_index():
+            return
+        offsets = array.array(INDEX_OFFSET_TYPECODE)
+        types = array.array('B')
+        header = struct.Struct('BBB')
+        data = self.data
+        formats = self.formats
+        ofs = 0
+        while ofs + 3 <= self.data_len:
+            (h1, h2, msg_type) = header.unpack_from(data, ofs)
+            fmt = None
+            if h1 == self.HEAD1 and h2 == self.HEAD2:
+                fmt = formats.get(msg_type)
+            if fmt is None or fmt.unpacker.size != fmt.len-3:
+                ofs = self.data_map.find(self.head, ofs+1)
+                if ofs == -1:
+                    break
+                continue
+            if ofs + fmt.len > self.data_len:
+                break
+            if msg_type == 0x80:
+                self._add_format(fmt.unpacker.unpack_from(data, ofs+3))
+            offsets.append(ofs)
+            types.append(msg_type)
+            ofs += fmt.len
+        self.index_offsets = offsets
+        self.index_types = types
+        self.index_selections = {}
+        if use_cache:
+            self._save_index()
+
+    def _index_filename(self):
+        return self.filename + '.index'
+
+    def _index_header(self, count):
+        '''the start of an index file, identifying the log it is for'''
+        st = os.stat(self.filename)
+        return struct.pack('<8sBQQQ', b'DFINDEX2', array.array(INDEX_OFFSET_TYPECODE).itemsize,
+                           st.st_size, int(st.st_mtime * 1.0e6), count)
+
+    def _save_index(self):
+        '''write the index to its cache file, if we can'''
+        try:
+            f = open(self._index_filename(), mode='wb')
+            f.write(self._index_header(len(self.index_offsets)))
+            self.index_offsets.tofile(f)
+            self.index_types.tofile(f)
+            if self.clock_state is not None:
+                clock = { 'zero_time_base' : self._zero_time_base,
+                          'clock' : self.clock_state }
+                f.write(json.dumps(clock).encode('utf-8'))
+            f.close()
+        except (IOError, OSError):
+            pass
+
+    def _load_index(self):
+        '''load the index from its cache file, returning False if there
+        isn't one that matches the log'''
+        try:
+            f = open(self._index_filename(), mode='rb')
+        except (IOError, OSError):
+            return False
+        try:
+            hdr = f.read(struct.calcsize('<8sBQQQ'))
+            count = struct.unpack('<8sBQQQ', hdr)[-1]
+            if hdr != self._index_header(count):
+                return False
+            offsets = array.array(INDEX_OFFSET_TYPECODE)
+            types = array.array('B')
+            offsets.fromfile(f, count)
+            types.fromfile(f, count)
+            clock = f.read()
+            if len(clock) != 0:
+                clock = json.loads(clock.decode('utf-8'))
+                if clock['zero_time_base'] == self._zero_time_base:
+                    self.cached_clock_state = clock['clock']
+        except (IOError, OSError, EOFError, struct.error, ValueError, KeyError):
+            return False
+        finally:
+            f.close()
+        # the formats are needed to parse the indexed messages
+        fmt = self.formats[0x80]
+        for i in range(count):
+            if types[i] == 0x80:
+                self._add_format(fmt.unpacker.unpack_from(self.data, offsets[i]+3))
+        self.index_offsets = offsets
+        self.index_types = types
+        self.index_selections = {}
+        return True
+
+    def _index_select(self, type):
+        '''return the sorted offsets of the messages with names in type'''
+        key = tuple(sorted(type))
+        if key in self.index_selections:
+            return self.index_selections[key]
+        ids = [t for t in self.formats if self.formats[t].name in type]
+        try:
+            import numpy
+            types = numpy.frombuffer(self.index_types, dtype=numpy.uint8)
+            offsets = numpy.frombuffer(self.index_offsets, dtype='u%u' % self.index_offsets.itemsize)
+            ret = offsets[numpy.isin(types, ids)].tolist()
+        except ImportError:
+            ids = set(ids)
+            types = self.index_types
+            ret = [o for (o, t) in zip(self.index_offsets, types) if t in ids]
+        self.index_selections[key] = ret
+        return ret
+
+    def _index_usable(self, condition, type):
+        '''see if recv_match() can skip the messages it doesn't want'''
+        if self.index_offsets is None or type is None:
+            return False
+        if self.clock is not None:
+            # messages that take their timestamp from the ones before
+            # them need the sequential scan
+            for fmt in self.formats.values():
+                if fmt.name in type and not self.clock.timestamped_format(fmt):
+                    return False
+        if condition is None:
+            return True
+        msg_types = mavutil.expression_message_types(condition)
+        if msg_types is None:
+            return False
+        for t in msg_types:
+            if not t in type:
+                return False
+        return True
+
+    def recv_match(self, condition=None, type=None, blocking=False):
+        '''recv the next message that matches the given condition
+        type can be a string or a list of strings'''
+        if type is not None and not isinstance(type, list):
+            type = [type]
+        if not self._index_usable(condition, type):
+            return DFReader.recv_match(self, condition, type, blocking)
+        # the state messages are still read, to keep the flight mode,
+        # parameters and clock up to date
+        offsets = self._index_select(type + INDEX_STATE_TYPES)
+        while True:
+            i = bisect.bisect_left(offsets, self.offset)
+            if i >= len(offsets):
+                self.offset = self.data_len
+                self.remaining = 0
+                self.percent = 100.0
+                return None
+            self.offset = offsets[i]
+            self.remaining = self.data_len - self.offset
+            m = self._parse_next()
+            if m is None:
+                return None
+            if not m.get_type() in type:
+                continue
+            if not mavutil.evaluate_condition(condition, self.messages):
+                continue
+            return m
+
+    def columns(self, type, fields=None):
+        '''return the given fields of every message of one type as numpy
+        arrays, in a dictionary indexed by field name, plus a _timestamp
+        array. All fields are returned if fields is None. Multipliers
+        are applied as for DFMessage attributes, and strings are bytes.
+
+        The messages are found with build_index() and decoded all at once
+        with a structured numpy dtype. If the timestamps can't be worked
+        out from the TimeUS or TimeMS fields the log is read through to
+        get them, which leaves it rewound'''
+        import numpy
+        if self.index_offsets is None:
+            self.build_index()
+        fmt = None
+        for t in self.formats:
+            if self.formats[t].name == type:
+                fmt = self.formats[t]
+        if fmt is None:
+            return None
+        if fields is None:
+            fields = fmt.columns
+        offsets = numpy.array(self._index_select([type]), dtype=numpy.int64)
+        dtype = []
+        for i in range(len(fmt.msg_types)):
+            dtype.append(('f%u' % i, STRUCT_TO_NUMPY[FORMAT_TO_STRUCT[fmt.format[i]][0]]))
+        data = numpy.frombuffer(self.data_map, dtype=numpy.uint8)
+        records = mavutil.gather_records(data, offsets + 3, fmt.len - 3).view(numpy.dtype(dtype))[:,0]
+        ret = {}
+        for name in fields:
+            i = fmt.colhash[name]
+            v = records['f%u' % i]
+            if fmt.msg_mults[i] is not None:
+                v = v * fmt.msg_mults[i]
+            ret[name] = v
+        ret['_timestamp'] = self._column_timestamps(fmt, records)
+        return ret
+
+    def _column_timestamps(self, fmt, records):
+        '''timestamps for the records of one type found by columns()'''
+        import numpy
+        clock = self.clock
+        time_field = None
+        scale = None
+        if isinstance(clock, DFReaderClock_usec) and fmt.columns[0] == 'TimeUS':
+            (time_field, scale) = ('TimeUS', 0.000001)
+        elif isinstance(clock, DFReaderClock_msec):
+            if fmt.columns[0] == 'TimeMS':
+                (time_field, scale) = ('TimeMS', 0.001)
+            elif fmt.name in ['GPS', 'GPS2']:
+                (time_field, scale) = ('T', 0.001)
+        if time_field is not None:
+            return clock.timebase + records['f%u' % fmt.colhash[time_field]] * scale
+        # the clock needs to see the other messages
+        ret = numpy.empty(len(records))
+        self._rewind()
+        i = 0
+        while i < len(ret):
+            m = self.recv_match(type=fmt.name)
+            if m is None:
+                break
+            ret[i] = m._timestamp
+            i += 1
+        self._rewind()
+        return ret[:i]
+
 def DFReader_is_text_log(filename):
     '''return True if a file appears to be a valid text log'''
     f = open(filename)
@@ -667,7 +1105,7 @@ class DFReader_text(DFReader):
             self.formats[elements[2]] = DFFormat(int(elements[0]), elements[2], int(elements[1]), elements[3], elements[4])
 
         try:
-            m = DFMessage(fmt, elements, False)
+            m = fmt.message_class(fmt, elements, False)
         except ValueError:
             return self._parse_next()
 
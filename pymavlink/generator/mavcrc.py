@@ -1,5 +1,21 @@
 '''MAVLink X25 CRC code'''
 
+# use the CRC from the mavnative extension if it has been built
+try:
+    from mavnative import x25crc_accumulate as native_accumulate
+except ImportError:
+    native_accumulate = None
+
+def _crc_table():
+    '''build the 256 entry lookup table for the x25 CRC, giving the
+    result of accumulating each byte into a zero CRC'''
+    table = []
+    for b in range(256):
+        tmp = (b ^ (b<<4)) & 0xFF
+        table.append(((tmp<<8) ^ (tmp<<3) ^ (tmp>>4)) & 0xFFFF)
+    return table
+
+crc_table = _crc_table()
 
 class x25crc(object):
     '''x25 CRC - based on checksum.h from mavlink library'''
@@ -13,17 +29,17 @@ class x25crc(object):
 
     def accumulate(self, buf):
         '''add in some more bytes'''
+        if native_accumulate is not None:
+            self.crc = native_accumulate(buf, self.crc)
+            return
         accum = self.crc
+        table = crc_table
         for b in buf:
-            tmp = b ^ (accum & 0xff)
-            tmp = (tmp ^ (tmp<<4)) & 0xFF
-            accum = (accum>>8) ^ (tmp<<8) ^ (tmp<<3) ^ (tmp>>4)
+            accum = (accum>>8) ^ table[(accum ^ b) & 0xFF]
         self.crc = accum
 
     def accumulate_str(self, buf):
         '''add in some more bytes'''
-        accum = self.crc
-        import array
-        bytes = array.array('B')
-        bytes.fromstring(buf)
-        self.accumulate(bytes)
+        if not isinstance(buf, bytes):
+            buf = buf.encode('ascii')
+        self.accumulate(bytearray(buf))
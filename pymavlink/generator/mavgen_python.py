@@ -27,6 +27,7 @@ import struct, array, time, json, os, sys, platform
 from ...generator.mavcrc import x25crc
 
 WIRE_PROTOCOL_VERSION = "${WIRE_PROTOCOL_VERSION}"
+PROTOCOL_MARKER = ${PROTOCOL_MARKER}
 DIALECT = "${DIALECT}"
 
 native_supported = platform.system() != 'Windows' # Not yet supported on other dialects
@@ -56,6 +57,8 @@ MAVLINK_TYPE_DOUBLE   = 10
 
 class MAVLink_header(object):
     '''MAVLink message header'''
+    __slots__ = ('mlen', 'seq', 'srcSystem', 'srcComponent', 'msgId')
+
     def __init__(self, msgId, mlen=0, seq=0, srcSystem=0, srcComponent=0):
         self.mlen = mlen
         self.seq = seq
@@ -67,8 +70,14 @@ class MAVLink_header(object):
         return struct.pack('BBBBBB', ${PROTOCOL_MARKER}, self.mlen, self.seq,
                           self.srcSystem, self.srcComponent, self.msgId)
 
+header_packer = struct.Struct('BBBBBB')
+crc_packer = struct.Struct('<H')
+
 class MAVLink_message(object):
     '''base MAVLink message class'''
+    __slots__ = ('_header', '_payload', '_msgbuf', '_crc', '_fieldnames', '_type',
+                 '_lazy', '_timestamp', '_posted')
+
     def __init__(self, msgId, name):
         self._header     = MAVLink_header(msgId)
         self._payload    = None
@@ -76,6 +85,29 @@ class MAVLink_message(object):
         self._crc        = None
         self._fieldnames = []
         self._type       = name
+        self._lazy       = False
+
+    def __getattr__(self, name):
+        '''fill in the header or fields of a lazily decoded message the
+        first time they are needed'''
+        if name == '_header':
+            msgbuf = self._msgbuf
+            self._header = MAVLink_header(msgbuf[5], msgbuf[1], msgbuf[2], msgbuf[3], msgbuf[4])
+            return self._header
+        if name == '_payload':
+            self._payload = self._msgbuf[6:-2]
+            return self._payload
+        if name.startswith('_') or not self._lazy or not name in self._fieldnames:
+            raise AttributeError(name)
+        m = self._decode_payload(self._msgbuf[6:-2])
+        self._lazy = False
+        for a in self._fieldnames:
+            # keep any fields the caller has already set
+            try:
+                object.__getattribute__(self, a)
+            except AttributeError:
+                setattr(self, a, getattr(m, a))
+        return getattr(self, name)
 
     def get_msgbuf(self):
         if isinstance(self._msgbuf, bytearray):
@@ -163,11 +195,35 @@ class MAVLink_message(object):
         self._msgbuf = self._header.pack() + payload
         crc = x25crc(self._msgbuf[1:])
         if ${crc_extra}: # using CRC extra
-            crc.accumulate_str(struct.pack('B', crc_extra))
+            crc.accumulate([crc_extra])
         self._crc = crc.crc
         self._msgbuf += struct.pack('<H', self._crc)
         return self._msgbuf
 
+    def pack_into(self, mav, buf, offset=0):
+        '''pack the message as a complete frame into the bytearray buf at
+        offset, growing buf if needed. The sequence number and source
+        come from mav. Returns the length of the frame'''
+        # use the class attributes, as a message may have a field called 'id'
+        cls = self.__class__
+        msgId = cls.id
+        mlen = cls.unpacker.size
+        end = offset + mlen + 8
+        if len(buf) < end:
+            buf.extend(bytearray(end - len(buf)))
+        header_packer.pack_into(buf, offset, ${PROTOCOL_MARKER}, mlen, mav.seq,
+                                mav.srcSystem, mav.srcComponent, msgId)
+        self._pack_payload_into(buf, offset+6)
+        crc = x25crc(buf[offset+1:end-2])
+        if ${crc_extra}: # using CRC extra
+            crc.accumulate([cls.crc_extra])
+        crc_packer.pack_into(buf, end-2, crc.crc)
+        self._msgbuf = buf[offset:end]
+        self._payload = self._msgbuf[6:-2]
+        self._header = MAVLink_header(msgId, mlen, mav.seq, mav.srcSystem, mav.srcComponent)
+        self._crc = crc.crc
+        return end - offset
+
 """, {'FILELIST' : ",".join(args),
       'PROTOCOL_MARKER' : xml.protocol_marker,
       'DIALECT' : os.path.splitext(os.path.basename(basename))[0],
@@ -222,18 +278,23 @@ class %s(MAVLink_message):
         '''
 %s
         '''
+        __slots__ = (%s)
         id = MAVLINK_MSG_ID_%s
         name = '%s'
         fieldnames = [%s]
         ordered_fieldnames = [ %s ]
         format = '%s'
+        unpacker = struct.Struct(format)
         native_format = bytearray('%s', 'ascii')
         orders = %s
         lengths = %s
         array_lengths = %s
         crc_extra = %s
+        numpy_dtype = %s
+        decode_lazily = %s
 
-        def __init__(self""" % (classname, wrapper.fill(m.description.strip()), 
+        def __init__(self""" % (classname, wrapper.fill(m.description.strip()),
+            slots_str(m),
             m.name.upper(), 
             m.name.upper(),
             fieldname_str,
@@ -243,7 +304,9 @@ class %s(MAVLink_message):
             m.order_map,
             m.len_map,
             m.array_len_map,
-            m.crc_extra))
+            m.crc_extra,
+            numpy_dtype_str(m),
+            not has_class_attribute_field(m)))
         if len(m.fields) != 0:
                 outf.write(", " + ", ".join(m.fieldnames))
         outf.write("):\n")
@@ -261,6 +324,117 @@ class %s(MAVLink_message):
                 else:
                         outf.write(", self.{0:s}".format(field.name))
         outf.write("))\n")
+        outf.write("""
+        def _pack_payload_into(self, buf, offset):
+                self.unpacker.pack_into(buf, offset%s)
+""" % pack_into_args(m))
+        outf.write("""
+        @classmethod
+        def _decode_payload(cls, payload):
+                t = cls.unpacker.unpack(payload)
+                return cls(%s)
+""" % ", ".join(decode_args(m)))
+
+
+def pack_into_args(m):
+    '''work out the arguments to pack the fields of a message in wire
+    order. Arrays are flattened into a single tuple that is passed with
+    *, as long arrays would take the call over the 255 argument limit
+    of older versions of python'''
+    if not [f for f in m.ordered_fields if f.type != 'char' and f.array_length > 1]:
+        return "".join([", self.%s" % f.name for f in m.ordered_fields])
+    parts = []
+    scalars = []
+    for f in m.ordered_fields:
+        if f.type != 'char' and f.array_length > 1:
+            if scalars:
+                parts.append("(%s,)" % ", ".join(scalars))
+                scalars = []
+            parts.append("tuple(self.%s[:%u])" % (f.name, f.array_length))
+        else:
+            scalars.append("self.%s" % f.name)
+    if scalars:
+        parts.append("(%s,)" % ", ".join(scalars))
+    return ", *(%s)" % " + ".join(parts)
+
+# class attributes of generated message classes, which can't also be slots
+class_attributes = ['id', 'name', 'fieldnames', 'ordered_fieldnames', 'format', 'unpacker',
+                    'native_format', 'orders', 'lengths', 'array_lengths', 'crc_extra',
+                    'numpy_dtype', 'decode_lazily']
+
+def has_class_attribute_field(m):
+    '''see if a message has a field with the same name as a class
+    attribute. A lazily decoded message would find the class attribute
+    instead of the field, so these messages are always decoded in full'''
+    for f in m.fieldnames:
+        if f in class_attributes:
+            return True
+    return False
+
+def slots_str(m):
+    '''work out the __slots__ for a message class. Fields that clash with
+    a class attribute (such as a field called 'name') are stored in a
+    per-instance __dict__ instead'''
+    slots = []
+    for f in m.fieldnames:
+        if f in class_attributes:
+            if not '__dict__' in slots:
+                slots.append('__dict__')
+        else:
+            slots.append(f)
+    return "".join(map(lambda s: "'%s', " % s, slots))
+
+# numpy type codes for each MAVLink type, without the byte order
+numpy_types = {
+    'float'    : 'f4',
+    'double'   : 'f8',
+    'int8_t'   : 'i1',
+    'uint8_t'  : 'u1',
+    'int16_t'  : 'i2',
+    'uint16_t' : 'u2',
+    'int32_t'  : 'i4',
+    'uint32_t' : 'u4',
+    'int64_t'  : 'i8',
+    'uint64_t' : 'u8',
+    }
+
+def numpy_dtype_str(m):
+    '''work out a numpy dtype description for the payload of a message,
+    with the fields in wire order. Strings are fixed length byte strings'''
+    order = m.fmtstr[0]
+    ret = []
+    for f in m.ordered_fields:
+        if f.type == 'char':
+            ret.append("('%s', 'S%u')" % (f.name, max(f.array_length, 1)))
+        elif f.array_length > 1:
+            ret.append("('%s', '%s%s', (%u,))" % (f.name, order, numpy_types[f.type], f.array_length))
+        else:
+            ret.append("('%s', '%s%s')" % (f.name, order, numpy_types[f.type]))
+    return "[" + ", ".join(ret) + "]"
+
+def decode_args(m):
+    '''work out the constructor arguments for a message from the tuple
+    returned by unpacking its payload. The tuple is in wire order with
+    arrays flattened, while the constructor takes fields in XML order'''
+    slots = {}
+    idx = 0
+    for f in m.ordered_fields:
+        if f.type == 'char' or f.array_length <= 1:
+            n = 1
+        else:
+            n = f.array_length
+        slots[f.name] = (idx, n)
+        idx += n
+    args = []
+    for f in m.fields:
+        (idx, n) = slots[f.name]
+        if n != 1:
+            args.append("list(t[%u:%u])" % (idx, idx+n))
+        elif f.type == 'char':
+            args.append("null_term(t[%u])" % idx)
+        else:
+            args.append("t[%u]" % idx)
+    return args
 
 
 def native_mavfmt(field):
@@ -329,10 +503,21 @@ class MAVString(str):
                 return self[:]
             return self[0:i]
 
+def null_term(s):
+        '''NUL terminate a string field. Non str values (such as bytes in
+        python3) are returned unchanged'''
+        if isinstance(s, str):
+            i = s.find(chr(0))
+            if i != -1:
+                return s[:i]
+        return s
+
 class MAVLink_bad_data(MAVLink_message):
         '''
         a piece of bad data in a mavlink stream
         '''
+        __slots__ = ('data', 'reason')
+
         def __init__(self, data, reason):
                 MAVLink_message.__init__(self, MAVLINK_MSG_ID_BAD_DATA, 'BAD_DATA')
                 self._fieldnames = ['data', 'reason']
@@ -358,18 +543,27 @@ class MAVLink(object):
                 self.send_callback_args = None
                 self.send_callback_kwargs = None
                 self.buf = bytearray()
+                self.buf_index = 0
                 self.expected_length = 8
                 self.have_prefix_error = False
                 self.robust_parsing = False
+                self.lazy_decode = False # if True, decode() only unpacks fields when they are first accessed
+                self.msgid_wanted = None # if set, a 256 entry list saying which message IDs to decode
+                self.filter_check_crc = True
+                self.filtered_callback = None
+                self.filtered_callback_args = None
+                self.filtered_callback_kwargs = None
                 self.protocol_marker = ${protocol_marker}
                 self.little_endian = ${little_endian}
                 self.crc_extra = ${crc_extra}
                 self.sort_fields = ${sort_fields}
+                self.send_buf = bytearray() # reused by send_many()
                 self.total_packets_sent = 0
                 self.total_bytes_sent = 0
                 self.total_packets_received = 0
                 self.total_bytes_received = 0
                 self.total_receive_errors = 0
+                self.total_packets_filtered = 0
                 self.startup_time = time.time()
                 if native_supported and (use_native or native_testing or native_force):
                     print("NOTE: mavnative is currently beta-test code")
@@ -389,9 +583,52 @@ class MAVLink(object):
             self.send_callback_args = args
             self.send_callback_kwargs = kwargs
 
+        def set_filtered_callback(self, callback, *args, **kwargs):
+            '''set a function to be called with the MAVLink_header of each
+            frame skipped by the message ID filter'''
+            self.filtered_callback = callback
+            self.filtered_callback_args = args
+            self.filtered_callback_kwargs = kwargs
+
+        def set_msgid_filter(self, include=None, exclude=None, check_crc=True):
+            '''only decode messages whose ID is in include (if given) and not
+            in exclude. IDs may be given as numbers or message names. Frames
+            for other messages are skipped after reading their header. If
+            check_crc is set then skipped frames still have their CRC checked,
+            and frames with a bad CRC are passed on to decode() so they are
+            reported as errors as usual'''
+            if include is None and exclude is None:
+                self.msgid_wanted = None
+                return
+            wanted = [include is None] * 256
+            for msgId in self.__msgids(include):
+                wanted[msgId] = True
+            for msgId in self.__msgids(exclude):
+                wanted[msgId] = False
+            self.msgid_wanted = wanted
+            self.filter_check_crc = check_crc
+
+        def __msgids(self, types):
+            '''convert a list of message IDs or names to message IDs,
+            ignoring names not in this dialect'''
+            ret = []
+            if types is None:
+                return ret
+            for t in types:
+                if isinstance(t, int):
+                    ret.append(t)
+                    continue
+                for msgId, type in mavlink_map.items():
+                    if type.name == t.upper():
+                        ret.append(msgId)
+            return ret
+
         def send(self, mavmsg):
                 '''send a MAVLink message'''
-                buf = mavmsg.pack(self)
+                if self.native:
+                    buf = self.native.pack(mavmsg, self.seq, self.srcSystem, self.srcComponent)
+                else:
+                    buf = mavmsg.pack(self)
                 self.file.write(buf)
                 self.seq = (self.seq + 1) % 256
                 self.total_packets_sent += 1
@@ -399,12 +636,56 @@ class MAVLink(object):
                 if self.send_callback:
                     self.send_callback(mavmsg, *self.send_callback_args, **self.send_callback_kwargs)
 
+        def pack_into(self, msgs, buf, offset=0):
+                '''pack a list of messages one after the other into the
+                bytearray buf starting at offset, growing buf if needed.
+                Each message takes the next sequence number. Returns the
+                number of bytes written'''
+                start = offset
+                for mavmsg in msgs:
+                    offset += mavmsg.pack_into(self, buf, offset)
+                    self.seq = (self.seq + 1) % 256
+                return offset - start
+
+        def send_many(self, msgs, max_bytes=1400):
+                '''send a list of MAVLink messages in as few writes as
+                possible. Frames are never split between writes, and each
+                write is at most max_bytes long unless it holds a single
+                longer frame, so the writes fit in UDP datagrams. A
+                max_bytes of None sends everything in one write'''
+                if len(msgs) == 0:
+                    return
+                buf = self.send_buf
+                start = 0
+                offset = 0
+                for mavmsg in msgs:
+                    flen = mavmsg.pack_into(self, buf, offset)
+                    self.seq = (self.seq + 1) % 256
+                    if max_bytes is not None and offset > start and offset + flen - start > max_bytes:
+                        self.file.write(buf[start:offset])
+                        start = offset
+                    offset += flen
+                del buf[offset:]
+                if start == 0:
+                    self.file.write(buf)
+                else:
+                    self.file.write(buf[start:])
+                self.total_packets_sent += len(msgs)
+                self.total_bytes_sent += offset
+                if self.send_callback:
+                    for mavmsg in msgs:
+                        self.send_callback(mavmsg, *self.send_callback_args, **self.send_callback_kwargs)
+
+        def buf_len(self):
+            '''return number of unparsed bytes in the receive buffer'''
+            return len(self.buf) - self.buf_index
+
         def bytes_needed(self):
             '''return number of bytes needed for next parsing stage'''
             if self.native:
-                ret = self.native.expected_length - len(self.buf)
+                ret = self.native.expected_length - self.buf_len()
             else:
-                ret = self.expected_length - len(self.buf)
+                ret = self.expected_length - self.buf_len()
             
             if ret <= 0:
                 return 1
@@ -420,6 +701,36 @@ class MAVLink(object):
             if self.callback:
                 self.callback(msg, *self.callback_args, **self.callback_kwargs)
 
+        def __filtered(self, header):
+            '''account for a frame skipped by the message ID filter'''
+            self.total_packets_filtered += 1
+            if self.filtered_callback:
+                self.filtered_callback(header, *self.filtered_callback_args, **self.filtered_callback_kwargs)
+
+        def __skip_filtered(self):
+            '''skip over any complete frames at the front of the receive buffer
+            whose message ID is filtered out, without decoding them'''
+            buf = self.buf
+            while True:
+                i = self.buf_index
+                if len(buf) - i < 8 or buf[i] != ${protocol_marker}:
+                    return
+                flen = buf[i+1] + 8
+                msgId = buf[i+5]
+                if len(buf) - i < flen or self.msgid_wanted[msgId]:
+                    return
+                if self.filter_check_crc:
+                    if not msgId in mavlink_map:
+                        return
+                    crc = x25crc(buf[i+1:i+flen-2])
+                    if ${crc_extra}: # using CRC extra
+                        crc.accumulate([mavlink_map[msgId].crc_extra])
+                    if crc.crc != buf[i+flen-2] | (buf[i+flen-1]<<8):
+                        return
+                self.buf_index += flen
+                self.expected_length = 8
+                self.__filtered(MAVLink_header(msgId, buf[i+1], buf[i+2], buf[i+3], buf[i+4]))
+
         def parse_char(self, c):
             '''input some data bytes, possibly returning a new message'''
             self.buf.extend(c)
@@ -435,7 +746,13 @@ class MAVLink(object):
                         print("Native: %s\\nLegacy: %s\\n" % (m, m2))
                         raise Exception('Native vs. Legacy mismatch')
                 else:
+                    errors = self.native.parse_errors
                     m = self.__parse_char_native(self.buf)
+                    self.total_receive_errors += self.native.parse_errors - errors
+                    while (m is not None and self.msgid_wanted is not None and
+                           not self.msgid_wanted[m.get_msgId()]):
+                        self.__filtered(m._header)
+                        m = self.__parse_char_native(self.buf)
             else:
                 m = self.__parse_char_legacy()
 
@@ -443,13 +760,21 @@ class MAVLink(object):
                 self.total_packets_received += 1
                 self.__callbacks(m)
 
+            # only compact the receive buffer once at least half of it
+            # has been consumed, so parsing stays linear in the bytes received
+            if self.buf_index != 0 and 2*self.buf_index >= len(self.buf):
+                del self.buf[:self.buf_index]
+                self.buf_index = 0
+
             return m
 
         def __parse_char_legacy(self):
             '''input some data bytes, possibly returning a new message (uses no native code)'''
-            if len(self.buf) >= 1 and self.buf[0] != ${protocol_marker}:
-                magic = self.buf[0]
-                self.buf = self.buf[1:]
+            if self.msgid_wanted is not None:
+                self.__skip_filtered()
+            if self.buf_len() >= 1 and self.buf[self.buf_index] != ${protocol_marker}:
+                magic = self.buf[self.buf_index]
+                self.buf_index += 1
                 if self.robust_parsing:
                     m = MAVLink_bad_data(chr(magic), "Bad prefix")
                     self.expected_length = 8
@@ -461,29 +786,59 @@ class MAVLink(object):
                 self.total_receive_errors += 1
                 raise MAVError("invalid MAVLink prefix '%s'" % magic)
             self.have_prefix_error = False
-            if len(self.buf) >= 2:
+            if self.buf_len() >= 2:
+                self.expected_length = self.buf[self.buf_index+1] + 8
+            if self.expected_length >= 8 and self.buf_len() >= self.expected_length:
                 if sys.version_info[0] < 3:
-                    (magic, self.expected_length) = struct.unpack('BB', str(self.buf[0:2])) # bytearrays are not supported in py 2.7.3
+                    # memoryviews iterate as str in py2, so copy the frame
+                    mbuf = array.array('B', self.buf[self.buf_index:self.buf_index+self.expected_length])
                 else:
-                    (magic, self.expected_length) = struct.unpack('BB', self.buf[0:2])
-                self.expected_length += 8
-            if self.expected_length >= 8 and len(self.buf) >= self.expected_length:
-                mbuf = array.array('B', self.buf[0:self.expected_length])
-                self.buf = self.buf[self.expected_length:]
+                    mbuf = memoryview(self.buf)[self.buf_index:self.buf_index+self.expected_length]
+                self.buf_index += self.expected_length
                 self.expected_length = 8
-                if self.robust_parsing:
-                    try:
+                try:
+                    if self.robust_parsing:
+                        try:
+                            m = self.decode(mbuf)
+                        except MAVError as reason:
+                            m = MAVLink_bad_data(bytearray(mbuf), reason.message)
+                            self.total_receive_errors += 1
+                    else:
                         m = self.decode(mbuf)
-                    except MAVError as reason:
-                        m = MAVLink_bad_data(mbuf, reason.message)
-                        self.total_receive_errors += 1
-                else:
-                    m = self.decode(mbuf)
+                finally:
+                    # release the view so the receive buffer can be resized
+                    if isinstance(mbuf, memoryview):
+                        mbuf.release()
                 return m
             return None
 
+        def __parse_buffer_native(self, s):
+            '''parse a whole buffer with a single call into the native code'''
+            self.buf.extend(s)
+            self.total_bytes_received += len(s)
+            errors = self.native.parse_errors
+            msgs, n = self.native.parse_all(self.buf)
+            del self.buf[:n]
+            self.total_receive_errors += self.native.parse_errors - errors
+            if self.msgid_wanted is not None:
+                wanted = []
+                for m in msgs:
+                    if self.msgid_wanted[m.get_msgId()]:
+                        wanted.append(m)
+                    else:
+                        self.__filtered(m._header)
+                msgs = wanted
+            self.total_packets_received += len(msgs)
+            for m in msgs:
+                self.__callbacks(m)
+            if len(msgs) == 0:
+                return None
+            return msgs
+
         def parse_buffer(self, s):
             '''input some data bytes, possibly returning a list of new messages'''
+            if self.native and not native_testing:
+                return self.__parse_buffer_native(s)
             m = self.parse_char(s)
             if m is None:
                 return None
@@ -512,9 +867,6 @@ class MAVLink(object):
 
                 # decode the payload
                 type = mavlink_map[msgId]
-                fmt = type.format
-                order_map = type.orders
-                len_map = type.lengths
                 crc_extra = type.crc_extra
 
                 # decode the checksum
@@ -522,52 +874,36 @@ class MAVLink(object):
                     crc, = struct.unpack('<H', msgbuf[-2:])
                 except struct.error as emsg:
                     raise MAVError('Unable to unpack MAVLink CRC: %s' % emsg)
-                crcbuf = msgbuf[1:-2]
+                crc2 = x25crc(msgbuf[1:-2])
                 if ${crc_extra}: # using CRC extra
-                    crcbuf.append(crc_extra)
-                crc2 = x25crc(crcbuf)
+                    crc2.accumulate([crc_extra])
                 if crc != crc2.crc:
                     raise MAVError('invalid MAVLink CRC in msgID %u 0x%04x should be 0x%04x' % (msgId, crc, crc2.crc))
 
+                if self.lazy_decode and type.decode_lazily:
+                    # only keep the validated frame, fields are unpacked on first access
+                    if mlen != type.unpacker.size:
+                        raise MAVError('Unable to unpack MAVLink payload type=%s fmt=%s payloadLength=%u' % (
+                            type, type.format, mlen))
+                    m = type.__new__(type)
+                    m._lazy = True
+                    m._type = type.name
+                    m._fieldnames = type.fieldnames
+                    m._msgbuf = bytearray(msgbuf)
+                    m._crc = crc
+                    return m
+
+                # unpack the fields and construct the message object
                 try:
-                    t = struct.unpack(fmt, msgbuf[6:-2])
+                    m = type._decode_payload(msgbuf[6:-2])
                 except struct.error as emsg:
                     raise MAVError('Unable to unpack MAVLink payload type=%s fmt=%s payloadLength=%u: %s' % (
-                        type, fmt, len(msgbuf[6:-2]), emsg))
-
-                tlist = list(t)
-                # handle sorted fields
-                if ${sort_fields}:
-                    t = tlist[:]
-                    if sum(len_map) == len(len_map):
-                        # message has no arrays in it
-                        for i in range(0, len(tlist)):
-                            tlist[i] = t[order_map[i]]
-                    else:
-                        # message has some arrays
-                        tlist = []
-                        for i in range(0, len(order_map)):
-                            order = order_map[i]
-                            L = len_map[order]
-                            tip = sum(len_map[:order])
-                            field = t[tip]
-                            if L == 1 or isinstance(field, str):
-                                tlist.append(field)
-                            else:
-                                tlist.append(t[tip:(tip + L)])
-
-                # terminate any strings
-                for i in range(0, len(tlist)):
-                    if isinstance(tlist[i], str):
-                        tlist[i] = str(MAVString(tlist[i]))
-                t = tuple(tlist)
-                # construct the message object
-                try:
-                    m = type(*t)
+                        type, type.format, len(msgbuf[6:-2]), emsg))
                 except Exception as emsg:
                     raise MAVError('Unable to instantiate MAVLink message of type %s : %s' % (type, emsg))
-                m._msgbuf = msgbuf
-                m._payload = msgbuf[6:-2]
+                # msgbuf may be a view on the receive buffer, so take a copy
+                m._msgbuf = bytearray(msgbuf)
+                m._payload = m._msgbuf[6:-2]
                 m._crc = crc
                 m._header = MAVLink_header(msgId, mlen, seq, srcSystem, srcComponent)
                 return m
@@ -0,0 +1,398 @@
+#!/usr/bin/env python
+'''
+asyncio MAVLink connections
+
+These are variants of the mavutil connection classes for use from an
+asyncio event loop. Incoming data is parsed as it arrives, so a single
+loop can serve many connections without polling. For example:
+
+  conn = await mavasync.mavlink_connection('udpin:0.0.0.0:14550')
+  await conn.wait_heartbeat()
+  async for msg in conn:
+      print(msg)
+
+Requires python 3.5 or later.
+'''
+
+import asyncio, collections, os, socket, struct, time
+
+from pymavlink import mavutil
+
+# the loop running the current task. get_running_loop() is new in python
+# 3.7, before that get_event_loop() returns the running loop when called
+# from a coroutine
+_running_loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+
+class mavasync(object):
+    '''the asyncio interface shared by all the connection classes.
+    Subclasses provide recv_msg_async(). The mavfile helpers that wait
+    for messages are replaced with coroutines here'''
+
+    async def recv_msg_async(self):
+        '''wait for the next message, returning None at the end of the stream'''
+        raise RuntimeError('no recv_msg_async() method supplied')
+
+    async def recv_match(self, condition=None, type=None, blocking=True, timeout=None):
+        '''wait for the next MAVLink message that matches the given
+        condition. type can be a string or a list of strings. If
+        blocking is False only messages already received are
+        checked. Returns None on timeout or at the end of the stream'''
+        if type is not None and not isinstance(type, list):
+            type = [type]
+        if timeout is None:
+            return await self._recv_match(condition, type, blocking)
+        try:
+            return await asyncio.wait_for(self._recv_match(condition, type, blocking), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def _recv_match(self, condition, type, blocking):
+        while True:
+            if self.coalescer is not None:
+                self.coalescer.flush_due()
+            if blocking:
+                m = await self.recv_msg_async()
+            else:
+                m = self.recv_msg()
+            if m is None:
+                return None
+            if type is not None and not m.get_type() in type:
+                continue
+            if not mavutil.evaluate_condition(condition, self.messages):
+                continue
+            return m
+
+    async def wait_heartbeat(self, blocking=True):
+        '''wait for a heartbeat so we know the target system IDs'''
+        return await self.recv_match(type='HEARTBEAT', blocking=blocking)
+
+    async def waypoint_current(self):
+        '''return current waypoint'''
+        if self.mavlink10():
+            m = await self.recv_match(type='MISSION_CURRENT')
+        else:
+            m = await self.recv_match(type='WAYPOINT_CURRENT')
+        return m.seq
+
+    async def wait_gps_fix(self):
+        await self.recv_match(type='VFR_HUD')
+        if self.mavlink10():
+            await self.recv_match(type='GPS_RAW_INT',
+                                  condition='GPS_RAW_INT.fix_type==3 and GPS_RAW_INT.lat != 0 and GPS_RAW_INT.alt != 0')
+        else:
+            await self.recv_match(type='GPS_RAW',
+                                  condition='GPS_RAW.fix_type==2 and GPS_RAW.lat != 0 and GPS_RAW.alt != 0')
+
+    async def location(self, relative_alt=False):
+        '''return current location'''
+        await self.wait_gps_fix()
+        # wait for another VFR_HUD, to ensure we have correct altitude
+        await self.recv_match(type='VFR_HUD')
+        await self.recv_match(type='GLOBAL_POSITION_INT')
+        if relative_alt:
+            alt = self.messages['GLOBAL_POSITION_INT'].relative_alt*0.001
+        else:
+            alt = self.messages['VFR_HUD'].alt
+        return mavutil.location(self.messages['GPS_RAW_INT'].lat*1.0e-7,
+                                self.messages['GPS_RAW_INT'].lon*1.0e-7,
+                                alt,
+                                self.messages['VFR_HUD'].heading)
+
+    async def motors_armed_wait(self):
+        '''wait for motors to be armed'''
+        while True:
+            await self.wait_heartbeat()
+            if self.motors_armed():
+                return
+
+    async def motors_disarmed_wait(self):
+        '''wait for motors to be disarmed'''
+        while True:
+            await self.wait_heartbeat()
+            if not self.motors_armed():
+                return
+
+    def start_reader(self, queue_size=1000):
+        '''asyncio connections are read by the event loop, not a thread'''
+        raise RuntimeError('start_reader() is not supported on asyncio connections')
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        m = await self.recv_msg_async()
+        if m is None:
+            raise StopAsyncIteration
+        return m
+
+
+class mavasyncstream(mavasync, mavutil.mavfile):
+    '''base class for connections fed by an asyncio transport. Data
+    is parsed with parse_buffer() as it arrives and the messages are
+    queued until they are read'''
+    def __init__(self, address, source_system=255, input=True, use_native=mavutil.default_native):
+        mavutil.mavfile.__init__(self, None, address, source_system=source_system, input=input, use_native=use_native)
+        self.transport = None
+        self.msg_queue = collections.deque()
+        self.data_ready = None
+        self.closed = False
+
+    async def open(self):
+        '''open the connection. Must be called from the event loop'''
+        self.data_ready = asyncio.Event()
+
+    def feed(self, data):
+        '''parse newly arrived data'''
+        if self.first_byte:
+            self.auto_mavlink_version(data)
+        msgs = self.mav.parse_buffer(data)
+        if msgs is not None:
+            self.msg_queue.extend(msgs)
+            self.data_ready.set()
+
+    def connection_lost(self, exc):
+        '''the transport has closed'''
+        self.closed = True
+        self.portdead = True
+        if self.data_ready is not None:
+            self.data_ready.set()
+
+    def recv_msg(self):
+        '''return the next message already received, or None'''
+        if len(self.msg_queue) == 0:
+            return None
+        msg = self.msg_queue.popleft()
+        if self.logfile and msg.get_type() != 'BAD_DATA':
+            usec = int(time.time() * 1.0e6) & ~3
+            self.logfile.write(str(struct.pack('>Q', usec) + msg.get_msgbuf()))
+        self.post_message(msg)
+        return msg
+
+    async def recv_msg_async(self):
+        '''wait for the next message, returning None once the connection
+        has closed and all received messages have been read'''
+        while True:
+            m = self.recv_msg()
+            if m is not None or self.closed:
+                return m
+            self.data_ready.clear()
+            # wake up in time to write any frames held back by
+            # set_coalescing()
+            wait = self.coalesce_wait(None)
+            if wait is None:
+                await self.data_ready.wait()
+                continue
+            try:
+                await asyncio.wait_for(self.data_ready.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+            if self.coalescer is not None:
+                self.coalescer.flush_due()
+
+    def write(self, buf):
+        if self.transport is not None and not self.closed:
+            self.transport.write(buf)
+
+    def close(self):
+        if self.transport is not None:
+            self.transport.close()
+        self.connection_lost(None)
+
+
+class _stream_protocol(asyncio.Protocol):
+    '''pass the data from a stream transport to a connection'''
+    def __init__(self, conn):
+        self.conn = conn
+
+    def connection_made(self, transport):
+        self.conn.transport = transport
+
+    def data_received(self, data):
+        self.conn.feed(data)
+
+    def connection_lost(self, exc):
+        self.conn.connection_lost(exc)
+
+
+class _datagram_protocol(asyncio.DatagramProtocol):
+    '''pass the datagrams from a UDP transport to a connection'''
+    def __init__(self, conn):
+        self.conn = conn
+
+    def connection_made(self, transport):
+        self.conn.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.conn.last_address = addr
+        self.conn.feed(data)
+
+    def error_received(self, exc):
+        # like mavudp, ignore ECONNREFUSED and friends
+        pass
+
+    def connection_lost(self, exc):
+        self.conn.connection_lost(exc)
+
+
+class mavudp_async(mavasyncstream):
+    '''an asyncio UDP mavlink socket'''
+    def __init__(self, device, input=True, broadcast=False, source_system=255, use_native=mavutil.default_native):
+        a = device.split(':')
+        if len(a) != 2:
+            raise ValueError("UDP ports must be specified as host:port")
+        self.port = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.udp_server = input
+        if input:
+            self.port.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.port.bind((a[0], int(a[1])))
+        else:
+            self.destination_addr = (a[0], int(a[1]))
+            if broadcast:
+                self.port.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        mavutil.set_close_on_exec(self.port.fileno())
+        self.port.setblocking(0)
+        self.last_address = None
+        mavasyncstream.__init__(self, device, source_system=source_system, input=input, use_native=use_native)
+
+    async def open(self):
+        await mavasyncstream.open(self)
+        loop = _running_loop()
+        await loop.create_datagram_endpoint(lambda: _datagram_protocol(self), sock=self.port)
+
+    def write(self, buf):
+        if self.transport is None or self.closed:
+            return
+        if self.udp_server:
+            if self.last_address:
+                self.transport.sendto(buf, self.last_address)
+        else:
+            self.transport.sendto(buf, self.destination_addr)
+
+
+class mavtcp_async(mavasyncstream):
+    '''an asyncio TCP mavlink socket'''
+    def __init__(self, device, source_system=255, use_native=mavutil.default_native):
+        a = device.split(':')
+        if len(a) != 2:
+            raise ValueError("TCP ports must be specified as host:port")
+        self.destination_addr = (a[0], int(a[1]))
+        mavasyncstream.__init__(self, "tcp:" + device, source_system=source_system, use_native=use_native)
+
+    async def open(self):
+        await mavasyncstream.open(self)
+        loop = _running_loop()
+        await loop.create_connection(lambda: _stream_protocol(self), *self.destination_addr)
+
+
+class mavserial_async(mavasyncstream):
+    '''an asyncio serial mavlink port, read when the event loop sees
+    its file descriptor become readable'''
+    def __init__(self, device, baud=115200, source_system=255, use_native=mavutil.default_native):
+        import serial
+        if ',' in device and not os.path.exists(device):
+            device, baud = device.split(',')
+        self.baud = baud
+        self.device = device
+        # see mavserial for why the port is opened at 1200 baud
+        self.port = serial.Serial(self.device, 1200, timeout=0,
+                                  dsrdtr=False, rtscts=False, xonxoff=False)
+        mavutil.set_close_on_exec(self.port.fileno())
+        self.port.setBaudrate(self.baud)
+        mavasyncstream.__init__(self, device, source_system=source_system, use_native=use_native)
+        self.fd = self.port.fileno()
+        self.rtscts = False
+        self.loop = None
+
+    async def open(self):
+        await mavasyncstream.open(self)
+        self.loop = _running_loop()
+        self.loop.add_reader(self.fd, self.read_ready)
+
+    def read_ready(self):
+        '''read whatever the port has waiting'''
+        try:
+            data = self.port.read(max(self.port.inWaiting(), 1))
+        except Exception:
+            self.close()
+            return
+        if len(data) != 0:
+            self.feed(data)
+
+    def set_rtscts(self, enable):
+        '''enable/disable RTS/CTS if applicable'''
+        self.port.setRtsCts(enable)
+        self.rtscts = enable
+
+    def set_baudrate(self, baudrate):
+        '''set baudrate'''
+        self.port.setBaudrate(baudrate)
+
+    def write(self, buf):
+        if self.closed:
+            return
+        try:
+            self.port.write(buf)
+        except Exception:
+            self.close()
+
+    def close(self):
+        if not self.closed:
+            # close() may be called from outside the loop
+            if self.loop is not None:
+                self.loop.remove_reader(self.fd)
+            self.port.close()
+        self.connection_lost(None)
+
+
+class mavlogfile_async(mavasync, mavutil.mavlogfile):
+    '''a MAVLink telemetry log read from an asyncio task. Files are
+    always readable, so this reads them with mavlogfile and gives
+    other tasks a turn every yield_count messages'''
+    def __init__(self, filename, yield_count=100, **kwargs):
+        mavutil.mavlogfile.__init__(self, filename, **kwargs)
+        self.yield_count = yield_count
+        self.since_yield = 0
+
+    async def open(self):
+        pass
+
+    async def recv_msg_async(self):
+        '''read the next message, returning None at the end of the file'''
+        self.since_yield += 1
+        if self.since_yield >= self.yield_count:
+            self.since_yield = 0
+            await asyncio.sleep(0)
+        return self.recv_msg()
+
+
+async def mavlink_connection(device, baud=115200, source_system=255,
+                             planner_format=None, write=False, append=False,
+                             robust_parsing=True, notimestamps=False, input=True,
+                             dialect=None, use_native=mavutil.default_native,
+                             include_types=None, exclude_types=None, filter_crc=True):
+    '''open a serial, UDP, TCP or telemetry log connection for use with
+    asyncio. Devices are named as for mavutil.mavlink_connection()'''
+    if dialect is not None:
+        mavutil.set_dialect(dialect)
+    logsuffixes = ['mavlink', 'log', 'raw', 'tlog' ]
+    suffix = device.split('.')[-1].lower()
+    if device.startswith('tcp:'):
+        m = mavtcp_async(device[4:], source_system=source_system, use_native=use_native)
+    elif device.startswith('udpin:'):
+        m = mavudp_async(device[6:], input=True, source_system=source_system, use_native=use_native)
+    elif device.startswith('udpout:'):
+        m = mavudp_async(device[7:], input=False, source_system=source_system, use_native=use_native)
+    elif device.startswith('udp:'):
+        m = mavudp_async(device[4:], input=input, source_system=source_system, use_native=use_native)
+    elif device.find(':') != -1 and not suffix in logsuffixes:
+        m = mavudp_async(device, input=input, source_system=source_system, use_native=use_native)
+    elif os.path.isfile(device):
+        m = mavlogfile_async(device, planner_format=planner_format, write=write,
+                             append=append, robust_parsing=robust_parsing, notimestamps=notimestamps,
+                             source_system=source_system, use_native=use_native)
+    else:
+        m = mavserial_async(device, baud=baud, source_system=source_system, use_native=use_native)
+    await m.open()
+    if include_types is not None or exclude_types is not None:
+        m.set_msgid_filter(include_types, exclude_types, filter_crc)
+    return m
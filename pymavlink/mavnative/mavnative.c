@@ -19,6 +19,7 @@
 // In python3 it only has longs, not 32 bit ints
 #define PyInt_AsLong PyLong_AsLong
 #define PyInt_FromLong PyLong_FromLong
+#define PyString_AsString PyUnicode_AsUTF8
 
 // We returns strings for byte arreays in python2, but bytes objects in python3
 #define PyByteString_FromString PyBytes_FromString
@@ -49,10 +50,11 @@ static void comm_send_ch(mavlink_channel_t chan, uint8_t c) {
 // static mavlink_message_t last_msg;
 
 /*
-  default message crc function. You can override this per-system to
-  put this data in a different memory segment
+  The CRC extra and length of each message come from the message table of the dialect
+  being parsed (see py_mavlink_parse_char), the generic parser in mavlink_helpers.h
+  is not used.
 */
-#define MAVLINK_MESSAGE_CRC(msgid) py_message_info[msgid].crc_extra
+#define MAVLINK_MESSAGE_CRC(msgid) 0
 
 /* Enable this option to check the length of each message.
  This allows invalid messages to be caught much sooner. Use if the transmission
@@ -61,7 +63,7 @@ static void comm_send_ch(mavlink_channel_t chan, uint8_t c) {
  the headers.
 */
 
-#define MAVLINK_MESSAGE_LENGTH(msgid) py_message_info[msgid].len
+#define MAVLINK_MESSAGE_LENGTH(msgid) 0
 
 // #include <mavlink.h>
 
@@ -80,6 +82,7 @@ typedef struct {
 typedef struct {
     PyObject            *id;                                          // The int id for this msg
     PyObject            *name;                                        // name of the message
+    PyObject            *type_class;                                  // python class used for this message
     unsigned            len;                                          // the raw message length of this message - not including headers & CRC
     uint8_t             crc_extra;                                    // the CRC extra for this message
     unsigned            num_fields;                                   // how many fields in this message
@@ -87,8 +90,15 @@ typedef struct {
     py_field_info_t     fields[MAVLINK_MAX_FIELDS];                   // field information
 } py_message_info_t;
 
-static py_message_info_t py_message_info[256];
-static uint8_t           info_inited = FALSE; // We only do the init once (assuming only one dialect in use)
+// The message info for one dialect. This is built the first time a mavlink_map is used, and
+// shared by all connections using that map, so several dialects can be parsed at the same time
+typedef struct py_message_table {
+    PyObject                *mavlink_map;                             // the map the table was built from
+    py_message_info_t       info[256];
+    struct py_message_table *next;
+} py_message_table_t;
+
+static py_message_table_t *message_tables = NULL;
 
 #include <protocol.h>
 
@@ -105,8 +115,11 @@ typedef struct {
     PyObject_HEAD
 
     PyObject            *MAVLinkMessage;
+    py_message_info_t   *info;              // message info for our dialect, indexed by msgid
     mavlink_status_t    mav_status;
     py_message_t        msg;
+    unsigned long       packets_received;   // messages successfully parsed
+    unsigned long       parse_errors;       // frames dropped for a bad length or CRC
 } NativeConnection;
 
 // #define MAVNATIVE_DEBUG
@@ -120,7 +133,12 @@ typedef struct {
 // My exception type
 static PyObject *MAVNativeError;
 
+// Each thread needs its own jump buffer, as the parsers run without the GIL
+#if defined(__GNUC__)
+static __thread jmp_buf python_entry;
+#else
 static jmp_buf python_entry;
+#endif
 
 #define PYTHON_ENTRY if(!setjmp(python_entry)) {
 #define PYTHON_EXIT  } else { return NULL; }   // Used for routines thar return ptrs
@@ -144,7 +162,8 @@ static jmp_buf python_entry;
  * @return 0 if no message could be decoded, 1 else
  *
  */
-MAVLINK_HELPER uint8_t py_mavlink_parse_char(uint8_t c, py_message_t* pymsg, mavlink_status_t* status)
+MAVLINK_HELPER uint8_t py_mavlink_parse_char(uint8_t c, py_message_t* pymsg, mavlink_status_t* status,
+                                             const py_message_info_t *info)
 {
     mavlink_message_t *rxmsg = &pymsg->msg;
 
@@ -215,7 +234,7 @@ MAVLINK_HELPER uint8_t py_mavlink_parse_char(uint8_t c, py_message_t* pymsg, mav
 
     case MAVLINK_PARSE_STATE_GOT_COMPID:
 #ifdef MAVLINK_CHECK_MESSAGE_LENGTH
-            if (rxmsg->len != MAVLINK_MESSAGE_LENGTH(c))
+            if (rxmsg->len != info[c].len)
         {
             status->parse_error++;
             status->parse_state = MAVLINK_PARSE_STATE_IDLE;
@@ -247,7 +266,7 @@ MAVLINK_HELPER uint8_t py_mavlink_parse_char(uint8_t c, py_message_t* pymsg, mav
 
     case MAVLINK_PARSE_STATE_GOT_PAYLOAD:
 #if MAVLINK_CRC_EXTRA
-        mavlink_update_checksum(rxmsg, MAVLINK_MESSAGE_CRC(rxmsg->msgid));
+        mavlink_update_checksum(rxmsg, info[rxmsg->msgid].crc_extra);
 #endif
         pymsg->bytes[pymsg->numBytes++] = c;
         if (c != (rxmsg->checksum & 0xFF)) {
@@ -417,9 +436,10 @@ static int get_py_typeinfo(char type_char, int array_size, unsigned *wire_offset
 
     FIXME - we really should free these PyObjects if our module gets unloaded.
 
+    @param py_message_info - the table to fill in, indexed by msgid
     @param mavlink_map - the mavlink_map object from python a dict from an int msgid -> tuple(fmt, type_class, order_list, len_list, crc_extra)
 */
-static void init_message_info(PyObject *mavlink_map) {
+static void init_message_info(py_message_info_t *py_message_info, PyObject *mavlink_map) {
     // static const mavlink_message_info_t src[256] = MAVLINK_MESSAGE_INFO;
     
     PyObject *items_list = PyDict_Values(mavlink_map);
@@ -456,6 +476,8 @@ static void init_message_info(PyObject *mavlink_map) {
 
         d->id = id_obj;
         d->name = name_obj;
+        d->type_class = type_class;
+        Py_INCREF(type_class);
         d->num_fields = num_fields;
         d->crc_extra = PyInt_AsLong(crc_extra_obj);
         d->fieldnames = PyObject_GetAttrString(type_class, "fieldnames"); // A new reference
@@ -488,6 +510,28 @@ static void init_message_info(PyObject *mavlink_map) {
     Py_DECREF(items_list);
 }
 
+/**
+    Find the message info table for a mavlink_map, building it if this is the first connection to use the map.
+
+    The table keeps a reference to the map, so the map can't be freed and another one allocated at the same address.
+*/
+static py_message_info_t *get_message_info(PyObject *mavlink_map) {
+    py_message_table_t *table;
+
+    for(table = message_tables; table != NULL; table = table->next)
+        if(table->mavlink_map == mavlink_map)
+            return table->info;
+
+    table = (py_message_table_t *) calloc(1, sizeof(py_message_table_t));
+    assert(table);
+    init_message_info(table->info, mavlink_map);
+    table->mavlink_map = mavlink_map;
+    Py_INCREF(mavlink_map);
+    table->next = message_tables;
+    message_tables = table;
+    return table->info;
+}
+
 static PyObject *createPyNone(void)
 {
     Py_INCREF(Py_None);
@@ -606,21 +650,26 @@ static PyObject *pyextract_mavlink(const mavlink_message_t *msg, const py_field_
 
     @return new message, or null if a valid encoding could not be made
 
-    FIXME - move msgclass, the mavstatus and channel context into an instance, created once with the mavfile object
     */
-static PyObject *msg_to_py(PyObject* msgclass, const py_message_t *pymsg) {
+static PyObject *msg_to_py(NativeConnection *self, const py_message_t *pymsg) {
     const mavlink_message_t *msg = &pymsg->msg;
-    const py_message_info_t *info = &py_message_info[msg->msgid];
+    const py_message_info_t *info = &self->info[msg->msgid];
+    PyObject *msgclass = self->MAVLinkMessage;
 
     mavdebug("Found a msg: %s\n", PyString_AS_STRING(info->name));
 
-    /* Call the class object to create our instance */
-    // PyObject *obj = PyObject_CallObject((PyObject *) &NativeConnectionType, null);
-    PyObject *argList = PyTuple_Pack(2, info->id, info->name);
-    PyObject *obj = PyObject_CallObject(msgclass, argList);
+    if (info->type_class == NULL)
+        return NULL; // a message id that isn't in this dialect
+
+    /* Create an instance of the message class without calling its constructor (the field values
+       are filled in below), then run the base class constructor to set up the header.  The message
+       classes use __slots__ so the fields can only be stored on an instance of the right class */
+    PyObject *obj = PyObject_CallMethod(info->type_class, "__new__", "O", info->type_class);
     uint8_t objValid = TRUE;
     assert(obj);
-    Py_DECREF(argList);
+    PyObject *initResult = PyObject_CallMethod(msgclass, "__init__", "OOO", obj, info->id, info->name);
+    assert(initResult);
+    Py_DECREF(initResult);
 
     // Find the header subobject
     PyObject *header = PyObject_GetAttrString(obj, "_header");
@@ -718,6 +767,115 @@ static PyObject *NativeConnection_getexpectedlength(NativeConnection *self, void
     return PyInt_FromLong(get_expectedlength(self));
 }
 
+/**
+  Parse one char, keeping count of the messages and errors seen by this connection
+
+  @return 1 if a message was completed, 0 otherwise
+*/
+static uint8_t native_parse_char(NativeConnection *self, uint8_t c)
+{
+    uint8_t errors = self->mav_status.parse_error; // only 8 bits, so count the changes
+    uint8_t received = py_mavlink_parse_char(c, &self->msg, &self->mav_status, self->info);
+
+    self->parse_errors += (uint8_t) (self->mav_status.parse_error - errors);
+    if (received)
+        self->packets_received++;
+    return received;
+}
+
+/**
+  The frames completed while scanning a buffer, waiting to be turned into python objects
+*/
+typedef struct {
+    py_message_t        *frames;
+    unsigned            count;
+    unsigned            size;
+    uint8_t             out_of_memory;
+} frame_list_t;
+
+// Only release the GIL when there is enough data for it to be worth the cost
+#define GIL_RELEASE_MIN_BYTES 64
+
+/**
+  Run bytes through the parser state machine, copying each completed frame into frames.
+
+  This touches no python objects, so is called with the GIL released. A connection must
+  only be used by one thread at a time.
+
+  @param maxFrames - stop once this many frames have been collected (0 for no limit)
+  @return the number of bytes consumed
+*/
+static Py_ssize_t scan_frames(NativeConnection *self, const uint8_t *bytes, Py_ssize_t numBytes,
+                              frame_list_t *frames, unsigned maxFrames)
+{
+    Py_ssize_t i;
+
+    for(i = 0; i < numBytes; i++) {
+        if (!native_parse_char(self, bytes[i]))
+            continue;
+        if (frames->count == frames->size) {
+            unsigned size = frames->size ? frames->size * 2 : 16;
+            py_message_t *newFrames = (py_message_t *) realloc(frames->frames, size * sizeof(py_message_t));
+            if (newFrames == NULL) {
+                frames->out_of_memory = TRUE;
+                return i + 1;
+            }
+            frames->frames = newFrames;
+            frames->size = size;
+        }
+        frames->frames[frames->count++] = self->msg;
+        if (frames->count == maxFrames)
+            return i + 1;
+    }
+    return numBytes;
+}
+
+/**
+  Scan a buffer with scan_frames, releasing the GIL while doing so if the buffer is big enough
+*/
+static Py_ssize_t scan_frames_nogil(NativeConnection *self, const uint8_t *bytes, Py_ssize_t numBytes,
+                                    frame_list_t *frames, unsigned maxFrames)
+{
+    Py_ssize_t consumed;
+
+    if (numBytes < GIL_RELEASE_MIN_BYTES)
+        return scan_frames(self, bytes, numBytes, frames, maxFrames);
+
+    Py_BEGIN_ALLOW_THREADS
+    consumed = scan_frames(self, bytes, numBytes, frames, maxFrames);
+    Py_END_ALLOW_THREADS
+    return consumed;
+}
+
+/**
+  Convert the scanned frames to message objects, appending them to a list. Frames which can't
+  be converted are counted as parse errors.
+
+  @return 0 on success, -1 with a python exception set on failure
+*/
+static int frames_to_py(NativeConnection *self, frame_list_t *frames, PyObject *list)
+{
+    unsigned i;
+
+    if (frames->out_of_memory) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    for(i = 0; i < frames->count; i++) {
+        PyObject *obj = msg_to_py(self, &frames->frames[i]);
+        if(obj != NULL) {
+            PyList_Append(list, obj);
+            // Append will have bummped up the ref count on obj, so we need to release our count
+            Py_DECREF(obj);
+        }
+        else {
+            PyErr_Clear();
+            self->parse_errors++;
+        }
+    }
+    return 0;
+}
+
 /**
   Given a byte array of bytes
   @return a list of MAVProxy_message objects
@@ -739,26 +897,33 @@ py_parse_chars(NativeConnection *self, PyObject *args)
 
     char *start = PyByteArray_AsString(byteObj);
     assert(start);
-    char *bytes = start;
+    Py_ssize_t consumed = 0;
     PyObject *result = NULL;
-
-    // Generate a list of messages found 
-    while(numBytes) {
-        char c = *bytes++;
-        numBytes--;
-        get_expectedlength(self); mavdebug("parse 0x%x\n", (unsigned char) c);
-
-        if (py_mavlink_parse_char(c, &self->msg, &self->mav_status)) {
-            mavdebug("got packet\n");
-            result = msg_to_py(self->MAVLinkMessage, &self->msg);
-            if(result != NULL)
-                break;
-        }
+    PyObject *list = PyList_New(0);
+    frame_list_t frames = { NULL, 0, 0, FALSE };
+
+    // Stop at the first message that converts, leaving the rest of the bytes for the next call
+    while(consumed < numBytes && PyList_Size(list) == 0) {
+        frames.count = 0;
+        consumed += scan_frames_nogil(self, (const uint8_t *) start + consumed, numBytes - consumed, &frames, 1);
+        if (frames_to_py(self, &frames, list) != 0)
+            break;
     }
+    free(frames.frames);
 
     // We didn't process all bytes provided by the caller, so fixup their array
-    memmove(start, bytes, numBytes);
-    PyByteArray_Resize(byteObj, numBytes);
+    memmove(start, start + consumed, numBytes - consumed);
+    PyByteArray_Resize(byteObj, numBytes - consumed);
+
+    if (PyErr_Occurred()) {
+        Py_DECREF(list);
+        return NULL;
+    }
+    if (PyList_Size(list) != 0) {
+        result = PyList_GetItem(list, 0);
+        Py_INCREF(result);
+    }
+    Py_DECREF(list);
 
     if(result != NULL) 
         return result;
@@ -793,28 +958,356 @@ py_parse_buffer(NativeConnection *self, PyObject *args)
     // mavdebug("numbytes %u\n", (unsigned) numBytes);
 
     PyObject* list = PyList_New(0);
+    frame_list_t frames = { NULL, 0, 0, FALSE };
 
     // Generate a list of messages found 
-    while(numBytes--) {
-        char c = *bytes++;
-        // mavdebug("parse %c\n", c);
-
-        if (py_mavlink_parse_char(c, &self->msg, &self->mav_status)) {
-            PyObject *obj = msg_to_py(self->MAVLinkMessage, &self->msg);
-            if(obj != NULL) {
-                PyList_Append(list, obj);
-            
-                // Append will have bummped up the ref count on obj, so we need to release our count
-                Py_DECREF(obj);
+    scan_frames_nogil(self, (const uint8_t *) bytes, numBytes, &frames, 0);
+    int ret = frames_to_py(self, &frames, list);
+    free(frames.frames);
+    if (ret != 0) {
+        Py_DECREF(list);
+        return NULL;
+    }
+
+    return list;
+
+    PYTHON_EXIT
+}
+
+/**
+  Given any buffer-like object, parse all of it in one call. A partial message at the end
+  of the buffer is kept in the parser state and completed by the next call.
+
+  The buffer is scanned with the GIL released, it is only taken again to create the messages.
+
+  @return a tuple of (list of messages, number of bytes consumed)
+*/
+static PyObject *
+py_parse_all(NativeConnection *self, PyObject *args)
+{
+    PYTHON_ENTRY
+
+    PyObject *bufObj;
+    Py_buffer view;
+
+    if (!PyArg_ParseTuple(args, "O", &bufObj))
+        return NULL;
+    // holding the buffer stops a bytearray being resized while we don't hold the GIL
+    if (PyObject_GetBuffer(bufObj, &view, PyBUF_SIMPLE) != 0)
+        return NULL;
+
+    PyObject *list = PyList_New(0);
+    frame_list_t frames = { NULL, 0, 0, FALSE };
+
+    Py_ssize_t consumed = scan_frames_nogil(self, (const uint8_t *) view.buf, view.len, &frames, 0);
+    int ret = frames_to_py(self, &frames, list);
+    free(frames.frames);
+    PyBuffer_Release(&view);
+    if (ret != 0) {
+        Py_DECREF(list);
+        return NULL;
+    }
+
+    return Py_BuildValue("(Nn)", list, consumed);
+
+    PYTHON_EXIT
+}
+
+/**
+    Convert a python number to an integer, checking it fits in the given range
+
+    @return 0 on success, -1 with a python exception set if it doesn't
+*/
+static int get_int_in_range(PyObject *val, const py_field_info_t *field, long long min, long long max, long long *result)
+{
+    long long v = PyLong_AsLongLong(val);
+    if (v == -1 && PyErr_Occurred())
+        return -1;
+    if (v < min || v > max) {
+        PyErr_Format(MAVNativeError, "field %s out of range", PyString_AsString(field->name));
+        return -1;
+    }
+    *result = v;
+    return 0;
+}
+
+/**
+    Store one python value of a field into a payload buffer at the given offset
+
+    @return 0 on success, -1 with a python exception set on failure
+*/
+static int pyput_value(char *payload, unsigned offset, const py_field_info_t *field, PyObject *val)
+{
+    long long v;
+
+    switch(field->type) {
+        case MAVLINK_TYPE_UINT8_T: {
+            if (get_int_in_range(val, field, 0, 0xFF, &v) != 0)
+                return -1;
+            uint8_t b = (uint8_t) v;
+            _mav_put_uint8_t(payload, offset, b);
+            break;
+            }
+        case MAVLINK_TYPE_INT8_T: {
+            if (get_int_in_range(val, field, INT8_MIN, INT8_MAX, &v) != 0)
+                return -1;
+            int8_t b = (int8_t) v;
+            _mav_put_int8_t(payload, offset, b);
+            break;
             }
+        case MAVLINK_TYPE_UINT16_T: {
+            if (get_int_in_range(val, field, 0, UINT16_MAX, &v) != 0)
+                return -1;
+            uint16_t b = (uint16_t) v;
+            _mav_put_uint16_t(payload, offset, b);
+            break;
+            }
+        case MAVLINK_TYPE_INT16_T: {
+            if (get_int_in_range(val, field, INT16_MIN, INT16_MAX, &v) != 0)
+                return -1;
+            int16_t b = (int16_t) v;
+            _mav_put_int16_t(payload, offset, b);
+            break;
+            }
+        case MAVLINK_TYPE_UINT32_T: {
+            if (get_int_in_range(val, field, 0, UINT32_MAX, &v) != 0)
+                return -1;
+            uint32_t b = (uint32_t) v;
+            _mav_put_uint32_t(payload, offset, b);
+            break;
+            }
+        case MAVLINK_TYPE_INT32_T: {
+            if (get_int_in_range(val, field, INT32_MIN, INT32_MAX, &v) != 0)
+                return -1;
+            int32_t b = (int32_t) v;
+            _mav_put_int32_t(payload, offset, b);
+            break;
+            }
+        case MAVLINK_TYPE_UINT64_T: {
+            uint64_t b = PyLong_AsUnsignedLongLong(val);
+            if (b == (uint64_t) -1 && PyErr_Occurred())
+                return -1;
+            _mav_put_uint64_t(payload, offset, b);
+            break;
+            }
+        case MAVLINK_TYPE_INT64_T: {
+            int64_t b = PyLong_AsLongLong(val);
+            if (b == -1 && PyErr_Occurred())
+                return -1;
+            _mav_put_int64_t(payload, offset, b);
+            break;
+            }
+        case MAVLINK_TYPE_FLOAT: {
+            float b = (float) PyFloat_AsDouble(val);
+            if (b == -1.0 && PyErr_Occurred())
+                return -1;
+            _mav_put_float(payload, offset, b);
+            break;
+            }
+        case MAVLINK_TYPE_DOUBLE: {
+            double b = PyFloat_AsDouble(val);
+            if (b == -1.0 && PyErr_Occurred())
+                return -1;
+            _mav_put_double(payload, offset, b);
+            break;
+            }
+        default:
+            mavdebug("BAD MAV TYPE %d\n", field->type);
+            set_pyerror("Unexpected mavlink type");
+            return -1;
+    }
+    return 0;
+}
+
+/**
+    Store the value of a field (which may be an array or a string) into a payload buffer
+
+    @return 0 on success, -1 with a python exception set on failure
+*/
+static int pyput_field(char *payload, const py_field_info_t *field, PyObject *val)
+{
+    unsigned offset = field->wire_offset;
+
+    if (field->type == MAVLINK_TYPE_CHAR) {
+        // strings are zero padded (the payload starts out zeroed)
+        unsigned maxLen = (field->array_length == 0) ? 1 : field->array_length;
+        PyObject *bytesObj = NULL;
+        Py_buffer view;
+
+        if (PyUnicode_Check(val)) {
+            bytesObj = PyUnicode_AsASCIIString(val);
+            if (bytesObj == NULL)
+                return -1;
+            val = bytesObj;
+        }
+        if (PyObject_GetBuffer(val, &view, PyBUF_SIMPLE) != 0) {
+            Py_XDECREF(bytesObj);
+            return -1;
         }
+        memcpy(&payload[offset], view.buf, (unsigned) view.len < maxLen ? (unsigned) view.len : maxLen);
+        PyBuffer_Release(&view);
+        Py_XDECREF(bytesObj);
+        return 0;
     }
 
-    return list;
+    if (field->array_length == 0)
+        return pyput_value(payload, offset, field, val);
+
+    PyObject *seq = PySequence_Fast(val, "expected a sequence for an array field");
+    if (seq == NULL)
+        return -1;
+    if (PySequence_Fast_GET_SIZE(seq) < field->array_length) {
+        PyErr_Format(MAVNativeError, "field %s needs %u values", PyString_AsString(field->name), field->array_length);
+        Py_DECREF(seq);
+        return -1;
+    }
+
+    unsigned fieldSize = get_field_size(field->type);
+    unsigned index;
+    for(index = 0; index < field->array_length; index++) {
+        if (pyput_value(payload, offset, field, PySequence_Fast_GET_ITEM(seq, index)) != 0) {
+            Py_DECREF(seq);
+            return -1;
+        }
+        offset += fieldSize;
+    }
+    Py_DECREF(seq);
+    return 0;
+}
+
+/**
+  Given a message object and the sequence number, system and component to send it with,
+  encode it using the message info table.
+
+  The message gets a new header, _msgbuf, _payload and _crc as if it had been packed by python.
+
+  @return a bytearray holding the complete frame
+*/
+static PyObject *
+py_pack(NativeConnection *self, PyObject *args)
+{
+    PYTHON_ENTRY
+
+    PyObject *msg;
+    unsigned seq, srcSystem, srcComponent;
+
+    if (!PyArg_ParseTuple(args, "OIII", &msg, &seq, &srcSystem, &srcComponent))
+        return NULL;
+
+    PyObject *header = PyObject_GetAttrString(msg, "_header"); // A new reference
+    if (header == NULL)
+        return NULL;
+    PyObject *id_obj = PyObject_GetAttrString(header, "msgId"); // A new reference
+    if (id_obj == NULL) {
+        Py_DECREF(header);
+        return NULL;
+    }
+    long msgid = PyInt_AsLong(id_obj);
+    Py_DECREF(id_obj);
+    if (msgid < 0 || msgid > 255 || self->info[msgid].name == NULL) {
+        Py_DECREF(header);
+        if (!PyErr_Occurred())
+            PyErr_Format(MAVNativeError, "unknown MAVLink message ID %ld", msgid);
+        return NULL;
+    }
+    const py_message_info_t *info = &self->info[msgid];
+
+    uint8_t frame[MAVLINK_MAX_PACKET_LEN];
+    char *payload = (char *) &frame[MAVLINK_NUM_HEADER_BYTES];
+    memset(frame, 0, sizeof(frame));
+
+    unsigned fnum;
+    for(fnum = 0; fnum < info->num_fields; fnum++) {
+        const py_field_info_t *f = &info->fields[fnum];
+        PyObject *val = PyObject_GetAttr(msg, f->name); // A new reference
+        if (val == NULL || pyput_field(payload, f, val) != 0) {
+            Py_XDECREF(val);
+            Py_DECREF(header);
+            return NULL;
+        }
+        Py_DECREF(val);
+    }
+
+    frame[0] = MAVLINK_STX;
+    frame[1] = info->len;
+    frame[2] = seq;
+    frame[3] = srcSystem;
+    frame[4] = srcComponent;
+    frame[5] = msgid;
+
+    uint16_t crc = crc_calculate(&frame[1], MAVLINK_CORE_HEADER_LEN + info->len);
+#if MAVLINK_CRC_EXTRA
+    crc_accumulate(info->crc_extra, &crc);
+#endif
+    frame[MAVLINK_NUM_HEADER_BYTES + info->len] = crc & 0xFF;
+    frame[MAVLINK_NUM_HEADER_BYTES + info->len + 1] = crc >> 8;
+
+    // give the message a new header of the same class, as MAVLink_message.pack() does
+    PyObject *newHeader = PyObject_CallFunction((PyObject *) Py_TYPE(header), "lIIII",
+                                                msgid, info->len, seq, srcSystem, srcComponent);
+    Py_DECREF(header);
+    if (newHeader == NULL)
+        return NULL;
+    set_attribute(msg, "_header", newHeader);
+    set_attribute(msg, "_payload", PyByteArray_FromStringAndSize(payload, info->len));
+    set_attribute(msg, "_crc", PyInt_FromLong(crc));
+
+    PyObject *result = PyByteArray_FromStringAndSize((const char *) frame, MAVLINK_NUM_NON_PAYLOAD_BYTES + info->len);
+    PyObject_SetAttrString(msg, "_msgbuf", result); // Will increment the reference count
+    return result;
 
     PYTHON_EXIT
 }
 
+/**
+  Accumulate the X.25 CRC over a buffer, or a sequence of ints
+
+  @return the updated crc
+*/
+static PyObject *
+py_x25crc_accumulate(PyObject *module, PyObject *args)
+{
+    PyObject *bufObj;
+    unsigned int crcArg = X25_INIT_CRC;
+
+    if (!PyArg_ParseTuple(args, "O|I", &bufObj, &crcArg))
+        return NULL;
+
+    uint16_t crc = (uint16_t) crcArg;
+
+    if (PyObject_CheckBuffer(bufObj)) {
+        Py_buffer view;
+        if (PyObject_GetBuffer(bufObj, &view, PyBUF_SIMPLE) != 0)
+            return NULL;
+
+        const uint8_t *bytes = (const uint8_t *) view.buf;
+        Py_ssize_t numBytes = view.len;
+        while(numBytes--)
+            crc_accumulate(*bytes++, &crc);
+
+        PyBuffer_Release(&view);
+    }
+    else {
+        // lists of ints (and py2 arrays, which only have old style buffers)
+        PyObject *seq = PySequence_Fast(bufObj, "expected a buffer or a sequence of ints");
+        if (seq == NULL)
+            return NULL;
+
+        Py_ssize_t i, numItems = PySequence_Fast_GET_SIZE(seq);
+        for(i = 0; i < numItems; i++) {
+            long c = PyInt_AsLong(PySequence_Fast_GET_ITEM(seq, i)); // returns a _borrowed_ reference
+            if (c == -1 && PyErr_Occurred()) {
+                Py_DECREF(seq);
+                return NULL;
+            }
+            crc_accumulate((uint8_t) c, &crc);
+        }
+        Py_DECREF(seq);
+    }
+
+    return PyInt_FromLong(crc);
+}
+
 static PyObject *
 NativeConnection_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
@@ -846,10 +1339,7 @@ NativeConnection_init(NativeConnection *self, PyObject *args, PyObject *kwds)
     Py_INCREF(msgclass);
 
     assert(mavlink_map);
-    if(!info_inited) {
-        init_message_info(mavlink_map);
-        info_inited = TRUE;
-    }
+    self->info = get_message_info(mavlink_map);
 
     mavdebug("inited connection\n");
     return 0;
@@ -864,6 +1354,10 @@ static void NativeConnection_dealloc(NativeConnection* self)
 }
 
 static PyMemberDef NativeConnection_members[] = {
+    {"packets_received", T_ULONG, offsetof(NativeConnection, packets_received), READONLY,
+     "number of messages successfully parsed"},
+    {"parse_errors", T_ULONG, offsetof(NativeConnection, parse_errors), READONLY,
+     "number of frames dropped because of a bad length or CRC"},
     {NULL}  /* Sentinel */
 };
 
@@ -880,6 +1374,10 @@ static PyMethodDef NativeConnection_methods[] = {
      "Given a msg class and an array of bytes, Parse chars, returning a message or None"},    
     {"parse_buffer",  (PyCFunction) py_parse_buffer, METH_VARARGS,
      "Given a msg class and a string like object, Parse chars, returning a (possibly empty) list of messages"},
+    {"parse_all",  (PyCFunction) py_parse_all, METH_VARARGS,
+     "Given a buffer, parse all of it, returning a tuple of (list of messages, bytes consumed)"},
+    {"pack",  (PyCFunction) py_pack, METH_VARARGS,
+     "Given a message, sequence number, system and component, return the encoded frame as a bytearray"},
     {NULL,  NULL},
 };
 
@@ -931,6 +1429,12 @@ static PyTypeObject NativeConnectionType = {
     NativeConnection_new,    /* tp_new */
 };
 
+static PyMethodDef ModuleMethods[] = {
+    {"x25crc_accumulate",  (PyCFunction) py_x25crc_accumulate, METH_VARARGS,
+     "Given a buffer (or a sequence of ints) and an optional starting crc, return the accumulated X.25 CRC"},
+    {NULL, NULL, 0, NULL}        /* Sentinel */
+};
+
 #if PY_MAJOR_VERSION >= 3
 #define MOD_RETURN(m) return m
 #else
@@ -948,10 +1452,6 @@ PyMODINIT_FUNC
         MOD_RETURN(NULL);
 
 #if PY_MAJOR_VERSION < 3
-    static PyMethodDef ModuleMethods[] = {
-        {NULL, NULL, 0, NULL}        /* Sentinel */
-    };
-
     PyObject *m = Py_InitModule3("mavnative", ModuleMethods, "Mavnative module");
     if (m == NULL)
         MOD_RETURN(m);
@@ -961,7 +1461,7 @@ PyMODINIT_FUNC
         "mavnative",
         "EMavnative module",
         -1,
-        NULL, NULL, NULL, NULL, NULL
+        ModuleMethods, NULL, NULL, NULL, NULL
     };
 
     PyObject *m = PyModule_Create(&mod_def);
@@ -6,8 +6,8 @@ Copyright Andrew Tridgell 2011
 Released under GNU GPL version 3 or later
 '''
 
-import socket, math, struct, time, os, fnmatch, array, sys, errno
-import select
+import socket, math, struct, time, os, fnmatch, array, sys, errno, re, ast
+import select, threading, collections
 
 # adding these extra imports allows pymavlink to be used directly with pyinstaller
 # without having complex spec files. To allow for installs that don't have ardupilotmega
@@ -18,6 +18,8 @@ try:
 except Exception:
     pass
 
+from .generator import mavcrc
+
 # these imports allow for mavgraph and mavlogdump to use maths expressions more easily
 from math import *
 from .mavextra import *
@@ -52,24 +54,107 @@ def mavlink10():
     '''return True if using MAVLink 1.0'''
     return not 'MAVLINK09' in os.environ
 
+# compiled expressions and conditions, keyed by their source text
+_expression_cache = {}
+_condition_cache = {}
+
+# names in an expression that can be message types
+re_msg_type = re.compile('^[A-Z][A-Z0-9_]*$')
+
+def compile_expression(expression):
+    '''compile an expression, caching the code object'''
+    code = _expression_cache.get(expression)
+    if code is None:
+        code = compile(expression, '<expression>', 'eval')
+        _expression_cache[expression] = code
+    return code
+
 def evaluate_expression(expression, vars):
     '''evaluation an expression'''
     try:
-        v = eval(expression, globals(), vars)
+        v = eval(compile_expression(expression), globals(), vars)
     except NameError:
         return None
     except ZeroDivisionError:
         return None
     return v
 
+def expression_message_types(expression):
+    '''return the message types an expression refers to, or None if
+    it refers to anything else (function calls, MAV or other
+    variables), in which case its value can't be cached'''
+    types = set()
+    for node in ast.walk(ast.parse(expression, mode='eval')):
+        if isinstance(node, ast.Call):
+            return None
+        if isinstance(node, ast.Name):
+            if node.id == 'MAV' or re_msg_type.match(node.id) is None:
+                return None
+            types.add(node.id)
+    return sorted(types)
+
+class mavcondition(object):
+    '''a compiled conditional statement. If it only depends on the
+    fields of messages the last result is kept, and the condition is
+    only evaluated again once one of those messages has been replaced'''
+    def __init__(self, condition):
+        self.condition = condition
+        self.code = compile_expression(condition)
+        self.msg_types = expression_message_types(condition)
+        self.last_msgs = None
+        self.last_value = None
+
+    def evaluate(self, vars):
+        '''evaluate the condition against a dictionary of messages'''
+        if self.msg_types is not None:
+            msgs = tuple([vars.get(t) for t in self.msg_types])
+            last_msgs = self.last_msgs
+            if last_msgs is not None:
+                for i in range(len(msgs)):
+                    if msgs[i] is not last_msgs[i]:
+                        break
+                else:
+                    return self.last_value
+        try:
+            v = eval(self.code, globals(), vars)
+        except NameError:
+            v = None
+        except ZeroDivisionError:
+            v = None
+        if v is None:
+            v = False
+        if self.msg_types is not None:
+            self.last_msgs = msgs
+            self.last_value = v
+        return v
+
 def evaluate_condition(condition, vars):
     '''evaluation a conditional (boolean) statement'''
     if condition is None:
         return True
-    v = evaluate_expression(condition, vars)
-    if v is None:
-        return False
-    return v
+    c = _condition_cache.get(condition)
+    if c is None:
+        c = mavcondition(condition)
+        _condition_cache[condition] = c
+    return c.evaluate(vars)
+
+class message_waiter(object):
+    '''a recv_match() call waiting on a reader thread'''
+    def __init__(self, condition, cond):
+        self.condition = condition
+        self.cond = cond
+        self.msg = None
+        self.error = None
+
+    def check(self, vars):
+        '''see if the latest messages satisfy the condition. Errors are
+        passed back to the waiting thread'''
+        try:
+            return evaluate_condition(self.condition, vars)
+        except Exception as e:
+            self.error = e
+            self.cond.notify()
+            return False
 
 class location(object):
     '''represent a GPS coordinate'''
@@ -111,6 +196,12 @@ def set_dialect(dialect):
 # Set the default dialect. This is done here as it needs to be after the function declaration
 set_dialect(os.environ['MAVLINK_DIALECT'])
 
+# how much the stream connections read from the OS at a time
+READ_AHEAD_SIZE = 65536
+
+# message types set_coalescing() sends without delay
+COALESCE_BYPASS_TYPES = ['HEARTBEAT', 'COMMAND_LONG', 'COMMAND_INT', 'COMMAND_ACK', 'SET_MODE']
+
 class mavfile(object):
     '''a generic mavlink port'''
     def __init__(self, fd, address, source_system=255, notimestamps=False, input=True, use_native=default_native):
@@ -133,6 +224,8 @@ class mavfile(object):
         self.robust_parsing = True
         self.mav = mavlink.MAVLink(self, srcSystem=self.source_system, use_native=use_native)
         self.mav.robust_parsing = self.robust_parsing
+        self.mav.set_filtered_callback(self.filtered_message)
+        self.msgid_filter = None
         self.logfile = None
         self.logfile_raw = None
         self.param_fetch_in_progress = False
@@ -144,6 +237,7 @@ class mavfile(object):
         self.base_mode = 0
         self.timestamp = 0
         self.message_hooks = []
+        self.message_handlers = {}
         self.idle_hooks = []
         self.uptime = 0.0
         self.notimestamps = notimestamps
@@ -157,6 +251,15 @@ class mavfile(object):
         self.mav_count = 0
         self.stop_on_EOF = False
         self.portdead = False
+        self.reader = None
+        self.coalescer = None
+        self.read_ahead = b''
+        self.read_ahead_ofs = 0
+        cls = self.__class__
+        self.subscribe('HEARTBEAT', cls.handle_heartbeat)
+        self.subscribe('PARAM_VALUE', cls.handle_param_value)
+        self.subscribe('SYS_STATUS', cls.handle_sys_status)
+        self.subscribe(['GPS_RAW', 'GPS_RAW_INT'], cls.handle_gps_raw)
 
     def auto_mavlink_version(self, buf):
         '''auto-switch mavlink protocol version'''
@@ -189,6 +292,11 @@ class mavfile(object):
         (self.mav.callback, self.mav.callback_args, self.mav.callback_kwargs) = (callback,
                                                                                  callback_args,
                                                                                  callback_kwargs)
+        self.mav.set_filtered_callback(self.filtered_message)
+        if self.msgid_filter is not None:
+            self.mav.set_msgid_filter(*self.msgid_filter)
+        if self.coalescer is not None:
+            self.mav.file = self.coalescer
 
     def recv(self, n=None):
         '''default recv method'''
@@ -205,6 +313,8 @@ class mavfile(object):
 
     def select(self, timeout):
         '''wait for up to timeout seconds for more data'''
+        if self.read_ahead_ofs < len(self.read_ahead):
+            return True
         if self.fd is None:
             time.sleep(min(timeout,0.5))
             return True
@@ -214,6 +324,35 @@ class mavfile(object):
             return False
         return len(rin) == 1
 
+    # connections that can read whatever is waiting supply
+    # read_port(n), which recv_msg() uses to read ahead
+    read_port = None
+
+    def recv_read_ahead(self, n):
+        '''recv() for recv_msg(). With a read_port() method this returns
+        up to n bytes from the read-ahead buffer, refilling it with a
+        single read_port(READ_AHEAD_SIZE) call when it is empty'''
+        if self.read_port is None:
+            return self.recv(n)
+        if self.read_ahead_ofs >= len(self.read_ahead):
+            data = self.read_port(READ_AHEAD_SIZE)
+            if not data:
+                return ''
+            self.read_ahead = data
+            self.read_ahead_ofs = 0
+        return self.recv_port(n)
+
+    def recv_port(self, n):
+        '''recv() for connections with a read_port() method. Bytes left
+        in the read-ahead buffer by recv_msg() come first, otherwise this
+        is a single read_port(n) call'''
+        if self.read_ahead_ofs < len(self.read_ahead):
+            ofs = self.read_ahead_ofs
+            ret = self.read_ahead[ofs:ofs+n]
+            self.read_ahead_ofs = ofs + len(ret)
+            return ret
+        return self.read_port(n)
+
     def pre_message(self):
         '''default pre message call'''
         return
@@ -222,9 +361,73 @@ class mavfile(object):
         '''enable/disable RTS/CTS if applicable'''
         return
 
+    def set_coalescing(self, max_delay=0.02, max_bytes=1400, bypass_types=COALESCE_BYPASS_TYPES):
+        '''collect outgoing frames and write them together, once max_delay
+        seconds have passed since the first one or max_bytes have been
+        collected. Messages of the types in bypass_types are written
+        straight away, along with anything already collected. The
+        delay is enforced while waiting in recv_match() or by the
+        thread from start_reader(). Otherwise pending frames go out on
+        the next write or flush(). A max_delay of None turns coalescing
+        off'''
+        self.flush()
+        if max_delay is None:
+            self.coalescer = None
+            self.mav.file = self
+            return
+        self.coalescer = mavcoalescer(self, max_delay, max_bytes, bypass_types)
+        self.mav.file = self.coalescer
+
+    def flush(self):
+        '''write any frames held back by set_coalescing()'''
+        if self.coalescer is not None:
+            self.coalescer.flush()
+
+    def coalesce_wait(self, timeout):
+        '''limit a wait of timeout seconds so that it ends when frames
+        held back by set_coalescing() are due to be written. A timeout
+        of None means wait forever'''
+        if self.coalescer is None:
+            return timeout
+        left = self.coalescer.time_left()
+        if left is None or (timeout is not None and timeout < left):
+            return timeout
+        return left
+
+    def set_msgid_filter(self, include_types=None, exclude_types=None, check_crc=True):
+        '''only decode messages of the given types (and not of the
+        excluded types). Other messages are skipped without being decoded,
+        so will not be seen by recv_match() or update self.messages. Types
+        may be given as names or message IDs'''
+        self.msgid_filter = (include_types, exclude_types, check_crc)
+        self.mav.set_msgid_filter(include_types, exclude_types, check_crc)
+
+    def filtered_message(self, header):
+        '''called with the header of each message skipped by the message
+        ID filter'''
+        self.update_seq(header.srcSystem, header.srcComponent, header.seq)
+
+    def update_seq(self, src_system, src_component, seq2):
+        '''update packet loss accounting for a received message'''
+        src_tuple = (src_system, src_component)
+        radio_tuple = (ord('3'), ord('D'))
+        if src_tuple == radio_tuple:
+            return
+        if not src_tuple in self.last_seq:
+            last_seq = -1
+        else:
+            last_seq = self.last_seq[src_tuple]
+        seq = (last_seq+1) % 256
+        if seq != seq2 and last_seq != -1:
+            diff = (seq2 - seq) % 256
+            self.mav_loss += diff
+            #print("lost %u seq=%u seq2=%u last_seq=%u src_system=%u" % (diff, seq, seq2, last_seq, src_system))
+        self.last_seq[src_tuple] = seq2
+        self.mav_count += 1
+
     def post_message(self, msg):
         '''default post message call'''
-        if '_posted' in msg.__dict__:
+        if getattr(msg, '_posted', False):
             return
         msg._posted = True
         msg._timestamp = time.time()
@@ -232,9 +435,10 @@ class mavfile(object):
         if type != 'HEARTBEAT' or (msg.type != mavlink.MAV_TYPE_GCS and msg.type != mavlink.MAV_TYPE_GIMBAL):
             self.messages[type] = msg
 
-        if 'usec' in msg.__dict__:
+        fieldnames = msg.get_fieldnames()
+        if 'usec' in fieldnames:
             self.uptime = msg.usec * 1.0e-6
-        if 'time_boot_ms' in msg.__dict__:
+        if 'time_boot_ms' in fieldnames:
             self.uptime = msg.time_boot_ms * 1.0e-3
 
         if self._timestamp is not None:
@@ -243,49 +447,67 @@ class mavfile(object):
             else:
                 msg._timestamp = self._timestamp
 
-        src_system = msg.get_srcSystem()
-        src_component = msg.get_srcComponent()
-        src_tuple = (src_system, src_component)
-        radio_tuple = (ord('3'), ord('D'))
-        if not (src_tuple == radio_tuple or msg.get_type() == 'BAD_DATA'):
-            if not src_tuple in self.last_seq:
-                last_seq = -1
-            else:
-                last_seq = self.last_seq[src_tuple]
-            seq = (last_seq+1) % 256
-            seq2 = msg.get_seq()
-            if seq != seq2 and last_seq != -1:
-                diff = (seq2 - seq) % 256
-                self.mav_loss += diff
-                #print("lost %u seq=%u seq2=%u last_seq=%u src_system=%u %s" % (diff, seq, seq2, last_seq, src_system, msg.get_type()))
-            self.last_seq[src_tuple] = seq2
-            self.mav_count += 1
-        
+        if msg.get_type() != 'BAD_DATA':
+            self.update_seq(msg.get_srcSystem(), msg.get_srcComponent(), msg.get_seq())
+
         self.timestamp = msg._timestamp
-        if type == 'HEARTBEAT' and msg.get_srcComponent() != mavlink.MAV_COMP_ID_GIMBAL:
-            self.target_system = msg.get_srcSystem()
-            self.target_component = msg.get_srcComponent()
-            if mavlink.WIRE_PROTOCOL_VERSION == '1.0' and msg.type != mavlink.MAV_TYPE_GCS:
-                self.flightmode = mode_string_v10(msg)
-                self.mav_type = msg.type
-                self.base_mode = msg.base_mode
-        elif type == 'PARAM_VALUE':
-            s = str(msg.param_id)
-            self.params[str(msg.param_id)] = msg.param_value
-            if msg.param_index+1 == msg.param_count:
-                self.param_fetch_in_progress = False
-                self.param_fetch_complete = True
-        elif type == 'SYS_STATUS' and mavlink.WIRE_PROTOCOL_VERSION == '0.9':
-            self.flightmode = mode_string_v09(msg)
-        elif type == 'GPS_RAW':
-            if self.messages['HOME'].fix_type < 2:
-                self.messages['HOME'] = msg
-        elif type == 'GPS_RAW_INT':
-            if self.messages['HOME'].fix_type < 3:
-                self.messages['HOME'] = msg
+        handlers = self.message_handlers.get(type)
+        if handlers is not None:
+            for handler in handlers:
+                handler(self, msg)
         for hook in self.message_hooks:
             hook(self, msg)
 
+    def subscribe(self, type, callback):
+        '''call callback(mavfile, msg) for each message of the given
+        type. type can be a string or a list of strings. Unlike
+        message_hooks, callbacks are only called for their own types'''
+        if not isinstance(type, list):
+            type = [type]
+        for t in type:
+            self.message_handlers.setdefault(t, []).append(callback)
+
+    def unsubscribe(self, type, callback):
+        '''remove a callback added with subscribe()'''
+        if not isinstance(type, list):
+            type = [type]
+        for t in type:
+            handlers = self.message_handlers.get(t)
+            if handlers is not None and callback in handlers:
+                handlers.remove(callback)
+                if len(handlers) == 0:
+                    del self.message_handlers[t]
+
+    def handle_heartbeat(self, msg):
+        '''track the target system and flight mode from heartbeats'''
+        if msg.get_srcComponent() == mavlink.MAV_COMP_ID_GIMBAL:
+            return
+        self.target_system = msg.get_srcSystem()
+        self.target_component = msg.get_srcComponent()
+        if mavlink.WIRE_PROTOCOL_VERSION == '1.0' and msg.type != mavlink.MAV_TYPE_GCS:
+            self.flightmode = mode_string_v10(msg)
+            self.mav_type = msg.type
+            self.base_mode = msg.base_mode
+
+    def handle_param_value(self, msg):
+        '''record received parameters'''
+        self.params[str(msg.param_id)] = msg.param_value
+        if msg.param_index+1 == msg.param_count:
+            self.param_fetch_in_progress = False
+            self.param_fetch_complete = True
+
+    def handle_sys_status(self, msg):
+        '''track the flight mode on MAVLink 0.9'''
+        if mavlink.WIRE_PROTOCOL_VERSION == '0.9':
+            self.flightmode = mode_string_v09(msg)
+
+    def handle_gps_raw(self, msg):
+        '''use the first good GPS fix as HOME'''
+        if msg.get_type() == 'GPS_RAW':
+            if self.messages['HOME'].fix_type < 2:
+                self.messages['HOME'] = msg
+        elif self.messages['HOME'].fix_type < 3:
+            self.messages['HOME'] = msg
 
     def packet_loss(self):
         '''packet loss as a percentage'''
@@ -299,7 +521,7 @@ class mavfile(object):
         self.pre_message()
         while True:
             n = self.mav.bytes_needed()
-            s = self.recv(n)
+            s = self.recv_read_ahead(n)
             numnew = len(s)
 
             if numnew != 0:
@@ -328,8 +550,14 @@ class mavfile(object):
         type can be a string or a list of strings'''
         if type is not None and not isinstance(type, list):
             type = [type]
+        if self.coalescer is not None:
+            self.coalescer.flush_due()
+        if self.reader is not None:
+            return self.reader_recv_match(condition, type, blocking, timeout)
         start_time = time.time()
         while True:
+            if self.coalescer is not None:
+                self.coalescer.flush_due()
             if timeout is not None:
                 now = time.time()
                 if now < start_time:
@@ -342,9 +570,9 @@ class mavfile(object):
                     for hook in self.idle_hooks:
                         hook(self)
                     if timeout is None:
-                        self.select(0.05)
+                        self.select(self.coalesce_wait(0.05))
                     else:
-                        self.select(timeout/2)
+                        self.select(self.coalesce_wait(timeout/2))
                     continue
                 return None
             if type is not None and not m.get_type() in type:
@@ -357,6 +585,185 @@ class mavfile(object):
         '''check if a condition is true'''
         return evaluate_condition(condition, self.messages)
 
+    def start_reader(self, queue_size=1000):
+        '''start a thread that reads and posts messages as they arrive.
+        recv_match() then waits to be handed a matching message instead
+        of polling, so several threads can wait on one connection.
+        Messages not taken by a waiting recv_match() are kept for
+        recv_msg() in a queue of up to queue_size messages, dropping the
+        oldest when it is full. Each is queued with the change it made
+        to the latest messages, so a later recv_match() sees the same
+        state as it would have without the thread. Message hooks and
+        subscribers are called from the reader thread'''
+        if self.reader is not None:
+            return
+        self.reader_lock = threading.Lock()
+        # entries are [msg, changes], where changes are the (type, msg)
+        # updates to self.messages since the previous entry. reader_base
+        # is the state before the first entry and reader_pending holds
+        # the changes made after the last one
+        self.reader_queue = collections.deque()
+        self.reader_queue_size = queue_size
+        self.reader_base = self.messages.copy()
+        self.reader_pending = []
+        self.reader_waiters = {}
+        self.reader_dropped = 0
+        self.reader_stopping = False
+        self.reader_done = False
+        self.reader_error = None
+        # the reader thread uses the connection's own recv_msg(), callers
+        # get messages from the queue
+        self.reader_read_msg = self.recv_msg
+        self.recv_msg = self.reader_recv_msg
+        self.reader = threading.Thread(target=self.reader_loop, name='mavfile reader %s' % self.address)
+        self.reader.daemon = True
+        self.reader.start()
+
+    def stop_reader(self):
+        '''stop the reader thread started by start_reader()'''
+        if self.reader is None:
+            return
+        self.reader_stopping = True
+        if self.reader is not threading.current_thread():
+            self.reader.join()
+        self.reader = None
+        del self.recv_msg
+
+    def reader_loop(self):
+        '''body of the reader thread'''
+        try:
+            while not self.reader_stopping:
+                if self.coalescer is not None:
+                    self.coalescer.flush_due()
+                m = self.reader_read_msg()
+                if m is not None:
+                    self.reader_dispatch(m)
+                elif self.fd is None and self.stop_on_EOF:
+                    break
+                else:
+                    self.select(self.coalesce_wait(0.1))
+        except Exception as e:
+            self.reader_error = e
+        with self.reader_lock:
+            self.reader_done = True
+            for waiters in self.reader_waiters.values():
+                for w in waiters:
+                    w.cond.notify()
+
+    def reader_dispatch(self, m):
+        '''hand a new message to the recv_match() calls waiting for its
+        type, or queue it if none of them want it'''
+        with self.reader_lock:
+            type = m.get_type()
+            if self.messages.get(type) is m:
+                self.reader_pending.append((type, m))
+            taken = False
+            for key in (m.get_type(), None):
+                waiters = self.reader_waiters.get(key)
+                if waiters is None:
+                    continue
+                for w in waiters:
+                    if w.msg is None and w.error is None and w.check(self.messages):
+                        w.msg = m
+                        w.cond.notify()
+                        taken = True
+            if taken:
+                if len(self.reader_queue) == 0:
+                    self.reader_apply_pending()
+                return
+            if len(self.reader_queue) == self.reader_queue_size:
+                self.reader_dropped += 1
+                self.reader_remove(0)
+            self.reader_queue.append([m, self.reader_pending])
+            self.reader_pending = []
+
+    def reader_apply_pending(self):
+        '''fold the changes made since the last queued message into the
+        base state. Called with the lock held once the queue is empty'''
+        for (type, m) in self.reader_pending:
+            self.reader_base[type] = m
+        self.reader_pending = []
+
+    def reader_remove(self, i):
+        '''remove entry i from the queue, keeping its changes to the
+        messages for the entries after it'''
+        changes = self.reader_queue[i][1]
+        del self.reader_queue[i]
+        if i == 0:
+            for (type, m) in changes:
+                self.reader_base[type] = m
+        elif i < len(self.reader_queue):
+            self.reader_queue[i][1] = changes + self.reader_queue[i][1]
+        else:
+            self.reader_pending = changes + self.reader_pending
+        if len(self.reader_queue) == 0:
+            self.reader_apply_pending()
+
+    def reader_recv_msg(self):
+        '''return the next queued message, or None'''
+        with self.reader_lock:
+            if len(self.reader_queue) == 0:
+                if self.reader_error is not None:
+                    raise self.reader_error
+                return None
+            m = self.reader_queue[0][0]
+            self.reader_remove(0)
+            return m
+
+    def reader_recv_match(self, condition, type, blocking, timeout):
+        '''recv_match() when the reader thread is running'''
+        with self.reader_lock:
+            if len(self.reader_queue) != 0:
+                messages = None
+                if condition is not None:
+                    messages = self.reader_base.copy()
+                for i in range(len(self.reader_queue)):
+                    (m, changes) = self.reader_queue[i]
+                    if messages is not None:
+                        for (t, msg) in changes:
+                            messages[t] = msg
+                    if type is not None and not m.get_type() in type:
+                        continue
+                    if evaluate_condition(condition, messages):
+                        self.reader_remove(i)
+                        return m
+            if self.reader_done:
+                if self.reader_error is not None:
+                    raise self.reader_error
+                return None
+            if not blocking:
+                return None
+            w = message_waiter(condition, threading.Condition(self.reader_lock))
+            keys = type
+            if keys is None:
+                keys = [None]
+            for k in keys:
+                self.reader_waiters.setdefault(k, []).append(w)
+            try:
+                if timeout is not None:
+                    end_time = time.time() + timeout
+                while w.msg is None and w.error is None and not self.reader_done:
+                    if self.coalescer is not None:
+                        self.coalescer.flush_due()
+                    if timeout is None:
+                        w.cond.wait(self.coalesce_wait(None))
+                    else:
+                        remaining = end_time - time.time()
+                        if remaining <= 0:
+                            break
+                        w.cond.wait(self.coalesce_wait(remaining))
+            finally:
+                for k in keys:
+                    waiters = self.reader_waiters[k]
+                    waiters.remove(w)
+                    if len(waiters) == 0:
+                        del self.reader_waiters[k]
+        if w.error is not None:
+            raise w.error
+        if w.msg is None and self.reader_error is not None:
+            raise self.reader_error
+        return w.msg
+
     def mavlink10(self):
         '''return True if using MAVLink 1.0'''
         return self.WIRE_PROTOCOL_VERSION == "1.0"
@@ -703,6 +1110,64 @@ class mavfile(object):
             return default
         return self.params[name]
 
+class mavcoalescer(object):
+    '''collects the frames written by a MAVLink object and passes them to
+    a mavfile in one write. The frames may be flushed from the reader
+    thread, so the pending data is protected by a lock'''
+    def __init__(self, mfile, max_delay, max_bytes, bypass_types):
+        self.mfile = mfile
+        self.max_delay = max_delay
+        self.max_bytes = max_bytes
+        self.bypass_ids = set()
+        for t in bypass_types:
+            msgid = getattr(mavlink, 'MAVLINK_MSG_ID_' + t, None)
+            if msgid is not None:
+                self.bypass_ids.add(msgid)
+        self.buf = bytearray()
+        self.deadline = None
+        self.lock = threading.RLock()
+
+    def write(self, buf):
+        '''add frames to the pending data. The data is copied, as
+        MAVLink.send_many() reuses its buffer'''
+        with self.lock:
+            if len(self.buf) + len(buf) > self.max_bytes:
+                self.flush()
+            self.buf.extend(buf)
+            header = bytearray(buf[:6])
+            if (len(header) == 6 and header[5] in self.bypass_ids or
+                len(self.buf) >= self.max_bytes):
+                self.flush()
+                return
+            now = time.time()
+            if self.deadline is None:
+                self.deadline = now + self.max_delay
+            elif now >= self.deadline:
+                self.flush()
+
+    def time_left(self):
+        '''return the seconds until the pending data is due to be
+        written, or None if there is nothing pending'''
+        deadline = self.deadline
+        if deadline is None:
+            return None
+        return max(deadline - time.time(), 0)
+
+    def flush_due(self):
+        '''write the pending data if it has waited long enough'''
+        if self.deadline is not None and time.time() >= self.deadline:
+            self.flush()
+
+    def flush(self):
+        '''write the pending data now'''
+        with self.lock:
+            self.deadline = None
+            if len(self.buf) == 0:
+                return
+            buf = self.buf
+            self.buf = bytearray()
+            self.mfile.write(buf)
+
 def set_close_on_exec(fd):
     '''set the clone on exec flag on a file descriptor. Ignore exceptions'''
     try:
@@ -751,12 +1216,15 @@ class mavserial(mavfile):
     def recv(self,n=None):
         if n is None:
             n = self.mav.bytes_needed()
+        return self.recv_port(n)
+
+    def read_port(self, n):
+        '''read up to n bytes that are already waiting'''
         if self.fd is None:
             waiting = self.port.inWaiting()
             if waiting < n:
                 n = waiting
-        ret = self.port.read(n)
-        return ret
+        return self.port.read(n)
 
     def write(self, buf):
         try:
@@ -791,6 +1259,12 @@ class mavserial(mavfile):
             return False
         
 
+# big enough for any UDP datagram
+UDP_MAX_PACKET_LEN = 65535
+# the most datagrams mavudp.recv_pending() reads in one call, so a busy
+# socket can't keep recv_msg() from returning
+UDP_MAX_PENDING = 64
+
 class mavudp(mavfile):
     '''a UDP mavlink socket'''
     def __init__(self, device, input=True, broadcast=False, source_system=255, use_native=default_native):
@@ -810,6 +1284,10 @@ class mavudp(mavfile):
         set_close_on_exec(self.port.fileno())
         self.port.setblocking(0)
         self.last_address = None
+        # one buffer big enough for any datagram, reused for every read
+        self.recv_buf = bytearray(UDP_MAX_PACKET_LEN)
+        self.recv_view = memoryview(self.recv_buf)
+        self.msg_queue = collections.deque()
         mavfile.__init__(self, self.port.fileno(), device, source_system=source_system, input=input, use_native=use_native)
 
     def close(self):
@@ -817,11 +1295,25 @@ class mavudp(mavfile):
 
     def recv(self,n=None):
         try:
-            data, self.last_address = self.port.recvfrom(300)
+            n, self.last_address = self.port.recvfrom_into(self.recv_buf)
         except socket.error as e:
             if e.errno in [ errno.EAGAIN, errno.EWOULDBLOCK, errno.ECONNREFUSED ]:
                 return ""
             raise
+        return self.recv_buf[:n]
+
+    def recv_pending(self, max_datagrams=UDP_MAX_PENDING):
+        '''read the datagrams waiting on the socket, up to max_datagrams
+        of them, returning their contents joined together'''
+        data = bytearray()
+        for i in range(max_datagrams):
+            try:
+                n, self.last_address = self.port.recvfrom_into(self.recv_buf)
+            except socket.error as e:
+                if e.errno in [ errno.EAGAIN, errno.EWOULDBLOCK, errno.ECONNREFUSED ]:
+                    break
+                raise
+            data.extend(self.recv_view[:n])
         return data
 
     def write(self, buf):
@@ -835,19 +1327,22 @@ class mavudp(mavfile):
             pass
 
     def recv_msg(self):
-        '''message receive routine for UDP link'''
+        '''message receive routine for UDP link. All pending datagrams
+        are parsed at once, and the messages returned one at a time'''
         self.pre_message()
-        s = self.recv()
-        if len(s) == 0:
-            return None
-        if self.first_byte:
-            self.auto_mavlink_version(s)
-        msg = self.mav.parse_buffer(s)
-        if msg is not None:
-            for m in msg:
-                self.post_message(m)
-            return msg[0]
-        return None
+        if len(self.msg_queue) == 0:
+            s = self.recv_pending()
+            if len(s) == 0:
+                return None
+            if self.first_byte:
+                self.auto_mavlink_version(s)
+            msgs = self.mav.parse_buffer(s)
+            if msgs is None:
+                return None
+            self.msg_queue.extend(msgs)
+        m = self.msg_queue.popleft()
+        self.post_message(m)
+        return m
 
 
 class mavtcp(mavfile):
@@ -883,6 +1378,10 @@ class mavtcp(mavfile):
     def recv(self,n=None):
         if n is None:
             n = self.mav.bytes_needed()
+        return self.recv_port(n)
+
+    def read_port(self, n):
+        '''read up to n bytes that are already waiting'''
         try:
             data = self.port.recv(n)
         except socket.error as e:
@@ -973,12 +1472,25 @@ class mavlogfile(mavfile):
             (tusec,) = struct.unpack('>Q', tbuf)
             t = tusec * 1.0e-6
             if (self._last_timestamp is not None and
+                self._last_message is not None and
                 self._last_message.get_type() == "BAD_DATA" and
                 abs(t - self._last_timestamp) > 3*24*60*60):
                 t = self.scan_timestamp(tbuf)
             self._link = tusec & 0x3
         self._timestamp = t
 
+    def filtered_message(self, header):
+        '''skip the rest of a filtered message and read the timestamp of the next one'''
+        super(mavlogfile, self).filtered_message(header)
+        if self.planner_format:
+            self.f.read(1) # trailing newline
+        # the skipped frame was good, so keep the timestamp checks in
+        # pre_message() in step with an unfiltered read
+        self.timestamp = self._timestamp
+        self._last_message = None
+        self._last_timestamp = self._timestamp
+        self.pre_message()
+
     def post_message(self, msg):
         '''add timestamp to message'''
         # read the timestamp
@@ -991,6 +1503,38 @@ class mavlogfile(mavfile):
             self._last_timestamp = msg._timestamp
 
 
+class mavmmaplog(mavlogfile):
+    '''a read only tlog reader that parses timestamps and frames
+    straight from the file mapped into memory. The mmap object is
+    used as the file, so f.tell() and f.seek() work as they do for
+    mavlogfile'''
+    def __init__(self, filename, robust_parsing=True, notimestamps=False, source_system=255, use_native=default_native):
+        import mmap
+        mavlogfile.__init__(self, filename, robust_parsing=robust_parsing, notimestamps=notimestamps,
+                            source_system=source_system, use_native=use_native)
+        self.log_file = self.f
+        self.f = mmap.mmap(self.log_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        self.f.close()
+        self.log_file.close()
+
+    def recv(self,n=None):
+        if n is None:
+            n = self.mav.bytes_needed()
+        data = self.f
+        if self.mav.buf_len() == 0:
+            # at the start of a frame, so hand the parser all of it at once
+            ofs = data.tell()
+            if ofs + 2 <= len(data):
+                (magic, mlen) = struct.unpack_from('BB', data, ofs)
+                if magic == mavlink.PROTOCOL_MARKER and mlen + 8 > n:
+                    n = mlen + 8
+        return data.read(n)
+
+    def write(self, buf):
+        raise RuntimeError('mavmmaplog is read only')
+
 class mavmemlog(mavfile):
     '''a MAVLink log in memory. This allows loading a log into
     memory to make it easier to do multiple sweeps over a log'''
@@ -1023,6 +1567,110 @@ class mavmemlog(mavfile):
         self.percent = 0
         self.messages = {}
 
+def tlog_to_columns(filename, types=None, check_crc=True, dialect=None):
+    '''read a telemetry log into numpy arrays, one column per field.
+
+    Returns a dictionary indexed by message type. Each entry is a
+    dictionary of numpy arrays indexed by field name, plus a '_timestamp'
+    column giving the log time of each message in seconds. The log must have
+    the usual 8 byte timestamp before each message.
+
+    Frame boundaries are found with one scan of the file, then the payloads
+    of each wanted type are gathered and converted using the numpy_dtype of
+    the message class. If check_crc is set then frames of the wanted types
+    with a bad CRC are dropped'''
+    import numpy, mmap
+
+    if dialect is not None:
+        set_dialect(dialect)
+    wanted = {}
+    for msgId, cls in mavlink.mavlink_map.items():
+        if types is None or cls.name in types:
+            wanted[msgId] = cls
+    offset_type = 'L'
+    if array.array(offset_type).itemsize < 8:
+        offset_type = 'Q'
+    offsets = {}
+    for msgId in wanted:
+        offsets[msgId] = array.array(offset_type)
+
+    f = open(filename, 'rb')
+    size = os.fstat(f.fileno()).st_size
+    if size == 0:
+        f.close()
+        return {}
+    buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # each record is an 8 byte timestamp, then a frame of 8 bytes plus the payload
+    record_header = struct.Struct('>QBBBBBB')
+    unpack_header = record_header.unpack_from
+    marker = mavlink.PROTOCOL_MARKER
+    ofs = 0
+    last = size - 16
+    while ofs <= last:
+        (tusec, magic, mlen, seq, srcSystem, srcComponent, msgId) = unpack_header(buf, ofs)
+        if magic != marker:
+            # resync a byte at a time
+            ofs += 1
+            continue
+        end = ofs + mlen + 16
+        if msgId in wanted:
+            if end > size or mlen != wanted[msgId].unpacker.size:
+                ofs += 1
+                continue
+            offsets[msgId].append(ofs)
+        ofs = end
+
+    data = numpy.frombuffer(buf, dtype=numpy.uint8)
+    ret = {}
+    for msgId in offsets:
+        if len(offsets[msgId]) == 0:
+            continue
+        cls = wanted[msgId]
+        mlen = cls.unpacker.size
+        offs = numpy.array(offsets[msgId], dtype=numpy.int64)
+        # the frames without the timestamp and magic byte, as covered by the CRC
+        frames = gather_records(data, offs + 9, mlen + 7)
+        if check_crc:
+            good = _check_crcs(frames, cls.crc_extra)
+            offs = offs[good]
+            frames = frames[good]
+        tusec = gather_records(data, offs, 8).view('>u8')[:,0]
+        payload = numpy.ascontiguousarray(frames[:,5:5+mlen]).view(numpy.dtype(cls.numpy_dtype))[:,0]
+        columns = { '_timestamp' : tusec * 1.0e-6 }
+        for name in cls.fieldnames:
+            columns[name] = payload[name]
+        ret[cls.name] = columns
+    del data
+    buf.close()
+    f.close()
+    return ret
+
+def _check_crcs(frames, crc_extra):
+    '''check the CRCs of a 2D array of frames of the same length, one frame
+    per row starting after the magic byte. The CRC is worked out for all
+    the frames at once, a byte position at a time. Returns a boolean array
+    saying which frames are good'''
+    import numpy
+    table = numpy.array(mavcrc.crc_table, dtype=numpy.uint16)
+    crc = numpy.empty(len(frames), dtype=numpy.uint16)
+    crc.fill(0xffff)
+    for i in range(frames.shape[1] - 2):
+        crc = (crc >> 8) ^ table[(crc ^ frames[:,i]) & 0xFF]
+    if mavlink.WIRE_PROTOCOL_VERSION != '0.9':
+        crc = (crc >> 8) ^ table[(crc ^ crc_extra) & 0xFF]
+    return crc == (frames[:,-2] | (frames[:,-1].astype(numpy.uint16) << 8))
+
+def gather_records(data, offsets, length, chunk_size=65536):
+    '''copy length bytes from each offset in a numpy byte array into the
+    rows of a 2D array, in chunks to limit the size of the index arrays'''
+    import numpy
+    ret = numpy.empty((len(offsets), length), dtype=numpy.uint8)
+    columns = numpy.arange(length)
+    for i in range(0, len(offsets), chunk_size):
+        ret[i:i+chunk_size] = data[offsets[i:i+chunk_size,None] + columns]
+    return ret
+
 class mavchildexec(mavfile):
     '''a MAVLink child processes reader/writer'''
     def __init__(self, filename, source_system=255, use_native=default_native):
@@ -1045,8 +1693,14 @@ class mavchildexec(mavfile):
         self.child.close()
 
     def recv(self,n=None):
+        if n is None:
+            n = self.mav.bytes_needed()
+        return self.recv_port(n)
+
+    def read_port(self, n):
+        '''read up to n bytes that are already waiting'''
         try:
-            x = self.child.stdout.read(1)
+            x = os.read(self.fd, n)
         except Exception:
             return ''
         return x
@@ -1059,22 +1713,16 @@ def mavlink_connection(device, baud=115200, source_system=255,
                        planner_format=None, write=False, append=False,
                        robust_parsing=True, notimestamps=False, input=True,
                        dialect=None, autoreconnect=False, zero_time_base=False,
-                       retries=3, use_native=default_native):
-    '''open a serial, UDP, TCP or file mavlink connection'''
+                       retries=3, use_native=default_native,
+                       include_types=None, exclude_types=None, filter_crc=True):
+    '''open a serial, UDP, TCP or file mavlink connection
+
+    include_types and exclude_types select which MAVLink messages are
+    decoded, other messages are skipped after reading their header'''
     global mavfile_global
 
     if dialect is not None:
         set_dialect(dialect)
-    if device.startswith('tcp:'):
-        return mavtcp(device[4:], source_system=source_system, retries=retries, use_native=use_native)
-    if device.startswith('udpin:'):
-        return mavudp(device[6:], input=True, source_system=source_system, use_native=use_native)
-    if device.startswith('udpout:'):
-        return mavudp(device[7:], input=False, source_system=source_system, use_native=use_native)
-    # For legacy purposes we accept the following syntax and let the caller to specify direction
-    if device.startswith('udp:'):
-        return mavudp(device[4:], input=input, source_system=source_system, use_native=use_native)
-
     if device.lower().endswith('.bin') or device.lower().endswith('.px4log'):
         # support dataflash logs
         from pymavlink import DFReader
@@ -1093,17 +1741,33 @@ def mavlink_connection(device, baud=115200, source_system=255,
     # list of suffixes to prevent setting DOS paths as UDP sockets
     logsuffixes = ['mavlink', 'log', 'raw', 'tlog' ]
     suffix = device.split('.')[-1].lower()
-    if device.find(':') != -1 and not suffix in logsuffixes:
-        return mavudp(device, source_system=source_system, input=input, use_native=use_native)
-    if os.path.isfile(device):
-        if device.endswith(".elf") or device.find("/bin/") != -1:
-            print("executing '%s'" % device)
-            return mavchildexec(device, source_system=source_system, use_native=use_native)
-        else:
-            return mavlogfile(device, planner_format=planner_format, write=write,
-                              append=append, robust_parsing=robust_parsing, notimestamps=notimestamps,
-                              source_system=source_system, use_native=use_native)
-    return mavserial(device, baud=baud, source_system=source_system, autoreconnect=autoreconnect, use_native=use_native)
+    if device.startswith('tcp:'):
+        m = mavtcp(device[4:], source_system=source_system, retries=retries, use_native=use_native)
+    elif device.startswith('udpin:'):
+        m = mavudp(device[6:], input=True, source_system=source_system, use_native=use_native)
+    elif device.startswith('udpout:'):
+        m = mavudp(device[7:], input=False, source_system=source_system, use_native=use_native)
+    # For legacy purposes we accept the following syntax and let the caller to specify direction
+    elif device.startswith('udp:'):
+        m = mavudp(device[4:], input=input, source_system=source_system, use_native=use_native)
+    elif device.find(':') != -1 and not suffix in logsuffixes:
+        m = mavudp(device, source_system=source_system, input=input, use_native=use_native)
+    elif os.path.isfile(device) and (device.endswith(".elf") or device.find("/bin/") != -1):
+        print("executing '%s'" % device)
+        m = mavchildexec(device, source_system=source_system, use_native=use_native)
+    elif (os.path.isfile(device) and suffix == 'tlog' and not write and not append and
+          not planner_format and os.path.getsize(device) > 0):
+        m = mavmmaplog(device, robust_parsing=robust_parsing, notimestamps=notimestamps,
+                       source_system=source_system, use_native=use_native)
+    elif os.path.isfile(device):
+        m = mavlogfile(device, planner_format=planner_format, write=write,
+                       append=append, robust_parsing=robust_parsing, notimestamps=notimestamps,
+                       source_system=source_system, use_native=use_native)
+    else:
+        m = mavserial(device, baud=baud, source_system=source_system, autoreconnect=autoreconnect, use_native=use_native)
+    if include_types is not None or exclude_types is not None:
+        m.set_msgid_filter(include_types, exclude_types, filter_crc)
+    return m
 
 class periodic_event(object):
     '''a class for fixed frequency events'''
@@ -1414,26 +2078,17 @@ def mode_string_px4(mode_number):
         return mode_mapping_px4[mode_number]
     return "Mode(%u)" % mode_number
 
-class x25crc(object):
+class x25crc(mavcrc.x25crc):
     '''x25 CRC - based on checksum.h from mavlink library'''
     def __init__(self, buf=''):
-        self.crc = 0xffff
-        self.accumulate(buf)
+        mavcrc.x25crc.__init__(self, buf)
 
     def accumulate(self, buf):
         '''add in some more bytes'''
-        bytes = array.array('B')
-        if isinstance(buf, array.array):
-            bytes.extend(buf)
+        if isinstance(buf, str):
+            self.accumulate_str(buf)
         else:
-            bytes.fromstring(buf)
-        accum = self.crc
-        for b in bytes:
-            tmp = b ^ (accum & 0xff)
-            tmp = (tmp ^ (tmp<<4)) & 0xFF
-            accum = (accum>>8) ^ (tmp<<8) ^ (tmp<<3) ^ (tmp>>4)
-            accum = accum & 0xFFFF
-        self.crc = accum
+            mavcrc.x25crc.accumulate(self, buf)
 
 class MavlinkSerialPort():
         '''an object that looks like a serial port, but
@@ -0,0 +1,3 @@
+'''Unit tests for pymavlink. Run with "python -m pytest tests" or
+"python -m unittest discover tests" from the pymavlink directory, after
+the dialects have been generated by setup.py'''
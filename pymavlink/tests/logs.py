@@ -0,0 +1,109 @@
+'''helpers to write synthetic logs for the tests'''
+
+import random, struct
+
+from pymavlink import mavutil
+
+
+class membuf(object):
+    '''a file-like object that keeps everything written to it'''
+    def __init__(self):
+        self.buf = bytearray()
+
+    def write(self, buf):
+        self.buf.extend(buf)
+
+
+def sample_frames(count):
+    '''return count rounds of HEARTBEAT, ATTITUDE, GPS_RAW_INT, SYS_STATUS
+    and VFR_HUD frames, as a list of bytearrays'''
+    mavlink = mavutil.mavlink
+    out = membuf()
+    mav = mavlink.MAVLink(out, 1, 1)
+    msgs = []
+    for i in range(count):
+        msgs.extend([mavlink.MAVLink_heartbeat_message(1, 3, 81, 4, 5, 3),
+                     mavlink.MAVLink_attitude_message(i, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6),
+                     mavlink.MAVLink_gps_raw_int_message(i, 3, -353632610, 1491652300, 584000, 1, 2, 3, 4, 10),
+                     mavlink.MAVLink_sys_status_message(*range(13)),
+                     mavlink.MAVLink_vfr_hud_message(1, 2, 90, 50, 123.5, 0)])
+    frames = []
+    for m in msgs:
+        out.buf = bytearray()
+        mav.send(m)
+        frames.append(out.buf)
+    return frames
+
+
+def write_tlog(filename, count, junk=0, seed=1):
+    '''write a tlog of count rounds of sample_frames() with timestamps 10ms
+    apart. If junk is given that many runs of junk bytes are inserted at
+    random places'''
+    data = bytearray()
+    t = 1400000000.0
+    for frame in sample_frames(count):
+        t += 0.01
+        data.extend(struct.pack('>Q', int(t*1.0e6)))
+        data.extend(frame)
+    r = random.Random(seed)
+    for ofs in sorted(r.sample(range(100, len(data)-100), junk), reverse=True):
+        data[ofs:ofs] = bytearray([r.choice([0xfe, 0x55, 0, 0xff]) for i in range(r.randrange(1, 12))])
+    f = open(filename, 'wb')
+    f.write(data)
+    f.close()
+
+
+# the formats written by write_bin(): type, name, format and columns
+BIN_FORMATS = [
+    (128, 'FMT', 'BBnNZ', 'Type,Length,Name,Format,Columns'),
+    (129, 'PARM', 'QNf', 'TimeUS,Name,Value'),
+    (130, 'GPS', 'QBIHBcLLeeEefB', 'TimeUS,Status,GMS,GWk,NSats,HDop,Lat,Lng,RAlt,Alt,Spd,GCrs,VZ,U'),
+    (131, 'IMU', 'QffffffIIfBB', 'TimeUS,GyrX,GyrY,GyrZ,AccX,AccY,AccZ,ErrG,ErrA,Temp,GyHlt,AcHlt'),
+    (132, 'ATT', 'QccccCCCC', 'TimeUS,DesRoll,Roll,DesPitch,Pitch,DesYaw,Yaw,ErrRP,ErrYaw'),
+    (133, 'MSG', 'QZ', 'TimeUS,Message'),
+    (134, 'MODE', 'QMBB', 'TimeUS,Mode,ModeNum,Rsn'),
+    (135, 'STRT', 'BB', 'Type,Num'),
+]
+
+BIN_STRUCT = { 'b' : 'b', 'B' : 'B', 'h' : 'h', 'H' : 'H', 'i' : 'i', 'I' : 'I',
+               'f' : 'f', 'n' : '4s', 'N' : '16s', 'Z' : '64s', 'c' : 'h', 'C' : 'H',
+               'e' : 'i', 'E' : 'I', 'L' : 'i', 'M' : 'b', 'q' : 'q', 'Q' : 'Q' }
+
+
+def write_bin(filename, count, garbage=False, gps=True):
+    '''write a DataFlash log with count IMU messages 2.5ms apart, and
+    ATT, GPS, STRT and MODE messages at lower rates. STRT has no
+    timestamp of its own. With garbage 5000 random bytes are written
+    half way through the log'''
+    structs = {}
+    for (t, name, fmt, cols) in BIN_FORMATS:
+        structs[name] = (t, struct.Struct('<' + ''.join([BIN_STRUCT[c] for c in fmt])))
+    data = bytearray()
+    def add(name, *vals):
+        (t, s) = structs[name]
+        data.extend(struct.pack('BBB', 0xA3, 0x95, t) + s.pack(*vals))
+    for (t, name, fmt, cols) in BIN_FORMATS:
+        add('FMT', t, structs[name][1].size + 3, name.encode('ascii'),
+            fmt.encode('ascii'), cols.encode('ascii'))
+    add('MSG', 0, b'ArduCopter V3.3')
+    for i in range(20):
+        add('PARM', 0, ('P%u' % i).encode('ascii'), i * 0.5)
+    t = 1000000
+    for i in range(count):
+        t += 2500
+        add('IMU', t, i*0.001, 0.1, 0.2, 0.3, 0.4, -9.8, 0, 0, 25.0, 1, 1)
+        if i % 10 == 0:
+            add('ATT', t, 0, i % 3000, 0, -(i % 2000), 0, i % 36000, 0, 0)
+        if i % 97 == 0:
+            add('STRT', 1, i % 200)
+        if gps and i % 50 == 0:
+            add('GPS', t, 3, 300000000 + t//1000, 1850, 10, 120, -353632610, 1491652300,
+                1000, 58400, 500, 9000, 0.1, 1)
+        if i == count//2:
+            add('MODE', t, 5, 5, 1)
+            if garbage:
+                r = random.Random(1)
+                data.extend(bytearray([r.randrange(256) for j in range(5000)]))
+    f = open(filename, 'wb')
+    f.write(data)
+    f.close()
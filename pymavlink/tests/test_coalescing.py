@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for coalescing outgoing frames
+"""
+
+from __future__ import print_function
+import time, unittest
+
+from pymavlink import mavutil
+
+
+class CoalescingTest(unittest.TestCase):
+
+    """
+    Class to test mavfile.set_coalescing() over a UDP link
+    """
+
+    def setUp(self):
+        self.gcs = mavutil.mavlink_connection('udpin:127.0.0.1:14907', source_system=255)
+        self.veh = mavutil.mavlink_connection('udpout:127.0.0.1:14907', source_system=1)
+        self.length = len(self.veh.mav.attitude_encode(0, 0, 0, 0, 0, 0, 0).pack(self.veh.mav))
+
+    def tearDown(self):
+        self.gcs.close()
+        self.veh.close()
+
+    def send(self, count):
+        for i in range(count):
+            self.veh.mav.attitude_send(i, 0, 0, 0, 0, 0, 0)
+
+    def datagrams(self):
+        '''return the sizes of the datagrams the gcs has received'''
+        time.sleep(0.1)
+        sizes = []
+        while True:
+            data = self.gcs.recv_pending(1)
+            if len(data) == 0:
+                return sizes
+            sizes.append(len(data))
+
+    def test_max_delay(self):
+        """frames are held until flush() or a recv_match() after max_delay"""
+        self.veh.set_coalescing(max_delay=0.2)
+        self.send(5)
+        self.assertEqual(self.datagrams(), [])
+        self.assertTrue(0 < self.veh.coalesce_wait(10) <= 0.2)
+        self.assertEqual(self.veh.coalesce_wait(0.01), 0.01)
+        self.veh.flush()
+        self.assertEqual(self.veh.coalesce_wait(10), 10)
+        self.assertEqual(self.datagrams(), [5 * self.length])
+
+        self.send(3)
+        self.veh.recv_match(type='HEARTBEAT', blocking=True, timeout=0.5)
+        self.assertEqual(self.datagrams(), [3 * self.length])
+
+    def test_max_bytes(self):
+        """frames are written once max_bytes would be exceeded"""
+        self.veh.set_coalescing(max_delay=10, max_bytes=4 * self.length)
+        self.send(10)
+        self.veh.flush()
+        self.assertEqual(self.datagrams(), [4 * self.length, 4 * self.length, 2 * self.length])
+
+    def test_bypass(self):
+        """bypass types are written straight away with any pending frames"""
+        self.veh.set_coalescing(max_delay=10)
+        self.send(2)
+        self.veh.mav.command_long_send(1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+        command = len(self.veh.mav.command_long_encode(1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0).pack(self.veh.mav))
+        self.assertEqual(self.datagrams(), [2 * self.length + command])
+        self.veh.set_coalescing(max_delay=10, bypass_types=[])
+        self.veh.mav.command_long_send(1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0)
+        self.assertEqual(self.datagrams(), [])
+        self.veh.flush()
+        self.assertEqual(self.datagrams(), [command])
+
+    def test_disable(self):
+        """a max_delay of None writes pending frames and turns coalescing off"""
+        self.veh.set_coalescing(max_delay=10)
+        self.send(3)
+        self.veh.set_coalescing(max_delay=None)
+        self.assertEqual(self.datagrams(), [3 * self.length])
+        self.send(2)
+        self.assertEqual(self.datagrams(), [self.length, self.length])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for compiled expressions and conditions
+"""
+
+from __future__ import print_function
+import os, shutil, tempfile, unittest
+
+from pymavlink import mavutil
+from pymavlink.tests import logs
+
+
+class ConditionsTest(unittest.TestCase):
+
+    """
+    Class to test evaluate_expression() and evaluate_condition()
+    """
+
+    def attitude(self, roll):
+        return mavutil.mavlink.MAVLink_attitude_message(0, roll, 0.5, 0, 0, 0, 0)
+
+    def test_expression(self):
+        """expressions are evaluated with the math functions, and errors give None"""
+        vars = { 'ATTITUDE' : self.attitude(2.0) }
+        self.assertEqual(mavutil.evaluate_expression('ATTITUDE.roll * 2', vars), 4.0)
+        self.assertEqual(mavutil.evaluate_expression('sqrt(ATTITUDE.roll * 8)', vars), 4.0)
+        self.assertIsNone(mavutil.evaluate_expression('VFR_HUD.alt', vars))
+        self.assertIsNone(mavutil.evaluate_expression('ATTITUDE.roll / 0', vars))
+        self.assertTrue('ATTITUDE.roll * 2' in mavutil._expression_cache)
+
+    def test_message_types(self):
+        """the message types a condition depends on are found"""
+        self.assertEqual(mavutil.expression_message_types('ATTITUDE.roll > 1 and GPS_RAW_INT.fix_type == 3'),
+                         ['ATTITUDE', 'GPS_RAW_INT'])
+        self.assertIsNone(mavutil.expression_message_types('abs(ATTITUDE.roll) > 1'))
+        self.assertIsNone(mavutil.expression_message_types('MAV.flightmode == "AUTO"'))
+        self.assertIsNone(mavutil.expression_message_types('ATTITUDE.roll > x'))
+
+    def test_condition(self):
+        """a cached condition changes when the messages it depends on are replaced"""
+        self.assertTrue(mavutil.evaluate_condition(None, {}))
+        condition = 'ATTITUDE.roll > 1'
+        vars = {}
+        self.assertFalse(mavutil.evaluate_condition(condition, vars))
+        vars['ATTITUDE'] = self.attitude(2.0)
+        self.assertTrue(mavutil.evaluate_condition(condition, vars))
+        self.assertTrue(mavutil.evaluate_condition(condition, vars))
+        vars['ATTITUDE'] = self.attitude(0.0)
+        self.assertFalse(mavutil.evaluate_condition(condition, vars))
+        # conditions on other variables are evaluated every time
+        vars['x'] = 1
+        self.assertTrue(mavutil.evaluate_condition('x == 1', vars))
+        vars['x'] = 2
+        self.assertFalse(mavutil.evaluate_condition('x == 1', vars))
+
+    def test_recv_match(self):
+        """recv_match() with a condition gives the messages a plain filter does"""
+        tmpdir = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(tmpdir, 'test.tlog')
+            logs.write_tlog(filename, 100)
+            mlog = mavutil.mavlink_connection(filename)
+            got = []
+            while True:
+                m = mlog.recv_match(type='HEARTBEAT', condition='ATTITUDE.time_boot_ms % 10 == 3')
+                if m is None:
+                    break
+                got.append(mlog.messages['ATTITUDE'].time_boot_ms)
+            mlog.close()
+            # each HEARTBEAT comes before the ATTITUDE of its round
+            self.assertEqual(got, list(range(3, 100, 10)))
+        finally:
+            shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for the X.25 CRC
+"""
+
+from __future__ import print_function
+import array, random, unittest
+
+from pymavlink import mavutil
+from pymavlink.generator import mavcrc
+
+
+def bitwise_crc(buf, crc=0xffff):
+    """the bitwise CRC update from checksum.h"""
+    for b in bytearray(buf):
+        tmp = b ^ (crc & 0xff)
+        tmp = (tmp ^ (tmp << 4)) & 0xff
+        crc = ((crc >> 8) ^ (tmp << 8) ^ (tmp << 3) ^ (tmp >> 4)) & 0xffff
+    return crc
+
+
+class CrcTest(unittest.TestCase):
+
+    """
+    Class to test mavcrc.x25crc with and without mavnative
+    """
+
+    def check(self):
+        self.assertEqual(mavcrc.x25crc(bytearray(b'123456789')).crc, 0x6f91)
+        r = random.Random(1)
+        for n in [0, 1, 2, 7, 100, 1000]:
+            data = bytearray([r.randrange(256) for i in range(n)])
+            expected = bitwise_crc(data)
+            for buf in [data, bytes(data), list(data), array.array('B', data)]:
+                self.assertEqual(mavcrc.x25crc(buf).crc, expected)
+            crc = mavcrc.x25crc()
+            crc.accumulate(data[:n//2])
+            crc.accumulate(data[n//2:])
+            self.assertEqual(crc.crc, expected)
+            self.assertEqual(mavutil.x25crc(bytes(data)).crc, expected)
+        crc = mavcrc.x25crc()
+        crc.accumulate_str('hello')
+        self.assertEqual(crc.crc, bitwise_crc(b'hello'))
+        self.assertEqual(mavutil.x25crc('hello').crc, bitwise_crc(b'hello'))
+
+    def test_table(self):
+        """the table driven CRC matches the bitwise one"""
+        native = mavcrc.native_accumulate
+        mavcrc.native_accumulate = None
+        try:
+            self.check()
+        finally:
+            mavcrc.native_accumulate = native
+
+    def test_native(self):
+        """the mavnative CRC matches the bitwise one"""
+        if mavcrc.native_accumulate is None:
+            self.skipTest("mavnative is not built")
+        self.check()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for reading binary DataFlash logs
+"""
+
+from __future__ import print_function
+import mmap, os, shutil, tempfile, unittest
+
+from pymavlink import DFReader
+from pymavlink.tests import logs
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class DFReader_full_clock(DFReader.DFReader_binary):
+    '''a reader that finds the clock by decoding every message'''
+    init_clock_calls = 0
+
+    def init_clock(self):
+        DFReader_full_clock.init_clock_calls += 1
+        DFReader.DFReader_binary.init_clock(self)
+
+    _clock_messages = DFReader.DFReader._clock_messages
+
+
+class DFReaderTest(unittest.TestCase):
+
+    """
+    Class to test DFReader_binary
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'test.bin')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def read_all(self, log, type=None, condition=None):
+        """Read the matching messages in a log with their timestamps and the flight mode"""
+        ret = []
+        while True:
+            m = log.recv_match(type=type, condition=condition)
+            if m is None:
+                break
+            ret.append((str(m), m._timestamp, log.flightmode))
+        return ret
+
+    def test_mmap(self):
+        """the log is mapped and every message is read"""
+        logs.write_bin(self.filename, 1000)
+        log = DFReader.DFReader_binary(self.filename)
+        self.assertTrue(isinstance(log.data_map, mmap.mmap))
+        counts = {}
+        while True:
+            m = log.recv_msg()
+            if m is None:
+                break
+            counts[m.get_type()] = counts.get(m.get_type(), 0) + 1
+        self.assertEqual(counts, { 'FMT' : 8, 'MSG' : 1, 'PARM' : 20, 'IMU' : 1000, 'ATT' : 100,
+                                   'STRT' : 11, 'GPS' : 20, 'MODE' : 1 })
+        self.assertEqual(log.percent, 100.0)
+        self.assertEqual(log.flightmode, 'LOITER')
+        self.assertEqual(log.param('P3'), 1.5)
+
+    def test_garbage(self):
+        """messages after a block of garbage are still read"""
+        logs.write_bin(self.filename, 1000, garbage=True)
+        log = DFReader.DFReader_binary(self.filename)
+        imu = self.read_all(log, type='IMU')
+        self.assertEqual(len(imu), 1000)
+
+    def test_empty(self):
+        """an empty log can be opened"""
+        open(self.filename, 'wb').close()
+        log = DFReader.DFReader_binary(self.filename)
+        self.assertIsNone(log.recv_msg())
+
+
+    def check_index(self, type, condition=None, use_cache=False):
+        """an indexed recv_match() gives the same messages as a plain one"""
+        log = DFReader.DFReader_binary(self.filename)
+        expected = self.read_all(log, type, condition)
+        log = DFReader.DFReader_binary(self.filename, use_cache=use_cache)
+        log.build_index(use_cache=use_cache)
+        self.assertEqual(self.read_all(log, type, condition), expected)
+        return log
+
+    def test_index(self):
+        """the index is used for types that carry their own timestamp"""
+        logs.write_bin(self.filename, 2000)
+        log = self.check_index('GPS')
+        self.assertTrue(log._index_usable(None, ['GPS']))
+        self.check_index(['IMU', 'ATT'], 'ATT.Roll > 10')
+        self.check_index('IMU', 'MODE.ModeNum == 5')
+        log = self.check_index('STRT')
+        self.assertFalse(log._index_usable(None, ['STRT']))
+        logs.write_bin(self.filename, 2000, garbage=True)
+        self.check_index('GPS')
+
+    def test_index_cache(self):
+        """the index is saved next to the log and reloaded while the log is unchanged"""
+        logs.write_bin(self.filename, 2000)
+        self.check_index('GPS', use_cache=True)
+        self.assertTrue(os.path.exists(self.filename + '.index'))
+        log = DFReader.DFReader_binary(self.filename, use_cache=True)
+        self.assertIsNotNone(log.index_offsets)
+        # a changed log doesn't use the old index
+        logs.write_bin(self.filename, 1000)
+        log = DFReader.DFReader_binary(self.filename)
+        self.assertFalse(log._load_index())
+        self.check_index('GPS', use_cache=True)
+
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_columns(self):
+        """columns() gives the same values and timestamps as the messages"""
+        logs.write_bin(self.filename, 1000)
+        log = DFReader.DFReader_binary(self.filename)
+        msgs = {}
+        while True:
+            m = log.recv_msg()
+            if m is None:
+                break
+            msgs.setdefault(m.get_type(), []).append(m)
+        for (type, fields) in [('IMU', None), ('ATT', ['Roll', 'Pitch', 'Yaw']),
+                               ('GPS', ['Lat', 'Alt', 'GCrs']), ('STRT', None)]:
+            cols = log.columns(type, fields)
+            if fields is None:
+                fields = msgs[type][0].get_fieldnames()
+            self.assertEqual(sorted(cols.keys()), sorted(fields + ['_timestamp']))
+            for f in fields:
+                numpy.testing.assert_allclose(cols[f], [getattr(m, f) for m in msgs[type]])
+            numpy.testing.assert_allclose(cols['_timestamp'], [m._timestamp for m in msgs[type]])
+        self.assertEqual(list(log.columns('PARM', ['Name'])['Name'][:2]), [b'P0', b'P1'])
+        self.assertIsNone(log.columns('XXX'))
+
+
+    def test_clock(self):
+        """the clock found from the headers is the one a full pass finds"""
+        for (gps, zero_time_base) in [(True, False), (True, True), (False, False)]:
+            logs.write_bin(self.filename, 1000, gps=gps)
+            log = DFReader.DFReader_binary(self.filename, zero_time_base=zero_time_base)
+            full = DFReader_full_clock(self.filename, zero_time_base=zero_time_base)
+            self.assertEqual(log._clock_state(), full._clock_state())
+            self.assertEqual(self.read_all(log), self.read_all(full))
+
+    def test_clock_cache(self):
+        """the clock is saved with the index and not worked out again"""
+        logs.write_bin(self.filename, 1000)
+        DFReader_full_clock.init_clock_calls = 0
+        log = DFReader_full_clock(self.filename, use_cache=True)
+        expected = self.read_all(log)
+        self.assertEqual(DFReader_full_clock.init_clock_calls, 1)
+        log = DFReader_full_clock(self.filename, use_cache=True)
+        self.assertEqual(DFReader_full_clock.init_clock_calls, 1)
+        self.assertEqual(self.read_all(log), expected)
+        # the cached clock is only for the same zero_time_base
+        log = DFReader_full_clock(self.filename, zero_time_base=True, use_cache=True)
+        self.assertEqual(DFReader_full_clock.init_clock_calls, 2)
+
+
+    def test_message_class(self):
+        """the fields filled in by the generated classes match DFMessage.__getattr__"""
+        logs.write_bin(self.filename, 200)
+        log = DFReader.DFReader_binary(self.filename)
+        while True:
+            ofs = log.offset
+            m = log.recv_msg()
+            if m is None:
+                break
+            self.assertFalse(hasattr(m, '__dict__'))
+            for apply_multiplier in (True, False):
+                m2 = m.fmt.message_class(m.fmt, m._elements, apply_multiplier)
+                for f in m.get_fieldnames():
+                    self.assertEqual(getattr(m2, f), DFReader.DFMessage.__getattr__(m2, f))
+            self.assertEqual(sorted(m.to_dict().keys()), sorted(m.get_fieldnames() + ['mavpackettype']))
+            if m.get_type() in ['IMU', 'MODE']:
+                self.assertEqual(bytes(m.get_msgbuf()), bytes(log.data[ofs:log.offset]))
+
+    def test_message_class_names(self):
+        """columns that can't be slots are still readable"""
+        fmt = DFReader.DFFormat(140, 'TST', 17, 'Qhih', 'TimeUS,in,A-B,fmt')
+        m = fmt.message_class(fmt, [5, 6, 7, 8], True)
+        self.assertEqual(m.TimeUS, 5)
+        self.assertEqual(getattr(m, 'in'), 6)
+        self.assertEqual(getattr(m, 'A-B'), 7)
+        # a column that clashes with a DFMessage attribute is left alone
+        self.assertTrue(m.fmt is fmt)
+
+
+if __name__ == '__main__':
+    unittest.main()
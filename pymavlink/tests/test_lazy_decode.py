@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for lazily decoded MAVLink messages
+"""
+
+from __future__ import print_function
+import unittest
+
+from pymavlink.dialects.v10 import ardupilotmega as mavlink
+
+
+class LazyDecodeTest(unittest.TestCase):
+
+    """
+    Class to test MAVLink.lazy_decode
+    """
+
+    def decode(self, msg, lazy=True):
+        """Pack a message and decode it again"""
+        buf = msg.pack(mavlink.MAVLink(None, 1, 1))
+        mav = mavlink.MAVLink(None)
+        mav.lazy_decode = lazy
+        return mav.decode(bytearray(buf))
+
+    def test_same_fields(self):
+        """Lazy and eager decoding give the same field values"""
+        msg = mavlink.MAVLink_global_position_int_message(100, -353632610, 1491652300,
+                                                         584000, 10000, 1, 2, 3, 9000)
+        lazy = self.decode(msg)
+        eager = self.decode(msg, lazy=False)
+        self.assertTrue(lazy._lazy)
+        for f in msg.get_fieldnames():
+            self.assertEqual(getattr(lazy, f), getattr(eager, f))
+        self.assertFalse(lazy._lazy)
+        self.assertEqual(lazy.get_srcSystem(), 1)
+        self.assertEqual(lazy.get_type(), 'GLOBAL_POSITION_INT')
+
+    def test_assigned_fields_kept(self):
+        """Fields set before the first read are not overwritten by the decode"""
+        msg = mavlink.MAVLink_global_position_int_message(100, -353632610, 1491652300,
+                                                         584000, 10000, 1, 2, 3, 9000)
+        lazy = self.decode(msg)
+        lazy.alt = 5
+        self.assertEqual(lazy.lat, -353632610)
+        self.assertEqual(lazy.alt, 5)
+
+    def test_class_attribute_fields(self):
+        """Fields named like class attributes are not shadowed"""
+        msg = mavlink.MAVLink_named_value_float_message(5, b'speed', 1.5)
+        lazy = self.decode(msg)
+        self.assertEqual(lazy.name[:5], b'speed')
+        self.assertEqual(lazy.value, 1.5)
+        msg = mavlink.MAVLink_battery_status_message(3, 1, 2, 25, [1]*10, 100, 200, 300, 50)
+        self.assertEqual(self.decode(msg).id, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
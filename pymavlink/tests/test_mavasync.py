@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for the asyncio connections, skipped before python 3.5
+"""
+
+from __future__ import print_function
+import os, shutil, socket, tempfile, threading, unittest
+
+from pymavlink import mavutil
+from pymavlink.tests import logs
+
+try:
+    import asyncio
+    from pymavlink import mavasync
+except (ImportError, SyntaxError):
+    mavasync = None
+
+
+@unittest.skipIf(mavasync is None, "asyncio is not available")
+class MavasyncTest(unittest.TestCase):
+
+    """
+    Class to test the mavasync connections
+    """
+
+    def setUp(self):
+        # a new loop that is never made the current loop, so anything
+        # looking up the loop outside a coroutine will fail
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def run_until_complete(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def close(self, conn):
+        '''close a connection and let the loop finish closing its transport'''
+        conn.close()
+        self.run_until_complete(asyncio.sleep(0))
+
+    def test_udp(self):
+        """messages sent to a udpin connection are received"""
+        conn = self.run_until_complete(mavasync.mavlink_connection('udpin:127.0.0.1:14902'))
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        for buf in logs.sample_frames(2):
+            sock.sendto(bytes(buf), ('127.0.0.1', 14902))
+        sock.close()
+        m = self.run_until_complete(conn.recv_match(type='GPS_RAW_INT', timeout=5))
+        self.assertEqual(m.time_usec, 0)
+        m = self.run_until_complete(conn.recv_match(type='GPS_RAW_INT', timeout=5))
+        self.assertEqual(m.time_usec, 1)
+        self.close(conn)
+        self.assertTrue(conn.closed)
+
+    def test_thread_loop(self):
+        """a connection can be opened on a loop run by another thread"""
+        result = []
+        def run():
+            conn = self.run_until_complete(mavasync.mavlink_connection('tcp:127.0.0.1:14903'))
+            result.append(conn)
+            self.close(conn)
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind(('127.0.0.1', 14903))
+        server.listen(1)
+        try:
+            t = threading.Thread(target=run)
+            t.start()
+            t.join(10)
+        finally:
+            server.close()
+        self.assertEqual(len(result), 1)
+        self.assertTrue(result[0].closed)
+
+    def test_logfile(self):
+        """a tlog reads the same messages as mavlogfile"""
+        tmpdir = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(tmpdir, 'test.tlog')
+            logs.write_tlog(filename, 50)
+            expected = []
+            mlog = mavutil.mavlink_connection(filename)
+            while True:
+                m = mlog.recv_msg()
+                if m is None:
+                    break
+                expected.append(m.get_msgbuf())
+            mlog.close()
+            conn = mavasync.mavlogfile_async(filename, yield_count=10)
+            self.run_until_complete(conn.open())
+            got = []
+            while True:
+                m = self.run_until_complete(conn.recv_match())
+                if m is None:
+                    break
+                got.append(m.get_msgbuf())
+            conn.close()
+            self.assertEqual(got, expected)
+        finally:
+            shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    unittest.main()
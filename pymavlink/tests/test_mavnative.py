@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for the mavnative encoder, skipped when the extension isn't built
+"""
+
+from __future__ import print_function
+import threading, unittest
+
+from pymavlink import mavutil
+from pymavlink.tests import logs
+from pymavlink.tests.logs import membuf
+
+try:
+    import mavnative
+    # the source directory is importable as a namespace package
+    if not hasattr(mavnative, 'NativeConnection'):
+        mavnative = None
+except ImportError:
+    mavnative = None
+
+
+@unittest.skipIf(mavnative is None, "mavnative is not built")
+class MavnativePackTest(unittest.TestCase):
+
+    """
+    Class to test NativeConnection.pack() against MAVLink_message.pack()
+    """
+
+    def test_same_as_python(self):
+        """native pack() gives the same frames as the python encoder"""
+        mavlink = mavutil.mavlink
+        native = mavnative.NativeConnection(mavlink.MAVLink_message, mavlink.mavlink_map)
+        mav = mavlink.MAVLink(membuf(), 1, 1)
+        for m in [mavlink.MAVLink_heartbeat_message(1, 3, 81, 4, 5, 3),
+                  mavlink.MAVLink_attitude_message(10, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6),
+                  mavlink.MAVLink_statustext_message(6, b'hello'),
+                  mavlink.MAVLink_param_set_message(1, 1, b'PARAM_NAME', 1.5, 9)]:
+            buf = m.pack(mav)
+            self.assertEqual(bytes(native.pack(m, mav.seq, 1, 1)), bytes(buf))
+
+    def test_bad_value(self):
+        """an out of range field raises an exception rather than crashing"""
+        mavlink = mavutil.mavlink
+        native = mavnative.NativeConnection(mavlink.MAVLink_message, mavlink.mavlink_map)
+        m = mavlink.MAVLink_heartbeat_message(1, 3, 81, 4, 5, 3)
+        m.type = 1000
+        self.assertRaises(Exception, native.pack, m, 0, 1, 1)
+
+
+@unittest.skipIf(mavnative is None, "mavnative is not built")
+class MavnativeParseTest(unittest.TestCase):
+
+    """
+    Class to test parsing with NativeConnection against the python parser
+    """
+
+    def stream(self):
+        """frames with some bad bytes between them"""
+        data = bytearray()
+        for (i, frame) in enumerate(logs.sample_frames(40)):
+            data.extend(frame)
+            if i % 7 == 0:
+                data.extend(b'\x00\x55\xff')
+        return data
+
+    def test_parse_all(self):
+        """parse_all() finds the same messages as the python parser, wherever the buffers are split"""
+        mavlink = mavutil.mavlink
+        data = self.stream()
+        mav = mavlink.MAVLink(None)
+        mav.robust_parsing = True
+        expected = [str(m) for m in mav.parse_buffer(data) if m.get_type() != 'BAD_DATA']
+        native = mavnative.NativeConnection(mavlink.MAVLink_message, mavlink.mavlink_map)
+        (msgs, consumed) = native.parse_all(data)
+        self.assertEqual([str(m) for m in msgs], expected)
+        self.assertEqual(consumed, len(data))
+        for step in [1, 5, 17, 100]:
+            mav = mavlink.MAVLink(None, use_native=True)
+            got = []
+            for ofs in range(0, len(data), step):
+                msgs = mav.parse_buffer(data[ofs:ofs+step])
+                if msgs is not None:
+                    got.extend([str(m) for m in msgs])
+            self.assertEqual(got, expected)
+
+
+    def test_dialects(self):
+        """connections for different dialects each use their own messages"""
+        from pymavlink.dialects.v10 import ardupilotmega, common
+        data = bytearray()
+        mav = ardupilotmega.MAVLink(None, 1, 1)
+        data.extend(mav.heartbeat_encode(1, 3, 81, 4, 5, 3).pack(mav))
+        data.extend(mav.ahrs_encode(0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7).pack(mav))
+        apm = mavnative.NativeConnection(ardupilotmega.MAVLink_message, ardupilotmega.mavlink_map)
+        com = mavnative.NativeConnection(common.MAVLink_message, common.mavlink_map)
+        (msgs, consumed) = apm.parse_all(bytearray(data))
+        self.assertEqual([m.get_type() for m in msgs], ['HEARTBEAT', 'AHRS'])
+        self.assertTrue(isinstance(msgs[0], ardupilotmega.MAVLink_heartbeat_message))
+        # AHRS isn't in the common dialect
+        (msgs, consumed) = com.parse_all(bytearray(data))
+        self.assertEqual([m.get_type() for m in msgs], ['HEARTBEAT'])
+        self.assertTrue(isinstance(msgs[0], common.MAVLink_heartbeat_message))
+        (msgs, consumed) = apm.parse_all(bytearray(data))
+        self.assertEqual([m.get_type() for m in msgs], ['HEARTBEAT', 'AHRS'])
+
+    def test_threads(self):
+        """connections parse correctly when used from several threads at once"""
+        mavlink = mavutil.mavlink
+        data = bytearray()
+        for i in range(20):
+            data.extend(self.stream())
+        (expected, consumed) = mavnative.NativeConnection(mavlink.MAVLink_message, mavlink.mavlink_map).parse_all(data)
+        expected = [str(m) for m in expected]
+        results = []
+        def parse():
+            native = mavnative.NativeConnection(mavlink.MAVLink_message, mavlink.mavlink_map)
+            for i in range(5):
+                (msgs, consumed) = native.parse_all(data)
+                results.append([str(m) for m in msgs] == expected and consumed == len(data))
+        threads = [threading.Thread(target=parse) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(results, [True] * 20)
+
+
+
+if __name__ == '__main__':
+    unittest.main()
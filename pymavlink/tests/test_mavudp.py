@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for reading UDP connections
+"""
+
+from __future__ import print_function
+import time, unittest
+
+from pymavlink import mavutil
+
+
+class MavudpTest(unittest.TestCase):
+
+    """
+    Class to test mavudp.recv_pending() and recv_msg()
+    """
+
+    def setUp(self):
+        self.gcs = mavutil.mavlink_connection('udpin:127.0.0.1:14905', source_system=255)
+        self.veh = mavutil.mavlink_connection('udpout:127.0.0.1:14905', source_system=1)
+
+    def tearDown(self):
+        self.gcs.close()
+        self.veh.close()
+
+    def send(self, count):
+        for i in range(count):
+            self.veh.mav.attitude_send(i, 0, 0, 0, 0, 0, 0)
+        time.sleep(0.1)
+
+    def test_recv_pending_limit(self):
+        """recv_pending() reads at most max_datagrams datagrams"""
+        self.send(200)
+        length = len(self.veh.mav.attitude_encode(0, 0, 0, 0, 0, 0, 0).pack(self.veh.mav))
+        self.assertEqual(len(self.gcs.recv_pending(10)), 10 * length)
+        self.assertEqual(len(self.gcs.recv_pending()), mavutil.UDP_MAX_PENDING * length)
+        self.assertEqual(len(self.gcs.recv_pending(1000)), (190 - mavutil.UDP_MAX_PENDING) * length)
+        self.assertEqual(len(self.gcs.recv_pending()), 0)
+
+    def test_recv_msg(self):
+        """recv_msg() returns every message in order"""
+        self.send(200)
+        times = []
+        while True:
+            m = self.gcs.recv_msg()
+            if m is None:
+                break
+            times.append(m.time_boot_ms)
+        self.assertEqual(times, list(range(200)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for encoding and decoding every message of a dialect
+"""
+
+from __future__ import print_function
+import unittest
+
+from pymavlink import mavutil
+from pymavlink.tests.logs import membuf
+
+
+def sample_message(cls, k):
+    """a message of class cls with distinct values in each field"""
+    vals = []
+    for name in cls.fieldnames:
+        j = cls.ordered_fieldnames.index(name)
+        t = chr(cls.native_format[j+1])
+        n = cls.array_lengths[j]
+        k += 1
+        if t == 'c':
+            v = ('s%u' % k).encode('ascii')
+        elif t in 'fd':
+            v = k * 0.5
+            if n > 1:
+                v = [v + i for i in range(n)]
+        else:
+            v = k % 100
+            if n > 1:
+                v = [(v + i) % 100 for i in range(n)]
+        vals.append(v)
+    return cls(*vals)
+
+
+class MessagesTest(unittest.TestCase):
+
+    """
+    Class to test the generated message classes
+    """
+
+    def round_trip(self, mavlink):
+        """check every message type of a dialect decodes to the values it was sent with"""
+        out = membuf()
+        mav = mavlink.MAVLink(out, 1, 1)
+        sent = []
+        for (msgid, cls) in sorted(mavlink.mavlink_map.items()):
+            m = sample_message(cls, msgid)
+            mav.send(m)
+            sent.append(m)
+        got = mavlink.MAVLink(None).parse_buffer(out.buf)
+        self.assertEqual(len(got), len(sent))
+        for (m, m2) in zip(sent, got):
+            self.assertEqual(m2.get_type(), m.get_type())
+            for name in m.get_fieldnames():
+                v = getattr(m2, name)
+                if isinstance(v, bytes):
+                    # only str fields are NUL terminated on decode
+                    v = v.rstrip(b'\0')
+                self.assertEqual(v, getattr(m, name), '%s.%s' % (m.get_type(), name))
+            self.assertEqual(m2.get_msgbuf(), m.get_msgbuf())
+
+    def test_round_trip(self):
+        """the messages of the default dialect survive encoding and decoding"""
+        self.round_trip(mavutil.mavlink)
+
+    def test_arrays(self):
+        """messages with long arrays survive encoding and decoding"""
+        try:
+            from pymavlink.dialects.v10 import python_array_test
+        except ImportError:
+            self.skipTest("python_array_test dialect has not been generated")
+        self.round_trip(python_array_test)
+
+    def test_slots(self):
+        """messages and headers have slots instead of a __dict__"""
+        mavlink = mavutil.mavlink
+        for (msgid, cls) in mavlink.mavlink_map.items():
+            m = sample_message(cls, msgid)
+            self.assertFalse(hasattr(m._header, '__dict__'))
+            # fields that clash with class attributes go in a __dict__
+            if '__dict__' in cls.__slots__:
+                continue
+            self.assertFalse(hasattr(m, '__dict__'), m.get_type())
+            self.assertRaises(AttributeError, setattr, m, 'not_a_field', 1)
+        m = mavlink.MAVLink_named_value_float_message(10, b'speed', 1.5)
+        self.assertEqual(m.name, b'speed')
+        self.assertEqual(m.get_type(), 'NAMED_VALUE_FLOAT')
+        buf = m.pack(mavlink.MAVLink(None))
+        m2 = mavlink.MAVLink(None).parse_buffer(buf)[0]
+        self.assertEqual(m2.name.rstrip(b'\0'), b'speed')
+
+
+if __name__ == '__main__':
+    unittest.main()
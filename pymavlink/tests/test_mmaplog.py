@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for the mmap tlog reader
+"""
+
+from __future__ import print_function
+import os, shutil, tempfile, unittest
+
+from pymavlink import mavutil
+from pymavlink.tests import logs
+
+
+class MmapLogTest(unittest.TestCase):
+
+    """
+    Class to test mavmmaplog against mavlogfile
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'test.tlog')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def read_all(self, mlog):
+        """Read every message in a log, with its timestamp and the file offset after it"""
+        ret = []
+        while True:
+            m = mlog.recv_msg()
+            if m is None:
+                break
+            ret.append((m.get_type(), str(m), m._timestamp, mlog.f.tell()))
+        return ret
+
+    def test_connection(self):
+        """mavlink_connection() only maps tlogs that are read"""
+        logs.write_tlog(self.filename, 10)
+        mlog = mavutil.mavlink_connection(self.filename)
+        self.assertTrue(isinstance(mlog, mavutil.mavmmaplog))
+        self.assertRaises(RuntimeError, mlog.write, b'x')
+        mlog.close()
+        mlog = mavutil.mavlink_connection(self.filename, write=True)
+        self.assertFalse(isinstance(mlog, mavutil.mavmmaplog))
+        mlog.close()
+        empty = os.path.join(self.tmpdir, 'empty.tlog')
+        open(empty, 'wb').close()
+        mlog = mavutil.mavlink_connection(empty)
+        self.assertFalse(isinstance(mlog, mavutil.mavmmaplog))
+        self.assertIsNone(mlog.recv_msg())
+        mlog.close()
+
+    def test_same_as_mavlogfile(self):
+        """mavmmaplog reads the same messages, timestamps and offsets as mavlogfile"""
+        for seed in range(5):
+            logs.write_tlog(self.filename, 200, junk=20 * seed, seed=seed)
+            mlog = mavutil.mavlogfile(self.filename)
+            expected = self.read_all(mlog)
+            percent = mlog.percent
+            mlog.close()
+            mlog = mavutil.mavmmaplog(self.filename)
+            got = self.read_all(mlog)
+            self.assertEqual(mlog.percent, percent)
+            mlog.close()
+            self.assertEqual(got, expected)
+
+    def test_seek(self):
+        """f.tell() and f.seek() can be used to go back in the log"""
+        logs.write_tlog(self.filename, 50)
+        mlog = mavutil.mavmmaplog(self.filename)
+        first = self.read_all(mlog)
+        self.assertEqual(mlog.f.tell(), os.path.getsize(self.filename))
+        mlog.f.seek(0)
+        self.assertEqual(self.read_all(mlog), first)
+        mlog.f.seek(first[99][3])
+        self.assertEqual(self.read_all(mlog), first[100:])
+        mlog.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for the message ID prefilter
+"""
+
+from __future__ import print_function
+import os, shutil, tempfile, unittest
+
+from pymavlink import mavutil
+from pymavlink.tests import logs
+
+
+class MsgidFilterTest(unittest.TestCase):
+
+    """
+    Class to test set_msgid_filter()
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def read_tlog(self, filename, include_types=None, cls=None):
+        """Read the ATTITUDE messages and count the BAD_DATA in a tlog"""
+        if cls is None:
+            mlog = mavutil.mavlink_connection(filename, include_types=include_types)
+        else:
+            mlog = cls(filename)
+            if include_types is not None:
+                mlog.set_msgid_filter(include_types)
+        ret = []
+        while True:
+            m = mlog.recv_match(type='ATTITUDE')
+            if m is None:
+                break
+            ret.append((m.time_boot_ms, m._timestamp))
+        mlog.close()
+        return ret
+
+    def test_parse_buffer(self):
+        """Only the included types are decoded, the others are counted"""
+        mav = mavutil.mavlink.MAVLink(None)
+        mav.set_msgid_filter(['ATTITUDE', 'VFR_HUD'])
+        data = bytearray()
+        for frame in logs.sample_frames(10):
+            data.extend(frame)
+        msgs = mav.parse_buffer(data)
+        self.assertEqual(sorted(set([m.get_type() for m in msgs])), ['ATTITUDE', 'VFR_HUD'])
+        self.assertEqual(len(msgs), 20)
+        self.assertEqual(mav.total_packets_filtered, 30)
+
+    def test_tlog(self):
+        """A filtered tlog gives the same messages as an unfiltered one"""
+        filename = os.path.join(self.tmpdir, 'test.tlog')
+        logs.write_tlog(filename, 200)
+        unfiltered = self.read_tlog(filename)
+        self.assertEqual(len(unfiltered), 200)
+        self.assertEqual(self.read_tlog(filename, ['ATTITUDE']), unfiltered)
+
+    def test_tlog_junk(self):
+        """Timestamps stay in step through junk when frames are filtered"""
+        filename = os.path.join(self.tmpdir, 'junk.tlog')
+        for seed in range(5):
+            logs.write_tlog(filename, 200, junk=30, seed=seed)
+            for cls in (mavutil.mavlogfile, mavutil.mavmmaplog):
+                unfiltered = self.read_tlog(filename, cls=cls)
+                self.assertEqual(self.read_tlog(filename, ['ATTITUDE'], cls=cls), unfiltered)
+
+
+if __name__ == '__main__':
+    unittest.main()
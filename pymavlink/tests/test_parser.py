@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for the generated MAVLink parser
+"""
+
+from __future__ import print_function
+import random, unittest
+
+from pymavlink import mavutil
+from pymavlink.tests import logs
+
+
+class ParserTest(unittest.TestCase):
+
+    """
+    Class to test parse_char() and parse_buffer()
+    """
+
+    def stream(self, seed, junk):
+        """some frames with runs of the junk bytes between them"""
+        r = random.Random(seed)
+        data = bytearray()
+        for frame in logs.sample_frames(50):
+            data.extend(frame)
+            if r.random() < 0.2:
+                data.extend(bytearray([r.choice(junk) for i in range(r.randrange(1, 12))]))
+        return data
+
+    def parse_chunks(self, data, sizes):
+        """parse data given to parse_char() in chunks of the given sizes, as mavfile does"""
+        mav = mavutil.mavlink.MAVLink(None)
+        mav.robust_parsing = True
+        ret = []
+        ofs = 0
+        while ofs < len(data):
+            n = sizes(mav)
+            m = mav.parse_char(data[ofs:ofs+n])
+            ofs += n
+            while m is not None:
+                ret.append(m)
+                m = mav.parse_char(b'')
+        # the receive buffer is compacted as it is consumed
+        self.assertTrue(len(mav.buf) < 2 * mav.buf_len() + 300)
+        return ([str(m) for m in ret], mav.buf_len())
+
+    def test_chunks(self):
+        """the same messages are parsed whatever the chunk size"""
+        for seed in range(6):
+            # a junk frame marker swallows the frames after it
+            if seed % 2 == 0:
+                data = self.stream(seed, [0x55, 0, 0xff])
+            else:
+                data = self.stream(seed, [0xfe, 0x55, 0, 0xff])
+            r = random.Random(seed)
+            mav = mavutil.mavlink.MAVLink(None)
+            mav.robust_parsing = True
+            expected = ([str(m) for m in mav.parse_buffer(data)], mav.buf_len())
+            if seed % 2 == 0:
+                self.assertEqual(len([m for m in expected[0] if not m.startswith('BAD_DATA')]), 250)
+                self.assertEqual(expected[1], 0)
+            self.assertEqual(self.parse_chunks(data, lambda mav: mav.bytes_needed()), expected)
+            self.assertEqual(self.parse_chunks(data, lambda mav: 1), expected)
+            self.assertEqual(self.parse_chunks(data, lambda mav: r.randrange(1, 300)), expected)
+            self.assertEqual(self.parse_chunks(data, lambda mav: len(data)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
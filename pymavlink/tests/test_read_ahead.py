@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for the read-ahead buffer used by stream connections
+"""
+
+from __future__ import print_function
+import socket, time, unittest
+
+from pymavlink import mavutil
+from pymavlink.tests import logs
+
+
+class ReadAheadTest(unittest.TestCase):
+
+    """
+    Class to test recv(), select() and recv_msg() on a TCP connection
+    """
+
+    def setUp(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind(('127.0.0.1', 14906))
+        server.listen(1)
+        self.conn = mavutil.mavlink_connection('tcp:127.0.0.1:14906')
+        (self.peer, addr) = server.accept()
+        server.close()
+        self.reads = []
+        read_port = self.conn.read_port
+        def counted(n):
+            self.reads.append(n)
+            return read_port(n)
+        self.conn.read_port = counted
+
+    def tearDown(self):
+        self.peer.close()
+        self.conn.close()
+
+    def send(self, frames):
+        data = b''.join([bytes(f) for f in frames])
+        self.peer.sendall(data)
+        time.sleep(0.1)
+        return data
+
+    def test_recv(self):
+        """recv(n) is a single read of up to n bytes"""
+        data = self.send(logs.sample_frames(2))
+        self.assertEqual(bytes(self.conn.recv(10)), data[:10])
+        self.assertEqual(self.reads, [10])
+        self.assertEqual(bytes(self.conn.recv(10000)), data[10:])
+        self.assertEqual(self.reads, [10, 10000])
+
+    def test_select(self):
+        """select() doesn't wait when recv_msg() has read ahead"""
+        frames = logs.sample_frames(4)
+        data = self.send(frames)
+        m = self.conn.recv_msg()
+        self.assertEqual(bytes(m.get_msgbuf()), bytes(frames[0]))
+        self.assertEqual(len(self.reads), 1)
+        self.assertTrue(self.conn.select(5))
+        # the bytes recv_msg() read ahead are returned by recv()
+        self.assertEqual(bytes(self.conn.recv(10000)), data[len(frames[0]):])
+        self.assertEqual(len(self.reads), 1)
+        self.assertFalse(self.conn.select(0))
+
+    def test_recv_match(self):
+        """recv_match() reads every message with a few large reads"""
+        frames = logs.sample_frames(200)
+        self.send(frames)
+        got = []
+        while len(got) < len(frames):
+            m = self.conn.recv_match(blocking=True, timeout=5)
+            if m is None:
+                break
+            got.append(bytes(m.get_msgbuf()))
+        self.assertEqual(got, [bytes(f) for f in frames])
+        self.assertTrue(len(self.reads) < 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
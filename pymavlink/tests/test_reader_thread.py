@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for the mavfile reader thread
+"""
+
+from __future__ import print_function
+import time, unittest
+
+from pymavlink import mavutil
+
+
+class ReaderThreadTest(unittest.TestCase):
+
+    """
+    Class to test start_reader() and recv_match() on a reader thread
+    """
+
+    def setUp(self):
+        self.gcs = mavutil.mavlink_connection('udpin:127.0.0.1:14904', source_system=255)
+        self.veh = mavutil.mavlink_connection('udpout:127.0.0.1:14904', source_system=1)
+
+    def tearDown(self):
+        self.gcs.stop_reader()
+        self.gcs.close()
+        self.veh.close()
+
+    def wait_queued(self, count):
+        '''wait for the reader thread to queue count messages'''
+        end_time = time.time() + 5
+        while len(self.gcs.reader_queue) + self.gcs.reader_dropped < count and time.time() < end_time:
+            time.sleep(0.01)
+        self.assertEqual(len(self.gcs.reader_queue) + self.gcs.reader_dropped, count)
+
+    def send_attitude_heartbeats(self, count):
+        '''send count pairs of ATTITUDE and HEARTBEAT, numbered by
+        ATTITUDE.roll and HEARTBEAT.custom_mode'''
+        for i in range(count):
+            self.veh.mav.attitude_send(i, i, 0, 0, 0, 0, 0)
+            self.veh.mav.heartbeat_send(1, 3, 0, i, 0)
+
+    def test_param_condition(self):
+        """a condition sees the messages as they were when each queued message arrived"""
+        self.gcs.start_reader()
+        for i in range(10):
+            self.veh.mav.param_value_send(b'PARAM%u' % i, float(i), 9, 10, i)
+        for i in range(10):
+            self.veh.mav.param_value_send(b'OTHER%u' % i, float(i), 9, 10, i)
+        self.wait_queued(20)
+        m = self.gcs.recv_match(type='PARAM_VALUE', condition='PARAM_VALUE.param_id.startswith(b"PARAM9")')
+        self.assertEqual(m.param_index, 9)
+        self.assertEqual(len(self.gcs.reader_queue), 19)
+
+    def test_other_type_condition(self):
+        """taking messages out of the middle of the queue keeps the state of the rest"""
+        self.gcs.start_reader()
+        self.send_attitude_heartbeats(5)
+        self.wait_queued(10)
+        m = self.gcs.recv_match(type='HEARTBEAT', condition='ATTITUDE.roll==3')
+        self.assertEqual(m.custom_mode, 3)
+        m = self.gcs.recv_match(type='HEARTBEAT', condition='ATTITUDE.roll==1')
+        self.assertEqual(m.custom_mode, 1)
+        m = self.gcs.recv_match(type='ATTITUDE', condition='HEARTBEAT.custom_mode==3')
+        self.assertEqual(m.roll, 4)
+        m = self.gcs.recv_match(type='HEARTBEAT', condition='ATTITUDE.roll==4')
+        self.assertEqual(m.custom_mode, 4)
+        m = self.gcs.recv_match(type='HEARTBEAT', condition='ATTITUDE.roll==2')
+        self.assertEqual(m.custom_mode, 2)
+        self.assertIsNone(self.gcs.recv_match(type='HEARTBEAT', condition='ATTITUDE.roll==4'))
+        rolls = []
+        while True:
+            m = self.gcs.recv_msg()
+            if m is None:
+                break
+            rolls.append(m.roll if m.get_type() == 'ATTITUDE' else -1)
+        self.assertEqual(rolls, [0, -1, 1, 2, 3])
+
+    def test_queue_size(self):
+        """the oldest messages are dropped once the queue is full"""
+        self.gcs.start_reader(queue_size=4)
+        self.send_attitude_heartbeats(5)
+        self.wait_queued(10)
+        self.assertEqual(self.gcs.reader_dropped, 6)
+        m = self.gcs.recv_match(type='HEARTBEAT', condition='ATTITUDE.roll==3')
+        self.assertEqual(m.custom_mode, 3)
+        self.assertIsNone(self.gcs.recv_match(type='HEARTBEAT', condition='ATTITUDE.roll==2'))
+
+    def test_blocking(self):
+        """a blocking recv_match() is handed the message it waits for"""
+        self.gcs.start_reader()
+        self.veh.mav.heartbeat_send(1, 3, 0, 7, 0)
+        m = self.gcs.recv_match(type='HEARTBEAT', blocking=True, timeout=5)
+        self.assertEqual(m.custom_mode, 7)
+        self.assertIsNone(self.gcs.recv_match(type='HEARTBEAT', blocking=True, timeout=0.1))
+
+    def test_reader_error(self):
+        """an exception in the reader thread is raised to the caller"""
+        def recv_msg():
+            raise ValueError('reader failed')
+        self.gcs.recv_msg = recv_msg
+        self.gcs.start_reader()
+        self.assertRaises(ValueError, self.gcs.recv_match, type='HEARTBEAT', blocking=True, timeout=5)
+        self.assertRaises(ValueError, self.gcs.recv_match, type='HEARTBEAT')
+        self.assertRaises(ValueError, self.gcs.recv_msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
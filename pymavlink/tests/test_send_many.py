@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for batched message encoding
+"""
+
+from __future__ import print_function
+import socket, time, unittest
+
+from pymavlink import mavutil
+
+
+class writes(object):
+    '''a file-like object that records each write'''
+    def __init__(self):
+        self.writes = []
+
+    def write(self, buf):
+        self.writes.append(bytes(buf))
+
+
+class SendManyTest(unittest.TestCase):
+
+    """
+    Class to test MAVLink.send_many() and pack_into()
+    """
+
+    def messages(self, count):
+        mavlink = mavutil.mavlink
+        msgs = []
+        for i in range(count):
+            msgs.append(mavlink.MAVLink_attitude_message(i, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6))
+            msgs.append(mavlink.MAVLink_statustext_message(6, b'message %u' % i))
+        return msgs
+
+    def test_same_as_send(self):
+        """send_many() writes the same bytes as send() and counts them"""
+        msgs = self.messages(100)
+        one = writes()
+        mav = mavutil.mavlink.MAVLink(one, 1, 1)
+        for m in msgs:
+            mav.send(m)
+        many = writes()
+        mav2 = mavutil.mavlink.MAVLink(many, 1, 1)
+        mav2.send_many(msgs)
+        self.assertEqual(b''.join(many.writes), b''.join(one.writes))
+        self.assertEqual(mav2.seq, mav.seq)
+        self.assertEqual(mav2.total_packets_sent, len(msgs))
+        self.assertEqual(mav2.total_bytes_sent, mav.total_bytes_sent)
+
+    def test_split(self):
+        """Writes are at most max_bytes and hold whole frames"""
+        msgs = self.messages(100)
+        out = writes()
+        mav = mavutil.mavlink.MAVLink(out, 1, 1)
+        mav.send_many(msgs, max_bytes=1000)
+        self.assertTrue(len(out.writes) > 1)
+        count = 0
+        for buf in out.writes:
+            self.assertTrue(len(buf) <= 1000)
+            parsed = mavutil.mavlink.MAVLink(None).parse_buffer(buf)
+            self.assertEqual(sum([len(m.get_msgbuf()) for m in parsed]), len(buf))
+            count += len(parsed)
+        self.assertEqual(count, len(msgs))
+        out.writes = []
+        mav.send_many(msgs, max_bytes=None)
+        self.assertEqual(len(out.writes), 1)
+
+    def test_empty(self):
+        """Nothing is written for an empty list"""
+        out = writes()
+        mav = mavutil.mavlink.MAVLink(out, 1, 1)
+        mav.send_many([])
+        self.assertEqual(out.writes, [])
+        self.assertEqual(mav.seq, 0)
+
+    def test_udp(self):
+        """A batch bigger than a datagram gets through UDP"""
+        rx = mavutil.mavlink_connection('udpin:127.0.0.1:14901')
+        tx = mavutil.mavlink_connection('udpout:127.0.0.1:14901')
+        try:
+            msgs = self.messages(1000)
+            tx.mav.send_many(msgs)
+            got = 0
+            end = time.time() + 2
+            while got < len(msgs) and time.time() < end:
+                m = rx.recv_match(blocking=True, timeout=0.1)
+                if m is not None:
+                    got += 1
+            self.assertEqual(got, len(msgs))
+        finally:
+            rx.close()
+            tx.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
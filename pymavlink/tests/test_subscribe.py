@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for per-type message subscriptions
+"""
+
+from __future__ import print_function
+import os, shutil, tempfile, unittest
+
+from pymavlink import mavutil
+from pymavlink.tests import logs
+
+
+class SubscribeTest(unittest.TestCase):
+
+    """
+    Class to test mavfile.subscribe() and the built in handlers
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'test.tlog')
+        logs.write_tlog(self.filename, 100)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_subscribe(self):
+        """callbacks are only called for the types they subscribed to"""
+        mlog = mavutil.mavlink_connection(self.filename)
+        seen = []
+        def callback(mav, msg):
+            self.assertTrue(mav is mlog)
+            seen.append(msg.get_type())
+        hooked = []
+        mlog.message_hooks.append(lambda mav, msg: hooked.append(msg.get_type()))
+        mlog.subscribe('ATTITUDE', callback)
+        mlog.subscribe(['HEARTBEAT', 'VFR_HUD'], callback)
+        for i in range(50):
+            mlog.recv_msg()
+        mlog.unsubscribe(['ATTITUDE', 'VFR_HUD'], callback)
+        mlog.unsubscribe('ATTITUDE', callback)
+        while mlog.recv_msg() is not None:
+            pass
+        mlog.close()
+        self.assertEqual(len(hooked), 500)
+        self.assertEqual(seen.count('ATTITUDE'), 10)
+        self.assertEqual(seen.count('VFR_HUD'), 10)
+        self.assertEqual(seen.count('HEARTBEAT'), 100)
+        self.assertEqual(len(seen), 120)
+
+    def test_builtin_handlers(self):
+        """the state kept from HEARTBEAT and GPS_RAW_INT is still updated"""
+        mlog = mavutil.mavlink_connection(self.filename)
+        while mlog.recv_msg() is not None:
+            pass
+        mlog.close()
+        self.assertEqual(mlog.target_system, 1)
+        self.assertEqual(mlog.messages['HOME'].get_type(), 'GPS_RAW_INT')
+        self.assertEqual(mlog.messages['HOME'].time_usec, 0)
+        self.assertNotEqual(mlog.flightmode, 'UNKNOWN')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+"""
+Unit tests for reading tlogs into numpy columns
+"""
+
+from __future__ import print_function
+import os, shutil, tempfile, unittest
+
+from pymavlink import mavutil
+from pymavlink.tests import logs
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TlogColumnsTest(unittest.TestCase):
+
+    """
+    Class to test tlog_to_columns() against mavlogfile
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'test.tlog')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def read_messages(self, types):
+        """the messages of the given types read with mavlogfile, by type"""
+        mlog = mavutil.mavlogfile(self.filename)
+        ret = {}
+        while True:
+            m = mlog.recv_match(type=types)
+            if m is None:
+                break
+            ret.setdefault(m.get_type(), []).append(m)
+        mlog.close()
+        return ret
+
+    def check(self, types):
+        msgs = self.read_messages(types)
+        cols = mavutil.tlog_to_columns(self.filename, types=types)
+        self.assertEqual(sorted(cols.keys()), sorted(msgs.keys()))
+        for type in cols:
+            self.assertEqual(sorted(cols[type].keys()), sorted(msgs[type][0].get_fieldnames() + ['_timestamp']))
+            for name in msgs[type][0].get_fieldnames():
+                numpy.testing.assert_array_equal(cols[type][name], [getattr(m, name) for m in msgs[type]])
+            numpy.testing.assert_allclose(cols[type]['_timestamp'], [m._timestamp for m in msgs[type]])
+        return cols
+
+    def test_columns(self):
+        """the columns hold the same values as the decoded messages"""
+        logs.write_tlog(self.filename, 200)
+        cols = self.check(['ATTITUDE', 'GPS_RAW_INT', 'SYS_STATUS'])
+        self.assertEqual(len(cols['ATTITUDE']['roll']), 200)
+        self.assertEqual(list(mavutil.tlog_to_columns(self.filename, types=['ATTITUDE']).keys()), ['ATTITUDE'])
+
+    def test_bad_crc(self):
+        """frames with a bad CRC are dropped"""
+        logs.write_tlog(self.filename, 200)
+        data = bytearray(open(self.filename, 'rb').read())
+        # corrupt the roll of the 11th ATTITUDE, the 52nd frame
+        frames = logs.sample_frames(200)
+        ofs = sum([8 + len(f) for f in frames[:51]])
+        self.assertEqual(frames[51][5], mavutil.mavlink.MAVLINK_MSG_ID_ATTITUDE)
+        data[ofs + 8 + 10] ^= 0xff
+        f = open(self.filename, 'wb')
+        f.write(data)
+        f.close()
+        cols = self.check(['ATTITUDE', 'VFR_HUD'])
+        self.assertEqual(len(cols['ATTITUDE']['roll']), 199)
+        self.assertEqual(len(cols['VFR_HUD']['alt']), 200)
+        cols = mavutil.tlog_to_columns(self.filename, types=['ATTITUDE'], check_crc=False)
+        self.assertEqual(len(cols['ATTITUDE']['roll']), 200)
+
+if __name__ == '__main__':
+    unittest.main()
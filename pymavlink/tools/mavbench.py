@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+
+'''
+benchmark MAVLink encoding and decoding speed for one or more dialects
+'''
+
+import sys, time, threading
+
+from argparse import ArgumentParser
+parser = ArgumentParser(description=__doc__)
+parser.add_argument("--count", type=int, default=200, help="number of times to send each message type")
+parser.add_argument("--native", action='store_true', help="use mavnative for parsing")
+parser.add_argument("--threads", type=int, default=0, help="also time parsing on this many connections at once, one thread each")
+parser.add_argument("dialects", metavar="DIALECT", nargs="*", default=["python_array_test", "ardupilotmega"])
+args = parser.parse_args()
+
+from pymavlink import mavutil
+
+class membuf(object):
+    '''a file-like object that keeps everything written to it'''
+    def __init__(self):
+        self.buf = bytearray()
+
+    def write(self, buf):
+        self.buf.extend(buf)
+
+def sample_value(type_char, array_length, i):
+    '''make up a value for a field that fits its type'''
+    if type_char == 'c':
+        return b'abcdefgh'[:max(array_length, 1)]
+    if type_char in 'fd':
+        v = (i+1) * 0.5
+    else:
+        v = (i+1) % 100
+    if array_length > 1:
+        return [v] * array_length
+    return v
+
+def sample_messages(mavlink):
+    '''create one message of every type in a dialect'''
+    ret = []
+    for msgid in sorted(mavlink.mavlink_map.keys()):
+        cls = mavlink.mavlink_map[msgid]
+        values = {}
+        for i in range(len(cls.ordered_fieldnames)):
+            type_char = chr(cls.native_format[1+i])
+            values[cls.ordered_fieldnames[i]] = sample_value(type_char, cls.array_lengths[i], i)
+        ret.append(cls(*[values[name] for name in cls.fieldnames]))
+    return ret
+
+def rate(count, t):
+    if t <= 0:
+        return 0
+    return count / t
+
+def parse_chunks(mavlink, data, chunk_size=1400):
+    '''parse data in datagram sized chunks on a new connection'''
+    mav = mavlink.MAVLink(None, use_native=args.native)
+    for ofs in range(0, len(data), chunk_size):
+        mav.parse_buffer(data[ofs:ofs+chunk_size])
+
+def bench_threads(mavlink, data, total):
+    '''time parsing the same data on several connections, each in its own
+    thread, compared with doing the same work in one thread'''
+    t0 = time.time()
+    for i in range(args.threads):
+        parse_chunks(mavlink, data)
+    t_serial = time.time() - t0
+
+    threads = [threading.Thread(target=parse_chunks, args=(mavlink, data)) for i in range(args.threads)]
+    t0 = time.time()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    t_threaded = time.time() - t0
+
+    print("%-20s %u connections: one thread %8.0f msg/s  %u threads %8.0f msg/s" % (
+        '', args.threads, rate(total*args.threads, t_serial), args.threads, rate(total*args.threads, t_threaded)))
+
+def bench_dialect(dialect):
+    '''time encoding, parsing and decoding for all messages in a dialect'''
+    mavutil.set_dialect(dialect)
+    mavlink = mavutil.mavlink
+    msgs = sample_messages(mavlink)
+
+    out = membuf()
+    mav = mavlink.MAVLink(out, srcSystem=1, srcComponent=1, use_native=args.native)
+    t0 = time.time()
+    for i in range(args.count):
+        for m in msgs:
+            mav.send(m)
+    t_encode = time.time() - t0
+    total = args.count * len(msgs)
+
+    mav = mavlink.MAVLink(membuf(), srcSystem=1, srcComponent=1)
+    t0 = time.time()
+    for i in range(args.count):
+        mav.send_many(msgs)
+    t_send_many = time.time() - t0
+
+    data = bytes(out.buf)
+    mav = mavlink.MAVLink(None, use_native=args.native)
+    t0 = time.time()
+    parsed = mav.parse_buffer(data)
+    t_parse = time.time() - t0
+    if parsed is None or len(parsed) != total:
+        print("%s: parsed %u of %u messages" % (dialect, len(parsed or []), total))
+
+    frames = [m.get_msgbuf() for m in msgs]
+    t0 = time.time()
+    for i in range(args.count):
+        for f in frames:
+            mav.decode(f)
+    t_decode = time.time() - t0
+
+    print("%-20s %4u types %8u bytes  encode %8.0f msg/s  send_many %8.0f msg/s  parse %8.0f msg/s  decode %8.0f msg/s" % (
+        dialect, len(msgs), len(data),
+        rate(total, t_encode), rate(total, t_send_many), rate(total, t_parse), rate(total, t_decode)))
+
+    if args.threads:
+        bench_threads(mavlink, data, total)
+
+for dialect in args.dialects:
+    bench_dialect(dialect)
@@ -35,25 +35,35 @@ import inspect
 from pymavlink import mavutil
 
 
+types = args.types
+if types is not None:
+    types = types.split(',')
+
+nottypes = args.nottypes
+if nottypes is not None:
+    nottypes = nottypes.split(',')
+
+# messages we don't want can be skipped without decoding them, unless
+# they are needed for evaluating a condition or preserving parameters
+include_types = None
+exclude_types = None
+if args.condition is None and not args.parms:
+    include_types = types
+    exclude_types = nottypes
+
 filename = args.log
 mlog = mavutil.mavlink_connection(filename, planner_format=args.planner,
                                   notimestamps=args.notimestamps,
                                   robust_parsing=args.robust,
                                   dialect=args.dialect,
-                                  zero_time_base=args.zero_time_base)
+                                  zero_time_base=args.zero_time_base,
+                                  include_types=include_types,
+                                  exclude_types=exclude_types)
 
 output = None
 if args.output:
     output = open(args.output, mode='wb')
 
-types = args.types
-if types is not None:
-    types = types.split(',')
-
-nottypes = args.nottypes
-if nottypes is not None:
-    nottypes = nottypes.split(',')
-
 ext = os.path.splitext(filename)[1]
 isbin = ext in ['.bin', '.BIN']
 islog = ext in ['.log', '.LOG']